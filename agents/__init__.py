@@ -1,29 +0,0 @@
-# agents/linkedin_agent.py
-from core.base_agent import BaseSocialAgent
-
-
-class LinkedInAgent(BaseSocialAgent):
-    def __init__(self):
-        super().__init__("linkedin")
-        self.timeout = 30
-        self.rate_limit = 5  # Conservative for LinkedIn
-
-    async def search_by_email(
-        self, email: str, context: Dict = None
-    ) -> List[ProfileData]:
-        # Implementation for LinkedIn email search
-        pass
-
-    async def search_by_phone(
-        self, phone: str, context: Dict = None
-    ) -> List[ProfileData]:
-        # Implementation for LinkedIn phone search
-        pass
-
-
-# Similar structure needed for ALL 25+ platforms:
-# - agents/github_agent.py
-# - agents/twitter_agent.py
-# - agents/facebook_agent.py
-# - agents/telegram_agent.py
-# - ... etc for all platforms
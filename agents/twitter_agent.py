@@ -6,9 +6,11 @@ Twitter profile discovery and social activity analysis
 import json
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from core.base_agent import BaseSocialAgent
 from core.schemas import PlatformType, ProfileData
 
@@ -154,8 +156,10 @@ class TwitterAgent(BaseSocialAgent):
         profiles = []
 
         try:
-            for user_data in response_data.get("data", []):
-                profile = self._parse_twitter_user(user_data, identifier)
+            users = response_data.get("data", [])
+            scores = self._calculate_twitter_confidence_batch(users)
+            for user_data, score in zip(users, scores.tolist()):
+                profile = self._parse_twitter_user(user_data, identifier, score)
                 if profile:
                     profiles.append(profile)
 
@@ -165,10 +169,13 @@ class TwitterAgent(BaseSocialAgent):
         return profiles
 
     def _parse_twitter_user(
-        self, user_data: Dict, identifier: str
+        self, user_data: Dict, identifier: str, confidence: Optional[float] = None
     ) -> Optional[ProfileData]:
         """Parse individual Twitter user data"""
         try:
+            if confidence is None:
+                confidence = self._calculate_twitter_confidence(user_data)
+
             # Basic profile information
             profile = ProfileData(
                 platform=PlatformType.TWITTER,
@@ -184,7 +191,7 @@ class TwitterAgent(BaseSocialAgent):
                 profile_picture=user_data.get("profile_image_url"),
                 last_activity=self._parse_twitter_activity(user_data),
                 bio=user_data.get("description"),
-                confidence=self._calculate_twitter_confidence(user_data),
+                confidence=confidence,
                 is_verified=user_data.get("verified", False),
                 raw_data=user_data,
             )
@@ -226,67 +233,108 @@ class TwitterAgent(BaseSocialAgent):
 
         return None
 
+    def _twitter_confidence_inputs(self, user_data: Dict, now: datetime) -> tuple:
+        """(verified, followers, tweets, filled fields, account age in days or NaN)"""
+        metrics = user_data.get("public_metrics") or {}
+        age_days = np.nan
+        created_at = user_data.get("created_at")
+        if created_at:
+            try:
+                created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+                if created.tzinfo is None:
+                    created = created.replace(tzinfo=timezone.utc)
+                age_days = (now - created).days
+            except ValueError:
+                pass
+        filled = (
+            bool(user_data.get("description"))
+            + bool(user_data.get("location"))
+            + bool(user_data.get("url"))
+        )
+        return (
+            bool(user_data.get("verified")),
+            metrics.get("followers_count", 0),
+            metrics.get("tweet_count", 0),
+            filled,
+            age_days,
+        )
+
     def _calculate_twitter_confidence(self, user_data: Dict) -> float:
         """Calculate confidence score for Twitter profile"""
-        confidence_factors = []
-
-        # Account verification
-        if user_data.get("verified"):
-            confidence_factors.append(0.9)
+        verified, followers, tweets, filled, age_days = self._twitter_confidence_inputs(
+            user_data, datetime.now(timezone.utc)
+        )
 
-        # Follower count
-        metrics = user_data.get("public_metrics", {})
-        followers = metrics.get("followers_count", 0)
+        # Mean of the factors that apply; completeness always counts
+        factors = [filled / 3 * 0.6]
+        if verified:
+            factors.append(0.9)
         if followers > 1000:
-            confidence_factors.append(0.8)
+            factors.append(0.8)
         elif followers > 100:
-            confidence_factors.append(0.6)
+            factors.append(0.6)
         elif followers > 10:
-            confidence_factors.append(0.4)
-
-        # Tweet count
-        tweet_count = metrics.get("tweet_count", 0)
-        if tweet_count > 1000:
-            confidence_factors.append(0.7)
-        elif tweet_count > 100:
-            confidence_factors.append(0.5)
-        elif tweet_count > 10:
-            confidence_factors.append(0.3)
-
-        # Profile completeness
-        filled_fields = sum(
-            1
-            for field in [
-                user_data.get("description"),
-                user_data.get("location"),
-                user_data.get("url"),
-            ]
-            if field
-        )
-
-        completeness_score = filled_fields / 3
-        confidence_factors.append(completeness_score * 0.6)
-
-        # Account age
-        created_at = user_data.get("created_at")
-        if created_at:
-            try:
-                account_age = (
-                    datetime.now()
-                    - datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                ).days
-                if account_age > 365:
-                    confidence_factors.append(0.7)
-                elif account_age > 180:
-                    confidence_factors.append(0.5)
-            except Exception:
-                pass
+            factors.append(0.4)
+        if tweets > 1000:
+            factors.append(0.7)
+        elif tweets > 100:
+            factors.append(0.5)
+        elif tweets > 10:
+            factors.append(0.3)
+        if age_days > 365:
+            factors.append(0.7)
+        elif age_days > 180:
+            factors.append(0.5)
+
+        return sum(factors) / len(factors)
+
+    def _calculate_twitter_confidence_batch(self, users: List[Dict]) -> np.ndarray:
+        """
+        Calculate confidence scores for a batch of Twitter profiles
 
-        return (
-            sum(confidence_factors) / len(confidence_factors)
-            if confidence_factors
-            else 0.3
+        Each score is the mean of the factors that apply to the profile, as
+        in the per-profile rules, evaluated over whole columns at once.
+        A single profile takes the scalar path instead.
+        """
+        if not users:
+            return np.empty(0)
+        if len(users) == 1:
+            return np.array([self._calculate_twitter_confidence(users[0])])
+
+        now = datetime.now(timezone.utc)
+        columns = np.array(
+            [self._twitter_confidence_inputs(user_data, now) for user_data in users],
+            dtype=float,
+        ).T
+        verified, followers, tweets, filled, age_days = columns
+        verified = verified.astype(bool)
+
+        # Absent factors are 0 and excluded from the count
+        follower_factor = np.select(
+            [followers > 1000, followers > 100, followers > 10], [0.8, 0.6, 0.4], 0.0
+        )
+        tweet_factor = np.select(
+            [tweets > 1000, tweets > 100, tweets > 10], [0.7, 0.5, 0.3], 0.0
+        )
+        age_factor = np.select([age_days > 365, age_days > 180], [0.7, 0.5], 0.0)
+        completeness_factor = filled / 3 * 0.6
+
+        total = (
+            verified * 0.9
+            + follower_factor
+            + tweet_factor
+            + completeness_factor
+            + age_factor
+        )
+        # Completeness always counts, so the divisor is never zero
+        count = (
+            1
+            + verified
+            + (follower_factor > 0)
+            + (tweet_factor > 0)
+            + (age_factor > 0)
         )
+        return total / count
 
     async def search_by_username(
         self, username: str, context: Dict[str, Any] = None
@@ -16,6 +16,7 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from core.config import get_settings
 from core.enterprise_trust import trust_manager
+from core.http_client import close_session
 from database.db import init_db
 
 from .routes import router as api_router
@@ -31,6 +32,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logging.info("🛑 Shutting down Cyberzilla Enterprise API")
+    await close_session()
 
 
 # Create FastAPI app
@@ -173,6 +175,7 @@ async def lifespan(app: FastAPI):
     try:
         # Cleanup operations
         await ai_hierarchy.cleanup()
+        await close_session()
         logger.info("✅ Cleanup completed")
     except Exception as e:
         logger.error(f"❌ Shutdown cleanup failed: {e}")
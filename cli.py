@@ -8,15 +8,20 @@ GitHub: https://github.com/FJ-cyberzilla
 SECURE ENTERPRISE-GRADE OSINT PLATFORM
 """
 
+import asyncio
+import getpass
 import os
 import sys
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
+from enum import IntEnum
 from pathlib import Path
+from typing import List
 
 import click
 import pyfiglet
 import questionary
+from celery import group
 from questionary import Style
 from rich import box
 from rich.console import Console
@@ -30,8 +35,12 @@ from rich.text import Text
 sys.path.insert(0, str(Path(__file__).parent))
 
 from core.config import get_settings
+from core.error_handling import TRANSIENT_ERRORS, retry_async
 from core.exceptions import SecurityViolation
+from core.rate_limiter import EnterpriseRateLimiter
 from core.security import Authentication, SecurityManager
+from core.validation import email_validator
+from tasks.worker_tasks import social_lookup_task
 from utils.banner import BannerManager
 from utils.logger import setup_logger
 
@@ -55,6 +64,51 @@ CYBER_STYLE = Style(
     ]
 )
 
+# Sliding rate-limit window: 6 x 10s buckets = 1 minute
+RATE_LIMIT_BUCKETS = 6
+RATE_LIMIT_BUCKET_SECONDS = 10
+
+# Sample data - replace with actual agent status
+_AGENTS_STATIC = (
+    ("LinkedIn Agent", "🟢 ACTIVE", "92%", "2 min ago", "✅"),
+    ("GitHub Agent", "🟢 ACTIVE", "88%", "5 min ago", "✅"),
+    ("Twitter Agent", "🟡 DEGRADED", "76%", "10 min ago", "⚠️"),
+    ("Facebook Agent", "🟢 ACTIVE", "85%", "1 min ago", "✅"),
+    ("Instagram Agent", "🔴 OFFLINE", "0%", "1 hour ago", "❌"),
+)
+
+_HEALTH_STATIC = (
+    ("PostgreSQL", "🟢 HEALTHY", "12ms", "Connected: social_lookup_db"),
+    ("Redis", "🟢 HEALTHY", "3ms", "Broker: Ready"),
+    ("AI Correlation", "🟢 HEALTHY", "45ms", "Accuracy: 92%"),
+    ("Security Layer", "🟢 HEALTHY", "8ms", "All checks passed"),
+    ("Proxy Manager", "🟡 WARNING", "120ms", "2 proxies degraded"),
+)
+
+# Prompt labels are built once so Prompt.ask skips the markup parser
+_USERNAME_PROMPT = Text("Username", style="bold green")
+_PASSWORD_PROMPT = Text("Password", style="bold green")
+_EMAILS_PROMPT = Text("Enter email address(es) comma-separated", style="bold blue")
+
+
+def fast_prompt(message, password: bool = False) -> str:
+    """Prompt for input, skipping Rich's renderer when stdin is not a TTY"""
+    if sys.stdin.isatty():
+        return Prompt.ask(message, password=password)
+
+    label = message.plain if isinstance(message, Text) else Text.from_markup(message).plain
+    label = f"{label}: "
+    return getpass.getpass(label) if password else input(label)
+
+
+class Action(IntEnum):
+    """Rate-limited CLI operations"""
+
+    EMAIL_LOOKUP = 1
+    RESULTS = 2
+    AGENTS = 3
+    SYSTEM_UPDATE = 4
+
 
 class CyberzillaCLI:
     """Enterprise-grade secure CLI interface for Social Lookup Service"""
@@ -62,8 +116,11 @@ class CyberzillaCLI:
     def __init__(self):
         self.settings = get_settings()
         self.current_user = None
+        self._user_id = 0
         self.session_token = None
-        self.rate_limiter = {}
+        self.rate_limiter = EnterpriseRateLimiter(
+            RATE_LIMIT_BUCKETS, RATE_LIMIT_BUCKET_SECONDS
+        )
 
     def clear_screen(self):
         """Secure screen clearing"""
@@ -98,13 +155,14 @@ class CyberzillaCLI:
 
         max_attempts = 3
         for attempt in range(max_attempts):
-            username = Prompt.ask("\[bold green]Username[/bold green]")
-            password = Prompt.ask("\[bold green]Password[/bold green]", password=True)
+            username = fast_prompt(_USERNAME_PROMPT)
+            password = fast_prompt(_PASSWORD_PROMPT, password=True)
 
             try:
                 self.session_token = auth.authenticate(username, password)
                 if self.session_token:
                     self.current_user = username
+                    self._user_id = auth.get_user_id(username) or 0
                     security.log_access(username, "CLI_LOGIN", "SUCCESS")
                     console.print(
                         f"\[bold green]✅ Authentication successful! Welcome {username}[/bold green]"
@@ -125,24 +183,15 @@ class CyberzillaCLI:
         security.log_access("UNKNOWN", "CLI_LOGIN", "MAX_ATTEMPTS_EXCEEDED")
         sys.exit(1)
 
-    def rate_limit_check(self, action: str) -> bool:
-        """Enterprise rate limiting"""
-        now = time.time()
-        user_key = f"{self.current_user}_{action}"
+    def rate_limit_check(self, action: Action) -> bool:
+        """Enterprise rate limiting over a sliding one-minute window"""
+        user_key = (self._user_id << 8) | action
 
-        if user_key in self.rate_limiter:
-            last_time, count = self.rate_limiter[user_key]
-            if now - last_time < 60:  # 1 minute window
-                if count >= self.settings.RATE_LIMIT_PER_MINUTE:
-                    console.print(
-                        "[bold red]🚨 Rate limit exceeded. Please wait...[/bold red]"
-                    )
-                    return False
-                self.rate_limiter[user_key] = (last_time, count + 1)
-            else:
-                self.rate_limiter[user_key] = (now, 1)
-        else:
-            self.rate_limiter[user_key] = (now, 1)
+        if not self.rate_limiter.allow(
+            user_key, self.settings.security.RATE_LIMIT_PER_MINUTE
+        ):
+            console.print("[bold red]🚨 Rate limit exceeded. Please wait...[/bold red]")
+            return False
 
         return True
 
@@ -189,7 +238,7 @@ class CyberzillaCLI:
 
     def email_lookup_menu(self):
         """Secure email lookup interface"""
-        if not self.rate_limit_check("email_lookup"):
+        if not self.rate_limit_check(Action.EMAIL_LOOKUP):
             time.sleep(5)
             return
 
@@ -201,9 +250,7 @@ class CyberzillaCLI:
             )
         )
 
-        emails = Prompt.ask(
-            "\[bold blue]Enter email address(es) comma-separated[/bold blue]"
-        ).split(",")
+        emails = fast_prompt(_EMAILS_PROMPT).split(",")
         emails = [email.strip() for email in emails if email.strip()]
 
         if not emails:
@@ -224,36 +271,55 @@ class CyberzillaCLI:
         ):
             return
 
-        # Execute lookup with progress tracking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("\[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("\[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console,
-            transient=True,
-        ) as progress:
-            task = progress.add_task("\[cyan]Executing AI-powered lookup...", total=100)
+        group_id = asyncio.run(self.submit_lookup_tasks(emails))
+        if group_id is None:
+            console.print("[bold red]❌ No emails submitted[/bold red]")
+            return
 
-            # Simulate processing steps
-            for step in range(5):
-                progress.update(
-                    task,
-                    advance=20,
-                    description=f"\[cyan]Step {step+1}/5: Processing...",
+        security.log_operation(
+            self.current_user, "EMAIL_LOOKUP", f"Submitted {emails} as {group_id}"
+        )
+
+    async def submit_lookup_tasks(self, emails: List[str], advanced: bool = False):
+        """Validate emails concurrently and submit them to Celery as one group"""
+        validation_results = await asyncio.gather(
+            *(email_validator.validate_email_comprehensive(email) for email in emails)
+        )
+
+        valid_emails = []
+        for email, validation_result in zip(emails, validation_results):
+            if not validation_result["is_valid"]:
+                console.print(
+                    f"[bold red]❌ Invalid email {email}: {validation_result.get('details', {}).get('error', 'Unknown error')}[/bold red]"
                 )
-                time.sleep(1)
+                continue
 
-            progress.update(
-                task, completed=100, description="\[green]✅ Lookup completed!"
+            if validation_result["risk_score"] > 0.7:
+                if not Confirm.ask(
+                    f"[bold yellow]⚠️  High-risk email {email} (score: {validation_result['risk_score']:.2f}). Continue?[/bold yellow]"
+                ):
+                    continue
+
+            valid_emails.append(email)
+
+        if not valid_emails:
+            return None
+
+        # One broker publish for the whole batch instead of one per email
+        job = group(
+            social_lookup_task.s(
+                email=email,
+                advanced_analysis=advanced,
+                user_context={"cli_user": self.current_user},
             )
+            for email in valid_emails
+        )
+        result = job.apply_async()
 
         console.print(
-            f"\[bold green]✅ Successfully processed {len(emails)} email(s)[/bold green]"
-        )
-        security.log_operation(
-            self.current_user, "EMAIL_LOOKUP", f"Processed: {emails}"
+            f"[bold green]✅ {len(valid_emails)} task(s) submitted: {result.id}[/bold green]"
         )
+        return result.id
 
     def agents_management_menu(self):
         """Enterprise AI Agents Management"""
@@ -291,6 +357,11 @@ class CyberzillaCLI:
 
     def show_agents_status(self):
         """Display AI agents status"""
+        # Rebuilt on every view so the table always shows current status
+        console.print(self._build_agents_table())
+
+    def _build_agents_table(self) -> Table:
+        """Build the agents status table"""
         table = Table(
             title="🤖 ENTERPRISE AI AGENTS STATUS",
             show_header=True,
@@ -302,19 +373,10 @@ class CyberzillaCLI:
         table.add_column("Last Active", style="dim")
         table.add_column("Health", justify="center")
 
-        # Sample data - replace with actual agent status
-        agents_data = [
-            ("LinkedIn Agent", "🟢 ACTIVE", "92%", "2 min ago", "✅"),
-            ("GitHub Agent", "🟢 ACTIVE", "88%", "5 min ago", "✅"),
-            ("Twitter Agent", "🟡 DEGRADED", "76%", "10 min ago", "⚠️"),
-            ("Facebook Agent", "🟢 ACTIVE", "85%", "1 min ago", "✅"),
-            ("Instagram Agent", "🔴 OFFLINE", "0%", "1 hour ago", "❌"),
-        ]
-
-        for agent in agents_data:
+        for agent in _AGENTS_STATIC:
             table.add_row(*agent)
 
-        console.print(table)
+        return table
 
     def health_check(self):
         """Comprehensive system health check"""
@@ -369,15 +431,7 @@ class CyberzillaCLI:
         table.add_column("Response Time", justify="right")
         table.add_column("Details", style="dim")
 
-        health_data = [
-            ("PostgreSQL", "🟢 HEALTHY", "12ms", "Connected: social_lookup_db"),
-            ("Redis", "🟢 HEALTHY", "3ms", "Broker: Ready"),
-            ("AI Correlation", "🟢 HEALTHY", "45ms", "Accuracy: 92%"),
-            ("Security Layer", "🟢 HEALTHY", "8ms", "All checks passed"),
-            ("Proxy Manager", "🟡 WARNING", "120ms", "2 proxies degraded"),
-        ]
-
-        for item in health_data:
+        for item in _HEALTH_STATIC:
             table.add_row(*item)
 
         console.print(table)
@@ -414,10 +468,14 @@ class CyberzillaCLI:
 
         # Recent security events
         console.print("\n[bold yellow]🔍 RECENT SECURITY EVENTS:[/bold yellow]")
+        now = datetime.now()
+        ts = now.strftime("%H:%M:%S")
+        ts_5m = (now - timedelta(minutes=5)).strftime("%H:%M:%S")
+        ts_10m = (now - timedelta(minutes=10)).strftime("%H:%M:%S")
         events = [
-            f"\[dim]{datetime.now().strftime('%H:%M:%S')}[/dim] \[green]LOGIN: {self.current_user} from CLI",
-            f"\[dim]{(datetime.now().timestamp() - 300):%H:%M:%S}[/dim] \[blue]RATE_LIMIT: Check passed",
-            f"\[dim]{(datetime.now().timestamp() - 600):%H:%M:%S}[/dim] \[yellow]AGENT_UPDATE: Twitter agent patched",
+            f"\[dim]{ts}[/dim] \[green]LOGIN: {self.current_user} from CLI",
+            f"\[dim]{ts_5m}[/dim] \[blue]RATE_LIMIT: Check passed",
+            f"\[dim]{ts_10m}[/dim] \[yellow]AGENT_UPDATE: Twitter agent patched",
         ]
 
         for event in events:
@@ -476,6 +534,7 @@ class CyberzillaCLI:
         )
         self.session_token = None
         self.current_user = None
+        self._user_id = 0
 
         console.print(
             "[bold green]🔒 Session securely terminated. Goodbye![/bold green]"
@@ -605,13 +664,27 @@ class CyberzillaCLI:
         # Initialize agents for each platform
         platforms = ["linkedin", "github", "twitter", "facebook", "instagram"]
 
-        for platform in platforms:
-            try:
-                agent = await self.agent_generator.generate_agent(platform)
-                console.print(f"  ✅ {platform.title()} agent: {agent.agent_id}")
-            except Exception as e:
-                console.print(f"  ❌ {platform.title()} agent failed: {e}")
+        results = await asyncio.gather(
+            *(self._safe_generate(platform) for platform in platforms)
+        )
+
+        for platform, result in results:
+            if isinstance(result, Exception):
+                console.print(f"  ❌ {platform.title()} agent failed: {result}")
+            else:
+                console.print(f"  ✅ {platform.title()} agent: {result.agent_id}")
 
         console.print(
             f"[green]✅ {len(platforms)} AI agents initialized with {strategy.level.value} resource strategy[/green]"
         )
+
+    async def _safe_generate(self, platform: str):
+        """Generate a single platform agent, returning the error instead of raising"""
+        try:
+            agent = await retry_async(
+                lambda: self.agent_generator.generate_agent(platform),
+                retriable=TRANSIENT_ERRORS,
+            )
+            return platform, agent
+        except Exception as e:
+            return platform, e
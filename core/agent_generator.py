@@ -3,12 +3,24 @@ AI AGENT GENERATOR & ORCHESTRATOR
 Dynamically generates, validates, and replaces agents based on performance
 """
 
+import asyncio
 import hashlib
-import json
 import logging
+import sys
+import time
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type
+from secrets import token_hex
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+import numpy as np
+import orjson
+
+from .base_agent import BaseAgent, BaseCodeAgent, BaseSocialAgent
+from .schemas import PlatformType
+from .resource_orchestrator import ResourceLevel, ResourceStrategy
 
 
 class AgentStatus(Enum):
@@ -18,23 +30,210 @@ class AgentStatus(Enum):
     OFFLINE = "offline"
 
 
-@dataclass
-class AgentPerformance:
-    success_rate: float
-    avg_response_time: float
-    error_rate: float
-    last_success: Optional[datetime]
-    total_requests: int
+# Numeric codes for AgentStatus, stored in the uint8 status array
+_STATUS_CODES: Dict[AgentStatus, int] = {
+    status: code for code, status in enumerate(AgentStatus)
+}
+_STATUS_BY_CODE = tuple(AgentStatus)
+_STATUS_FAILING = _STATUS_CODES[AgentStatus.FAILING]
+# Interned report strings, so reports skip the Enum .value descriptor
+_STATUS_STR: Dict[AgentStatus, str] = {
+    status: sys.intern(status.value) for status in AgentStatus
+}
+
+# Agents below this success rate are flagged for regeneration
+LOW_SUCCESS_RATE = 0.5
+
+# Retired agent instances kept per agent class for reuse by later generations
+AGENT_POOL_SIZE = 16
 
+# Seconds between health passes of the background monitor
+HEALTH_CHECK_INTERVAL = 60.0
 
-@dataclass
+# Attributes that optimize_agents_for_resources may retune; the rate is tuned
+# on live instances, from the class's base_rate_limit
+_TUNABLES = ("timeout", "base_rate_limit", "data_depth")
+_CONSTRAINED_LEVELS = frozenset((ResourceLevel.LOW, ResourceLevel.CRITICAL))
+_DATA_DEPTH = {"basic": "minimal", "standard": "normal"}
+
+
+class _PerformanceStore:
+    """
+    Structure-of-arrays storage for agent performance metrics
+    Slots [0, size) are always live; removal swaps the last slot into the gap
+    """
+
+    # (array, dtype, value of an empty slot); NaN last_success means "never"
+    _COLUMNS = (
+        ("success_rate", np.float32, 0.0),
+        ("avg_response_time", np.float32, 0.0),
+        ("error_rate", np.float32, 0.0),
+        ("last_success", np.float64, np.nan),  # monotonic
+        ("total_requests", np.int64, 0),
+        ("status", np.uint8, 0),
+    )
+    _ARRAYS = tuple(name for name, _, _ in _COLUMNS)
+
+    def __init__(self, capacity: int = 64):
+        for name, dtype, empty in self._COLUMNS:
+            setattr(self, name, np.full(capacity, empty, dtype=dtype))
+        self.agent_ids: List[str] = []
+        self._views: List["AgentPerformance"] = []
+        self.size = 0
+
+        # Running tally so reports don't rescan every agent
+        self.status_counts = [0] * len(_STATUS_BY_CODE)
+
+    def add(self, agent_id: str, status: AgentStatus) -> "AgentPerformance":
+        """Allocate a slot for an agent and return its performance view"""
+        if self.size == len(self.success_rate):
+            self._grow()
+
+        slot = self.size
+        self.size += 1
+        # The slot may have been vacated by remove(); clear what it left behind
+        for name, _, empty in self._COLUMNS:
+            getattr(self, name)[slot] = empty
+        self.success_rate[slot] = 1.0
+        self.status[slot] = code = _STATUS_CODES[status]
+        self.status_counts[code] += 1
+
+        view = AgentPerformance(self, slot)
+        self.agent_ids.append(agent_id)
+        self._views.append(view)
+        return view
+
+    def remove(self, view: "AgentPerformance"):
+        """Free an agent's slot, moving the last live slot into its place"""
+        slot, last = view.slot, self.size - 1
+        self.status_counts[self.status[slot]] -= 1
+
+        if slot != last:
+            for name in self._ARRAYS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            self.agent_ids[slot] = self.agent_ids[last]
+            self._views[slot] = self._views[last]
+            self._views[slot].slot = slot
+
+        self.agent_ids.pop()
+        self._views.pop()
+        self.size = last
+        view.slot = -1
+
+    def set_status(self, slot: int, status: AgentStatus):
+        """Set one agent's status, keeping status_counts in step"""
+        code = _STATUS_CODES[status]
+        self.status_counts[self.status[slot]] -= 1
+        self.status_counts[code] += 1
+        self.status[slot] = code
+
+    def set_statuses(self, codes: np.ndarray):
+        """Bulk-assign status codes for all live slots"""
+        self.status[: self.size] = codes
+        self.status_counts = np.bincount(
+            self.status[: self.size], minlength=len(_STATUS_BY_CODE)
+        ).tolist()
+
+    def _grow(self):
+        """Double the capacity of every array"""
+        capacity = len(self.success_rate) * 2
+        for name, dtype, empty in self._COLUMNS:
+            array = getattr(self, name)
+            grown = np.full(capacity, empty, dtype=dtype)
+            grown[: self.size] = array[: self.size]
+            setattr(self, name, grown)
+
+
+async def _placeholder(self, *args, **kwargs):
+    """Shared stand-in for required methods a generated agent doesn't implement"""
+    raise NotImplementedError(f"Method not implemented for {self.platform}")
+
+
+_BASE_CLASSES: Dict[str, Type] = {
+    "BaseSocialAgent": BaseSocialAgent,
+    "BaseCodeAgent": BaseCodeAgent,
+}
+
+
+def _slot_field(name: str, cast):
+    """Property reading/writing one metric of the agent's slot"""
+
+    def getter(self):
+        return cast(getattr(self._store, name)[self.slot])
+
+    def setter(self, value):
+        getattr(self._store, name)[self.slot] = value
+
+    return property(getter, setter)
+
+
+class AgentPerformance:
+    """Per-agent view onto a slot of the shared performance arrays"""
+
+    __slots__ = ("_store", "slot")
+
+    success_rate = _slot_field("success_rate", float)
+    avg_response_time = _slot_field("avg_response_time", float)
+    error_rate = _slot_field("error_rate", float)
+    total_requests = _slot_field("total_requests", int)
+
+    def __init__(self, store: _PerformanceStore, slot: int):
+        self._store = store
+        self.slot = slot
+
+    @property
+    def last_success(self) -> Optional[float]:
+        """time.monotonic() of the last successful request, if any"""
+        ts = self._store.last_success[self.slot]
+        return None if np.isnan(ts) else float(ts)
+
+    @last_success.setter
+    def last_success(self, value: Optional[float]):
+        self._store.last_success[self.slot] = np.nan if value is None else value
+
+
+def _aggregate_performance(
+    success_rate: np.ndarray, response_time: np.ndarray, error_rate: np.ndarray
+) -> Tuple[float, float, float]:
+    """Sum success rate, response time and health score (0-100) in one pass"""
+    health_score = (
+        success_rate * 40.0
+        + np.maximum(0.0, 100.0 - response_time) * 30.0
+        + np.maximum(0.0, 100.0 - error_rate * 100.0) * 30.0
+    )
+    return (
+        float(success_rate.sum(dtype=np.float64)),
+        float(response_time.sum(dtype=np.float64)),
+        float(health_score.sum(dtype=np.float64)),
+    )
+
+
+@dataclass(slots=True, eq=False)
 class GeneratedAgent:
+    """One generation of a platform agent
+
+    Wrappers are never reused. On retirement ``instance`` is set to None and
+    the instance goes back to the pool, so a stale reference fails loudly
+    instead of silently following a different agent.
+    """
+
     agent_id: str
     platform: str
     agent_class: Type
     performance: AgentPerformance
-    status: AgentStatus
     config_hash: str
+    instance: Optional[BaseAgent] = None
+
+    @property
+    def status(self) -> AgentStatus:
+        perf = self.performance
+        return _STATUS_BY_CODE[perf._store.status[perf.slot]]
+
+    @status.setter
+    def status(self, value: AgentStatus):
+        perf = self.performance
+        perf._store.set_status(perf.slot, value)
 
 
 class AgentGenerator:
@@ -46,7 +245,23 @@ class AgentGenerator:
     def __init__(self):
         self.logger = logging.getLogger("agent_generator")
         self.active_agents: Dict[str, GeneratedAgent] = {}
+        self._performance = _PerformanceStore()
+        self._class_cache: Dict[Tuple[str, str], Type] = {}
+        # Cleaned-up agent instances by class; only these are recycled
+        self._pool: Dict[Type, deque] = defaultdict(
+            lambda: deque(maxlen=AGENT_POOL_SIZE)
+        )
+        # Single background monitor; callers share its passes via request_health.
+        # Its primitives are created inside the running loop by _ensure_monitor,
+        # since this module-level instance may outlive several event loops.
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._health_tick: Optional[asyncio.Event] = None
+        self._health_waiters: List[asyncio.Future] = []
+        # Bounds concurrent regenerations when many agents fail at once
+        self._replacement_slots: Optional[asyncio.Semaphore] = None
+        self.health_snapshot: Optional[Mapping[str, Any]] = None
         self.agent_templates = self._load_agent_templates()
+        self._default_template = self._resolve_template({})
         self.performance_thresholds = {
             "success_rate_min": 0.7,
             "response_time_max": 30.0,
@@ -55,7 +270,7 @@ class AgentGenerator:
 
     def _load_agent_templates(self) -> Dict[str, Any]:
         """Load agent templates for dynamic generation"""
-        return {
+        templates = {
             "linkedin": {
                 "base_class": "BaseSocialAgent",
                 "timeout": 30,
@@ -81,133 +296,185 @@ class AgentGenerator:
             # ... templates for all platforms
         }
 
+        for template in templates.values():
+            self._resolve_template(template)
+
+        return templates
+
+    def _resolve_template(self, template: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve a template's base class and placeholder methods once"""
+        base_class = _BASE_CLASSES.get(
+            template.get("base_class", "BaseSocialAgent"), BaseAgent
+        )
+        template["base_class"] = base_class
+        # Abstract base methods need a stand-in too, or the class can't be instantiated
+        abstract = getattr(base_class, "__abstractmethods__", frozenset())
+        template["namespace_extra"] = {
+            method_name: _placeholder
+            for method_name in (*template.get("required_methods", []), *abstract)
+            if method_name in abstract or not hasattr(base_class, method_name)
+        }
+        return template
+
     async def generate_agent(
-        self, platform: str, config: Dict[str, Any] = None
+        self,
+        platform: str,
+        config: Dict[str, Any] = None,
+        config_hash: Optional[str] = None,
     ) -> GeneratedAgent:
-        """Dynamically generate an AI agent for a specific platform"""
-        self.logger.info(f"🤖 Generating agent for platform: {platform}")
+        """Dynamically generate an AI agent for a specific platform
+
+        ``config_hash`` may be passed when the hash of ``config`` is already
+        known (e.g. when replacing an agent) to skip re-serializing it.
+        """
+        self.logger.info("🤖 Generating agent for platform: %s", platform)
 
         try:
             # Generate unique agent ID
-            agent_id = f"{platform}_{hashlib.md5(str(datetime.now()).encode()).hexdigest()[:8]}"
+            agent_id = f"{platform}_{token_hex(4)}"
 
-            # Create agent instance
-            agent_class = await self._create_agent_class(platform, config)
-            agent_instance = agent_class()
+            config_hash = config_hash or self._calculate_config_hash(config)
+
+            # Create agent instance, recycling a retired one of this class
+            agent_class = self._create_agent_class(platform, config, config_hash)
+            pool = self._pool.get(agent_class)
+            agent_instance = pool.popleft() if pool else agent_class(PlatformType(platform))
 
             # Initialize with performance tracking
-            performance = AgentPerformance(
-                success_rate=1.0,  # Start optimistic
-                avg_response_time=0.0,
-                error_rate=0.0,
-                last_success=datetime.now(),
-                total_requests=0,
-            )
+            # Start optimistic: healthy with a 100% success rate
+            performance = self._performance.add(agent_id, AgentStatus.HEALTHY)
+            performance.avg_response_time = 0.0
+            performance.error_rate = 0.0
+            performance.last_success = time.monotonic()
+            performance.total_requests = 0
 
             generated_agent = GeneratedAgent(
                 agent_id=agent_id,
                 platform=platform,
                 agent_class=agent_class,
                 performance=performance,
-                status=AgentStatus.HEALTHY,
-                config_hash=self._calculate_config_hash(config),
+                config_hash=config_hash,
+                instance=agent_instance,
             )
 
             self.active_agents[agent_id] = generated_agent
 
-            self.logger.info(f"✅ Generated agent {agent_id} for {platform}")
+            self.logger.info("✅ Generated agent %s for %s", agent_id, platform)
             return generated_agent
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to generate agent for {platform}: {e}")
+            self.logger.error("❌ Failed to generate agent for %s: %s", platform, e)
             raise
 
-    async def _create_agent_class(self, platform: str, config: Dict[str, Any]) -> Type:
-        """Create agent class dynamically"""
+    def _create_agent_class(
+        self, platform: str, config: Dict[str, Any], config_hash: str
+    ) -> Type:
+        """Create agent class dynamically, reusing classes for identical configs"""
+        cache_key = (platform, config_hash)
+        agent_class = self._class_cache.get(cache_key)
+        if agent_class is not None:
+            return agent_class
 
-        template = self.agent_templates.get(platform, {})
+        template = self.agent_templates.get(platform, self._default_template)
 
         # Dynamic class creation
         class_name = f"{platform.title()}Agent"
-
-        # Get base class
-        base_class = await self._get_base_class(
-            template.get("base_class", "BaseSocialAgent")
-        )
-
-        # Create class dynamically
-        agent_class = type(
-            class_name,
-            (base_class,),
-            {
-                "platform": platform,
-                "timeout": template.get("timeout", 30),
-                "rate_limit": template.get("rate_limit", 10),
-                "config": config or {},
-                "_template": template,
-                "__module__": __name__,
-            },
+        namespace = {
+            **template["namespace_extra"],
+            "platform": platform,
+            "timeout": template.get("timeout", 30),
+            "base_rate_limit": template.get("rate_limit", 10),
+            "config": config or {},
+            "_template": template,
+            "__module__": __name__,
+        }
+        if "data_depth" in template:
+            namespace["data_depth"] = template["data_depth"]
+        namespace["_tunables"] = frozenset(
+            name for name in _TUNABLES if name in namespace
         )
+        agent_class = type(class_name, (template["base_class"],), namespace)
 
-        # Add required methods
-        await self._add_required_methods(agent_class, template)
-
+        self._class_cache[cache_key] = agent_class
         return agent_class
 
-    async def _get_base_class(self, base_class_name: str) -> Type:
-        """Get the base class for agent generation"""
-        try:
-            if base_class_name == "BaseSocialAgent":
-                from .base_agent import BaseSocialAgent
-
-                return BaseSocialAgent
-            elif base_class_name == "BaseCodeAgent":
-                from .base_agent import BaseCodeAgent
-
-                return BaseCodeAgent
-            else:
-                from .base_agent import BaseAgent
-
-                return BaseAgent
-        except ImportError:
-            from .base_agent import BaseAgent
-
-            return BaseAgent
-
-    async def _add_required_methods(self, agent_class: Type, template: Dict[str, Any]):
-        """Add required methods to agent class"""
-        required_methods = template.get("required_methods", [])
-
-        for method_name in required_methods:
-            if not hasattr(agent_class, method_name):
-                # Add placeholder method that will be implemented per platform
-                setattr(
-                    agent_class,
-                    method_name,
-                    self._create_placeholder_method(method_name),
-                )
-
-    def _create_placeholder_method(self, method_name: str):
-        """Create placeholder method that raises NotImplementedError"""
-
-        async def placeholder_method(self, *args, **kwargs):
-            raise NotImplementedError(
-                f"Method {method_name} must be implemented for {self.platform}"
-            )
-
-        return placeholder_method
-
     def _calculate_config_hash(self, config: Dict[str, Any]) -> str:
         """Calculate hash of agent configuration for versioning"""
-        config_str = json.dumps(config, sort_keys=True) if config else ""
-        return hashlib.md5(config_str.encode()).hexdigest()
+        config_bytes = orjson.dumps(config, option=orjson.OPT_SORT_KEYS) if config else b""
+        # Non-cryptographic identifier: BLAKE2b is faster than MD5 in hashlib
+        return hashlib.blake2b(config_bytes, digest_size=16).hexdigest()
 
-    async def monitor_agent_health(self) -> Dict[str, Any]:
+    async def monitor_agent_health(self) -> Mapping[str, Any]:
         """Monitor health of all active agents"""
+        return await self.request_health()
+
+    async def request_health(self) -> Mapping[str, Any]:
+        """Wait for the next pass of the shared monitor and return its report
+
+        Concurrent callers are coalesced into a single pass, so failing agents
+        are never replaced twice. The report is a read-only mapping.
+        """
+        self._ensure_monitor()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._health_waiters.append(waiter)
+        self._health_tick.set()
+        return await asyncio.shield(waiter)
+
+    def _ensure_monitor(self):
+        """Start the monitor in the running loop unless it is already live there"""
+        loop = asyncio.get_running_loop()
+        task = self._monitor_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+
+        # A task from a closed loop never finishes; start over in this one
+        self._health_tick = asyncio.Event()
+        self._health_waiters = []
+        self._replacement_slots = asyncio.Semaphore(4)
+        self._monitor_task = loop.create_task(self._monitor_loop())
+
+    async def stop_monitoring(self):
+        """Cancel the background monitor task"""
+        task, self._monitor_task = self._monitor_task, None
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _monitor_loop(self):
+        """Run a health pass every interval, or sooner when one is requested"""
+        while True:
+            try:
+                await asyncio.wait_for(self._health_tick.wait(), HEALTH_CHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._health_tick.clear()
+            waiters, self._health_waiters = self._health_waiters, []
+
+            try:
+                report = await self._compute_health()
+            except Exception as e:
+                self.logger.error("❌ Agent health check failed: %s", e)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+                continue
+
+            self.health_snapshot = MappingProxyType(report)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(self.health_snapshot)
+
+    async def _compute_health(self) -> Dict[str, Any]:
+        """Classify all active agents and replace the failing ones"""
         self.logger.info("🔍 Monitoring agent health...")
 
         health_report = {
-            "timestamp": datetime.now(),
+            "timestamp": time.time(),
             "total_agents": len(self.active_agents),
             "healthy_agents": 0,
             "degraded_agents": 0,
@@ -216,95 +483,123 @@ class AgentGenerator:
             "replacements_triggered": 0,
         }
 
-        agents_to_replace = []
+        failing = self._classify_agents_health()
+        store = self._performance
+        store.set_statuses(
+            np.where(
+                failing,
+                _STATUS_FAILING,
+                _STATUS_CODES[AgentStatus.HEALTHY],
+            )
+        )
 
+        failing_count = int(np.count_nonzero(failing))
+        health_report["failing_agents"] = failing_count
+        health_report["healthy_agents"] = store.size - failing_count
+        agents_to_replace = [store.agent_ids[i] for i in np.nonzero(failing)[0]]
+
+        # Read each metric column once rather than per-agent attribute chains
+        n = store.size
+        status_names = [_STATUS_STR[status] for status in _STATUS_BY_CODE]
+        codes = store.status[:n].tolist()
+        success_rate = store.success_rate[:n].tolist()
+        avg_response_time = store.avg_response_time[:n].tolist()
+        error_rate = store.error_rate[:n].tolist()
+        agent_details = health_report["agent_details"]
         for agent_id, agent in self.active_agents.items():
-            # Check agent health
-            is_healthy = await self._check_agent_health(agent)
-
-            if is_healthy:
-                agent.status = AgentStatus.HEALTHY
-                health_report["healthy_agents"] += 1
-            else:
-                agent.status = AgentStatus.FAILING
-                health_report["failing_agents"] += 1
-                agents_to_replace.append(agent_id)
-
-            health_report["agent_details"][agent_id] = {
+            slot = agent.performance.slot
+            agent_details[agent_id] = {
                 "platform": agent.platform,
-                "status": agent.status.value,
-                "success_rate": agent.performance.success_rate,
-                "avg_response_time": agent.performance.avg_response_time,
-                "error_rate": agent.performance.error_rate,
+                "status": status_names[codes[slot]],
+                "success_rate": success_rate[slot],
+                "avg_response_time": avg_response_time[slot],
+                "error_rate": error_rate[slot],
             }
 
-        # Replace failing agents
-        for agent_id in agents_to_replace:
-            await self._replace_failing_agent(agent_id)
-            health_report["replacements_triggered"] += 1
+        # Replace failing agents concurrently; one failure must not cancel the rest
+        results = await asyncio.gather(
+            *(self._replace_failing_agent(agent_id) for agent_id in agents_to_replace),
+            return_exceptions=True,
+        )
+        for agent_id, result in zip(agents_to_replace, results):
+            if isinstance(result, Exception):
+                self.logger.error("❌ Failed to replace agent %s: %s", agent_id, result)
+        health_report["replacements_triggered"] = len(agents_to_replace)
 
         self.logger.info(
-            f"✅ Agent health check: {health_report['healthy_agents']} healthy, {health_report['failing_agents']} failing"
+            "✅ Agent health check: %d healthy, %d failing",
+            health_report["healthy_agents"],
+            health_report["failing_agents"],
         )
 
         return health_report
 
-    async def _check_agent_health(self, agent: GeneratedAgent) -> bool:
-        """Check if agent meets health thresholds"""
-        perf = agent.performance
+    def _classify_agents_health(self) -> np.ndarray:
+        """Return a boolean mask, per store slot, of agents failing health thresholds"""
+        store = self._performance
+        n = store.size
+        thresholds = self.performance_thresholds
 
-        if (
-            perf.success_rate < self.performance_thresholds["success_rate_min"]
-            or perf.avg_response_time > self.performance_thresholds["response_time_max"]
-            or perf.error_rate > self.performance_thresholds["error_rate_max"]
-        ):
-            return False
+        fail_mask = (
+            (store.success_rate[:n] < thresholds["success_rate_min"])
+            | (store.avg_response_time[:n] > thresholds["response_time_max"])
+            | (store.error_rate[:n] > thresholds["error_rate_max"])
+        )
 
-        # Check if agent has been successful recently
-        if (
-            perf.last_success
-            and datetime.now() - perf.last_success > timedelta(hours=1)
-            and perf.total_requests > 0
-        ):
-            return False
+        # Agents that have served requests but not succeeded in the last hour
+        # (NaN last_success compares False, i.e. "never" is not stale)
+        now = time.monotonic()
+        stale = (now - store.last_success[:n] > 3600.0) & (store.total_requests[:n] > 0)
 
-        return True
+        return fail_mask | stale
 
     async def _replace_failing_agent(self, agent_id: str):
         """Replace a failing agent with a new instance"""
-        self.logger.warning(f"🔄 Replacing failing agent: {agent_id}")
+        self.logger.warning("🔄 Replacing failing agent: %s", agent_id)
 
         try:
             old_agent = self.active_agents[agent_id]
             platform = old_agent.platform
 
             # Generate new agent
-            new_agent = await self.generate_agent(platform, old_agent.config)
+            if self._replacement_slots is None:
+                self._replacement_slots = asyncio.Semaphore(4)
+            async with self._replacement_slots:
+                new_agent = await self.generate_agent(
+                    platform, old_agent.agent_class.config, old_agent.config_hash
+                )
 
-            # Replace in active agents
-            self.active_agents[agent_id] = new_agent
+            # Retire the old agent; the new one is registered under its own id
+            del self.active_agents[agent_id]
+            self._performance.remove(old_agent.performance)
 
-            # Clean up old agent
+            # Clean up the old agent; only its instance is kept for reuse
             await self._cleanup_agent(old_agent)
+            instance, old_agent.instance = old_agent.instance, None
+            if instance is not None:
+                instance.reset()
+                self._pool[old_agent.agent_class].append(instance)
 
-            self.logger.info(f"✅ Replaced agent {agent_id} with {new_agent.agent_id}")
+            self.logger.info(
+                "✅ Replaced agent %s with %s", agent_id, new_agent.agent_id
+            )
 
         except Exception as e:
-            self.logger.error(f"❌ Failed to replace agent {agent_id}: {e}")
+            self.logger.error("❌ Failed to replace agent %s: %s", agent_id, e)
 
     async def _cleanup_agent(self, agent: GeneratedAgent):
         """Clean up agent resources"""
         try:
             # Perform any necessary cleanup
-            if hasattr(agent.agent_class, "cleanup"):
-                await agent.agent_class.cleanup()
+            if agent.instance is not None:
+                await agent.instance.cleanup()
         except Exception as e:
-            self.logger.warning(f"⚠️ Agent cleanup failed: {e}")
+            self.logger.warning("⚠️ Agent cleanup failed: %s", e)
 
     async def optimize_agents_for_resources(self, resource_strategy: ResourceStrategy):
         """Optimize all agents based on current resource strategy"""
         self.logger.info(
-            f"🎯 Optimizing agents for {resource_strategy.level.value} resources"
+            "🎯 Optimizing agents for %s resources", resource_strategy.level.value
         )
 
         for agent_id, agent in self.active_agents.items():
@@ -315,30 +610,32 @@ class AgentGenerator:
     ):
         """Optimize individual agent based on resource strategy"""
         try:
+            agent_class = agent.agent_class
+            tunables = agent_class._tunables
+
             # Adjust agent timeouts
-            if hasattr(agent.agent_class, "timeout"):
-                agent.agent_class.timeout = strategy.agent_timeout
+            if "timeout" in tunables:
+                agent_class.timeout = strategy.agent_timeout
 
             # Adjust rate limiting
-            if hasattr(agent.agent_class, "rate_limit"):
+            if "base_rate_limit" in tunables and agent.instance is not None:
                 # Reduce rate limit for lower resource levels
-                base_rate = getattr(agent.agent_class, "base_rate_limit", 10)
-                if strategy.level in [ResourceLevel.LOW, ResourceLevel.CRITICAL]:
-                    agent.agent_class.rate_limit = max(1, base_rate // 2)
+                base_rate = agent_class.base_rate_limit
+                if strategy.level in _CONSTRAINED_LEVELS:
+                    agent.instance.rate_limit = max(1, base_rate // 2)
                 else:
-                    agent.agent_class.rate_limit = base_rate
+                    agent.instance.rate_limit = base_rate
 
             # Adjust data collection depth
-            if hasattr(agent.agent_class, "data_depth"):
-                if strategy.data_quality == "basic":
-                    agent.agent_class.data_depth = "minimal"
-                elif strategy.data_quality == "standard":
-                    agent.agent_class.data_depth = "normal"
-                else:
-                    agent.agent_class.data_depth = "comprehensive"
+            if "data_depth" in tunables:
+                agent_class.data_depth = _DATA_DEPTH.get(
+                    strategy.data_quality, "comprehensive"
+                )
 
         except Exception as e:
-            self.logger.warning(f"⚠️ Failed to optimize agent {agent.agent_id}: {e}")
+            self.logger.warning(
+                "⚠️ Failed to optimize agent %s: %s", agent.agent_id, e
+            )
 
     def get_agent_performance_report(self) -> Dict[str, Any]:
         """Generate comprehensive agent performance report"""
@@ -359,47 +656,28 @@ class AgentGenerator:
         if not self.active_agents:
             return report
 
-        # Calculate metrics
-        total_success = 0.0
-        total_response_time = 0.0
-        total_health_score = 0.0
-
-        for agent_id, agent in self.active_agents.items():
-            # Status distribution
-            status = agent.status.value
-            report["summary"]["by_status"][status] = (
-                report["summary"]["by_status"].get(status, 0) + 1
-            )
-
-            # Platform distribution
-            platform = agent.platform
-            report["summary"]["by_platform"][platform] = (
-                report["summary"]["by_platform"].get(platform, 0) + 1
-            )
-
-            # Performance metrics
-            total_success += agent.performance.success_rate
-            total_response_time += agent.performance.avg_response_time
-
-            # Health score (0-100)
-            health_score = (
-                agent.performance.success_rate * 40
-                + max(0, 100 - agent.performance.avg_response_time) * 30
-                + max(0, 100 - agent.performance.error_rate * 100) * 30
-            )
-            total_health_score += health_score
-
-        # Calculate averages
-        report["performance_metrics"]["average_success_rate"] = total_success / len(
-            self.active_agents
-        )
-        report["performance_metrics"]["average_response_time"] = (
-            total_response_time / len(self.active_agents)
+        # Status and platform distribution
+        store = self._performance
+        report["summary"]["by_status"] = {
+            _STATUS_STR[_STATUS_BY_CODE[code]]: count
+            for code, count in enumerate(store.status_counts)
+            if count
+        }
+        report["summary"]["by_platform"] = dict(
+            Counter(agent.platform for agent in self.active_agents.values())
         )
-        report["performance_metrics"]["overall_health_score"] = (
-            total_health_score / len(self.active_agents)
+
+        # Performance metrics, reduced over the SoA arrays
+        n = store.size
+        total_success, total_response_time, total_health_score = _aggregate_performance(
+            store.success_rate[:n], store.avg_response_time[:n], store.error_rate[:n]
         )
 
+        metrics = report["performance_metrics"]
+        metrics["average_success_rate"] = total_success / n
+        metrics["average_response_time"] = total_response_time / n
+        metrics["overall_health_score"] = total_health_score / n
+
         # Generate recommendations
         report["recommendations"] = self._generate_agent_recommendations()
 
@@ -409,23 +687,20 @@ class AgentGenerator:
         """Generate agent performance recommendations"""
         recommendations = []
 
-        failing_count = sum(
-            1
-            for agent in self.active_agents.values()
-            if agent.status == AgentStatus.FAILING
-        )
+        store = self._performance
+        failing_count = store.status_counts[_STATUS_FAILING]
 
         if failing_count > len(self.active_agents) * 0.3:  # More than 30% failing
             recommendations.append(
                 "High agent failure rate - investigate platform changes or API issues"
             )
 
-        low_success_agents = [
-            a for a in self.active_agents.values() if a.performance.success_rate < 0.5
-        ]
-        if low_success_agents:
+        low_success_count = int(
+            np.count_nonzero(store.success_rate[: store.size] < LOW_SUCCESS_RATE)
+        )
+        if low_success_count:
             recommendations.append(
-                f"{len(low_success_agents)} agents with low success rate - consider regeneration"
+                f"{low_success_count} agents with low success rate - consider regeneration"
             )
 
         return recommendations
@@ -5,21 +5,27 @@ Orchestrates multiple AI agents with oversight, validation, and continuous learn
 """
 
 import asyncio
+import functools
 import hashlib
+import importlib
 import json
+import logging
 import pickle
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import joblib
 import numpy as np
+import orjson
 from sklearn.cluster import DBSCAN
 from sklearn.ensemble import RandomForestClassifier
 
+from .analysis_bunker import AnalysisBunker, _epoch_seconds
+
 
 class AIAgentRole(Enum):
     COLLECTOR = "collector"           # Data gathering agents
@@ -54,6 +60,54 @@ class AIDecision:
     quality_score: float
     decision_tree: Dict[str, Any]
 
+# Seconds each orchestration phase may run before its agents are cancelled
+PHASE_TIMEOUT = 60.0
+
+# Samples of per-agent performance history kept for rolling statistics
+PERFORMANCE_HISTORY_SIZE = 1000
+
+# Log labels for each role's agents
+_ROLE_LABELS = {
+    AIAgentRole.COLLECTOR: "Collector",
+    AIAgentRole.ANALYZER: "Analyzer",
+    AIAgentRole.VALIDATOR: "Validator",
+    AIAgentRole.CORRELATOR: "Correlator",
+    AIAgentRole.DECISION_MAKER: "Decision agent",
+    AIAgentRole.OVERSIGHT: "Oversight agent",
+}
+
+# Core platform agents: (platform, module, class, agent_id, role, capabilities, weight).
+# Modules are imported on first use so unused platforms never pay their import cost.
+# Facebook and Instagram registrations will be added once their agents are implemented.
+_DEFAULTS = (
+    ('linkedin', 'agents.linkedin_agent', 'LinkedInAgent', 'linkedin_enterprise', AIAgentRole.COLLECTOR,
+     ['email_search', 'profile_extraction', 'professional_analysis'], 0.9),
+    ('github', 'agents.github_agent', 'GitHubAgent', 'github_enterprise', AIAgentRole.COLLECTOR,
+     ['email_search', 'code_analysis', 'activity_tracking'], 0.8),
+    ('twitter', 'agents.twitter_agent', 'TwitterAgent', 'twitter_enterprise', AIAgentRole.COLLECTOR,
+     ['email_search', 'phone_search', 'social_analysis'], 0.7),
+)
+
+@functools.cache
+def _load_agent_class(module_path: str, class_name: str) -> type:
+    """Import an agent module on demand and return the agent class"""
+    return getattr(importlib.import_module(module_path), class_name)
+
+_DECISION_KEY_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _decision_key(decision: Any) -> int:
+    """Non-cryptographic group key for a decision payload, independent of dict key order"""
+    payload = orjson.dumps(decision, default=repr, option=_DECISION_KEY_OPTIONS)
+    digest = hashlib.blake2b(payload, digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+async def _settled(coro) -> Any:
+    """Await a coroutine, returning its exception instead of raising it"""
+    try:
+        return await coro
+    except Exception as e:
+        return e
+
 class AIHierarchyManager:
     """
     ENTERPRISE AI HIERARCHY MANAGEMENT
@@ -73,9 +127,15 @@ class AIHierarchyManager:
             AIAgentRole.OVERSIGHT: {}
         }
         
+        # Wall-clock budget for each orchestration phase
+        self.phase_timeout = PHASE_TIMEOUT
+        
         # Performance tracking
         self.agent_metrics = {}
-        self.performance_history = defaultdict(list)
+        # Latest success rate per agent, used as its aggregation weight
+        self._agent_weight = defaultdict(lambda: 0.5)
+        # Rolling window of recent samples per agent, bounded to cap memory
+        self.performance_history = defaultdict(lambda: deque(maxlen=PERFORMANCE_HISTORY_SIZE))
         
         # ML Models
         self.behavioral_cluster_model = None
@@ -93,18 +153,19 @@ class AIHierarchyManager:
     def register_agent(self, agent_id: str, agent_instance: Any, role: AIAgentRole, 
                       capabilities: List[str], weight: float = 1.0):
         """Register an AI agent in the hierarchy"""
+        now = datetime.now()
         self.agent_registry[role][agent_id] = {
             'instance': agent_instance,
             'capabilities': capabilities,
             'weight': weight,
-            'registered_at': datetime.now(),
+            'registered_at': now,
             'performance': AgentMetrics(
                 success_rate=0.0,
                 average_confidence=0.0,
                 response_time=0.0,
                 error_rate=0.0,
                 data_quality=0.0,
-                last_calibration=datetime.now()
+                last_calibration=now
             )
         }
         
@@ -114,7 +175,7 @@ class AIHierarchyManager:
         """
         Orchestrate multi-agent analysis with hierarchical decision making
         """
-        analysis_id = f"analysis_{hashlib.md5(target.encode()).hexdigest()[:8]}"
+        analysis_id = f"analysis_{hashlib.blake2b(target.encode(), digest_size=4).hexdigest()}"
         
         self.logger.info(f"🎯 Orchestrating hierarchical analysis for: {target}")
         
@@ -142,7 +203,7 @@ class AIHierarchyManager:
             'collection_results': collection_results,
             'analysis_results': analysis_results,
             'final_decision': quality_assured_decision,
-            'timestamp': datetime.now()
+            'timestamp': time.time()
         })
         
         # Update agent performance metrics
@@ -154,24 +215,11 @@ class AIHierarchyManager:
         """Execute data collection using collector agents"""
         self.logger.info("📥 Phase 1: Data Collection")
         
-        collection_tasks = []
-        collector_agents = self.agent_registry[AIAgentRole.COLLECTOR]
-        
-        for agent_id, agent_data in collector_agents.items():
-            task = self._execute_agent_with_oversight(
-                agent_data, 'collect_data', target, context
-            )
-            collection_tasks.append((agent_id, task))
-        
         # Execute all collectors concurrently
-        results = {}
-        for agent_id, task in collection_tasks:
-            try:
-                result = await task
-                results[agent_id] = result
-            except Exception as e:
-                self.logger.error(f"❌ Collector {agent_id} failed: {e}")
-                results[agent_id] = {'error': str(e)}
+        results, errors = await self._run_agents(
+            AIAgentRole.COLLECTOR, 'collect_data', target, context
+        )
+        results.update((agent_id, {'error': str(e)}) for agent_id, e in errors.items())
         
         return {
             'raw_data': results,
@@ -183,22 +231,9 @@ class AIHierarchyManager:
         """Execute multi-dimensional analysis using analyzer agents"""
         self.logger.info("🔍 Phase 2: Multi-dimensional Analysis")
         
-        analysis_tasks = []
-        analyzer_agents = self.agent_registry[AIAgentRole.ANALYZER]
-        
-        for agent_id, agent_data in analyzer_agents.items():
-            task = self._execute_agent_with_oversight(
-                agent_data, 'analyze_data', collection_results, context
-            )
-            analysis_tasks.append((agent_id, task))
-        
-        analysis_results = {}
-        for agent_id, task in analysis_tasks:
-            try:
-                result = await task
-                analysis_results[agent_id] = result
-            except Exception as e:
-                self.logger.error(f"❌ Analyzer {agent_id} failed: {e}")
+        analysis_results, _ = await self._run_agents(
+            AIAgentRole.ANALYZER, 'analyze_data', collection_results, context
+        )
         
         # Apply ML-based analysis aggregation
         aggregated_analysis = await self._aggregate_analysis_with_ml(analysis_results)
@@ -213,22 +248,9 @@ class AIHierarchyManager:
         """Execute cross-validation using validator agents"""
         self.logger.info("✅ Phase 3: Cross-Validation")
         
-        validation_tasks = []
-        validator_agents = self.agent_registry[AIAgentRole.VALIDATOR]
-        
-        for agent_id, agent_data in validator_agents.items():
-            task = self._execute_agent_with_oversight(
-                agent_data, 'validate_analysis', analysis_results
-            )
-            validation_tasks.append((agent_id, task))
-        
-        validation_results = {}
-        for agent_id, task in validation_tasks:
-            try:
-                result = await task
-                validation_results[agent_id] = result
-            except Exception as e:
-                self.logger.error(f"❌ Validator {agent_id} failed: {e}")
+        validation_results, _ = await self._run_agents(
+            AIAgentRole.VALIDATOR, 'validate_analysis', analysis_results
+        )
         
         # Calculate validation confidence
         validation_confidence = await self._calculate_validation_confidence(validation_results)
@@ -243,22 +265,9 @@ class AIHierarchyManager:
         """Execute pattern correlation using correlator agents"""
         self.logger.info("🔄 Phase 4: Pattern Correlation")
         
-        correlation_tasks = []
-        correlator_agents = self.agent_registry[AIAgentRole.CORRELATOR]
-        
-        for agent_id, agent_data in correlator_agents.items():
-            task = self._execute_agent_with_oversight(
-                agent_data, 'correlate_patterns', validation_results
-            )
-            correlation_tasks.append((agent_id, task))
-        
-        correlation_results = {}
-        for agent_id, task in correlation_tasks:
-            try:
-                result = await task
-                correlation_results[agent_id] = result
-            except Exception as e:
-                self.logger.error(f"❌ Correlator {agent_id} failed: {e}")
+        correlation_results, _ = await self._run_agents(
+            AIAgentRole.CORRELATOR, 'correlate_patterns', validation_results
+        )
         
         # Apply ML-based pattern recognition
         ml_correlations = await self._apply_ml_correlation(correlation_results)
@@ -273,22 +282,9 @@ class AIHierarchyManager:
         """Execute hierarchical decision making"""
         self.logger.info("🎯 Phase 5: Hierarchical Decision Making")
         
-        decision_tasks = []
-        decision_agents = self.agent_registry[AIAgentRole.DECISION_MAKER]
-        
-        for agent_id, agent_data in decision_agents.items():
-            task = self._execute_agent_with_oversight(
-                agent_data, 'make_decision', correlation_results
-            )
-            decision_tasks.append((agent_id, task))
-        
-        agent_decisions = {}
-        for agent_id, task in decision_tasks:
-            try:
-                result = await task
-                agent_decisions[agent_id] = result
-            except Exception as e:
-                self.logger.error(f"❌ Decision agent {agent_id} failed: {e}")
+        agent_decisions, _ = await self._run_agents(
+            AIAgentRole.DECISION_MAKER, 'make_decision', correlation_results
+        )
         
         # Weighted decision aggregation
         final_decision = await self._aggregate_decisions(agent_decisions)
@@ -299,38 +295,58 @@ class AIHierarchyManager:
         """Execute quality control and oversight"""
         self.logger.info("👑 Phase 6: Quality Oversight")
         
-        oversight_tasks = []
-        oversight_agents = self.agent_registry[AIAgentRole.OVERSIGHT]
-        
-        for agent_id, agent_data in oversight_agents.items():
-            task = self._execute_agent_with_oversight(
-                agent_data, 'review_decision', decision
-            )
-            oversight_tasks.append((agent_id, task))
-        
-        oversight_reviews = {}
-        for agent_id, task in oversight_tasks:
-            try:
-                result = await task
-                oversight_reviews[agent_id] = result
-            except Exception as e:
-                self.logger.error(f"❌ Oversight agent {agent_id} failed: {e}")
+        oversight_reviews, _ = await self._run_agents(
+            AIAgentRole.OVERSIGHT, 'review_decision', decision
+        )
         
         # Apply oversight adjustments
         quality_assured_decision = await self._apply_oversight_corrections(decision, oversight_reviews)
         
         return quality_assured_decision
     
-    async def _execute_agent_with_oversight(self, agent_data: Dict, method: str, *args) -> Any:
+    async def _run_agents(self, role: AIAgentRole, method: str,
+                          *args) -> Tuple[Dict[str, Any], Dict[str, BaseException]]:
+        """Run a method on every agent of a role concurrently, splitting results from failures
+        
+        Agent failures are collected rather than cancelling sibling agents; the
+        phase as a whole is bounded by ``phase_timeout``.
+        """
+        handles = {}
+        try:
+            # One deadline for the whole phase; agents still running when it passes are cancelled
+            async with asyncio.timeout(self.phase_timeout), asyncio.TaskGroup() as tg:
+                for agent_id, agent_data in self.agent_registry[role].items():
+                    handles[agent_id] = tg.create_task(_settled(
+                        self._execute_agent_with_oversight(agent_id, agent_data, method, *args)
+                    ))
+        except TimeoutError:
+            self.logger.warning(f"⏱️ {role.value} phase exceeded its {self.phase_timeout}s budget")
+        
+        results, errors = {}, {}
+        for agent_id, handle in handles.items():
+            if handle.cancelled():
+                outcome = TimeoutError(f"phase budget of {self.phase_timeout}s exceeded")
+            else:
+                outcome = handle.result()
+            
+            if isinstance(outcome, BaseException):
+                self.logger.error(f"❌ {_ROLE_LABELS[role]} {agent_id} failed: {outcome}")
+                errors[agent_id] = outcome
+            else:
+                results[agent_id] = outcome
+        
+        return results, errors
+    
+    async def _execute_agent_with_oversight(self, agent_id: str, agent_data: Dict,
+                                            method: str, *args) -> Any:
         """Execute agent method with performance monitoring and error handling"""
-        agent = agent_data['instance']
-        agent_id = [k for k, v in self.agent_registry.items() if agent_data in v.values()][0]
+        agent_method = getattr(agent_data['instance'], method, None)
         
         start_time = time.time()
         
         try:
-            if hasattr(agent, method):
-                result = await getattr(agent, method)(*args)
+            if agent_method is not None:
+                result = await agent_method(*args)
                 
                 # Update performance metrics
                 execution_time = time.time() - start_time
@@ -351,8 +367,7 @@ class AIHierarchyManager:
         weighted_analyses = {}
         
         for agent_id, analysis in analysis_results.items():
-            agent_performance = self.agent_metrics.get(agent_id, {}).get('success_rate', 0.5)
-            weight = agent_performance  # Higher performance = higher weight
+            weight = self._agent_weight[agent_id]  # Higher performance = higher weight
             
             # Apply weight to analysis confidence
             if 'confidence' in analysis:
@@ -371,51 +386,49 @@ class AIHierarchyManager:
     
     async def _cluster_similar_analyses(self, analyses: Dict) -> List[List[str]]:
         """Cluster similar analyses using ML clustering"""
-        if not analyses:
-            return []
+        # Too few analyses for clustering to add any signal
+        if len(analyses) <= 3:
+            return [[agent_id] for agent_id in analyses]
         
-        # Convert analyses to feature vectors
-        feature_vectors = []
         agent_ids = list(analyses.keys())
         
-        for agent_id in agent_ids:
-            analysis = analyses[agent_id]
-            features = self._analysis_to_features(analysis)
-            feature_vectors.append(features)
-        
-        if len(feature_vectors) < 2:
-            return [agent_ids]
-        
         # Apply clustering
-        clustering = DBSCAN(eps=0.5, min_samples=1)
-        clusters = clustering.fit_predict(feature_vectors)
+        feature_matrix = self._analyses_to_features(list(analyses.values()))
+        clustering = DBSCAN(eps=0.5, min_samples=2, algorithm='ball_tree', leaf_size=16, n_jobs=-1)
+        clusters = clustering.fit_predict(feature_matrix)
         
-        # Group agent IDs by cluster
+        # Group agent IDs by cluster; noise points (-1) stand alone
         cluster_groups = defaultdict(list)
+        singletons = []
         for agent_id, cluster_id in zip(agent_ids, clusters):
-            cluster_groups[cluster_id].append(agent_id)
+            if cluster_id == -1:
+                singletons.append([agent_id])
+            else:
+                cluster_groups[cluster_id].append(agent_id)
         
-        return list(cluster_groups.values())
+        return list(cluster_groups.values()) + singletons
     
-    def _analysis_to_features(self, analysis: Dict) -> List[float]:
-        """Convert analysis to feature vector for clustering"""
-        features = []
+    def _analyses_to_features(self, analyses: List[Dict]) -> np.ndarray:
+        """Convert analyses to an (n, 4) float32 feature matrix for clustering
         
-        # Confidence feature
-        features.append(analysis.get('confidence', 0.5))
-        
-        # Data completeness feature
-        features.append(analysis.get('data_completeness', 0.5))
-        
-        # Pattern strength feature
-        features.append(analysis.get('pattern_strength', 0.5))
-        
-        # Timeliness feature (recent analysis gets higher weight)
-        if 'timestamp' in analysis:
-            recency = (datetime.now() - analysis['timestamp']).total_seconds() / 3600
-            features.append(max(0, 1 - recency / 24))  # Decay over 24 hours
-        else:
-            features.append(0.5)
+        Columns: confidence, data completeness, pattern strength, and
+        timeliness (recent analyses score higher, decaying over 24 hours).
+        Timestamps may be datetimes or epoch seconds.
+        """
+        n = len(analyses)
+        features = np.empty((n, 4), dtype=np.float32)
+        features[:, 0] = [a.get('confidence', 0.5) for a in analyses]
+        features[:, 1] = [a.get('data_completeness', 0.5) for a in analyses]
+        features[:, 2] = [a.get('pattern_strength', 0.5) for a in analyses]
+        
+        has_timestamp = np.fromiter(('timestamp' in a for a in analyses), dtype=bool, count=n)
+        now = time.time()
+        timestamps = np.fromiter(
+            (_epoch_seconds(a['timestamp']) if 'timestamp' in a else now for a in analyses),
+            dtype=np.float64, count=n
+        )
+        recency_hours = (now - timestamps) / 3600
+        features[:, 3] = np.where(has_timestamp, np.maximum(0, 1 - recency_hours / 24), 0.5)
         
         return features
     
@@ -431,24 +444,27 @@ class AIHierarchyManager:
                 decision_tree={}
             )
         
-        # Weight decisions by agent performance
+        # Weight decisions by agent performance; group keys are hashed once here
+        # and kept beside the entries rather than in them
         weighted_decisions = []
+        decision_keys = []
         total_weight = 0
         
         for agent_id, decision in agent_decisions.items():
-            agent_weight = self.agent_metrics.get(agent_id, {}).get('success_rate', 0.5)
+            agent_weight = self._agent_weight[agent_id]
             weighted_decisions.append({
                 'decision': decision,
                 'weight': agent_weight,
                 'agent_id': agent_id
             })
+            decision_keys.append(_decision_key(decision))
             total_weight += agent_weight
         
         if total_weight == 0:
             total_weight = 1  # Prevent division by zero
         
         # Find consensus decision
-        consensus_decision = await self._find_consensus_decision(weighted_decisions)
+        consensus_decision = await self._find_consensus_decision(weighted_decisions, decision_keys)
         
         return AIDecision(
             primary_decision=consensus_decision['decision'],
@@ -459,36 +475,35 @@ class AIHierarchyManager:
             decision_tree=consensus_decision['decision_tree']
         )
     
-    async def _find_consensus_decision(self, weighted_decisions: List[Dict]) -> Dict[str, Any]:
-        """Find consensus among weighted decisions"""
-        # Group similar decisions
+    async def _find_consensus_decision(self, weighted_decisions: List[Dict],
+                                       decision_keys: List[int]) -> Dict[str, Any]:
+        """Find consensus among weighted decisions, grouped by their parallel keys"""
+        # Group similar decisions, totalling each group's weight in the same pass
         decision_groups = defaultdict(list)
+        group_weight = defaultdict(float)
         
-        for wd in weighted_decisions:
-            decision_hash = hashlib.md5(str(wd['decision']).encode()).hexdigest()
+        for wd, decision_hash in zip(weighted_decisions, decision_keys):
             decision_groups[decision_hash].append(wd)
+            group_weight[decision_hash] += wd['weight']
         
         # Find group with highest total weight
-        best_group = None
-        max_weight = 0
-        
-        for group_hash, decisions in decision_groups.items():
-            group_weight = sum(d['weight'] for d in decisions)
-            if group_weight > max_weight:
-                max_weight = group_weight
-                best_group = decisions
+        best_hash = max(group_weight, key=group_weight.get, default=None)
+        max_weight = group_weight[best_hash] if best_hash is not None else 0
         
-        if not best_group:
+        if max_weight <= 0:
             return {'decision': None, 'confidence': 0.0, 'supporting_evidence': [], 
                     'dissenting_opinions': [], 'quality_score': 0.0, 'decision_tree': {}}
         
+        best_group = decision_groups[best_hash]
+        
         # Calculate confidence based on group weight and agreement
-        total_possible_weight = sum(d['weight'] for d in weighted_decisions)
+        total_possible_weight = sum(group_weight.values())
         confidence = max_weight / total_possible_weight if total_possible_weight > 0 else 0
         
-        # Collect supporting and dissenting evidence
-        supporting_evidence = [d for d in weighted_decisions if d in best_group]
-        dissenting_opinions = [d for d in weighted_decisions if d not in best_group]
+        # Collect supporting and dissenting evidence (by identity, not dict equality)
+        best_ids = {id(d) for d in best_group}
+        supporting_evidence = list(best_group)
+        dissenting_opinions = [d for d in weighted_decisions if id(d) not in best_ids]
         
         return {
             'decision': best_group[0]['decision'],
@@ -501,47 +516,41 @@ class AIHierarchyManager:
     
     async def _update_agent_metrics(self, agent_id: str, execution_time: float, success: bool):
         """Update agent performance metrics"""
-        if agent_id not in self.agent_metrics:
-            self.agent_metrics[agent_id] = {
+        metrics = self.agent_metrics.get(agent_id)
+        if metrics is None:
+            metrics = self.agent_metrics[agent_id] = {
                 'success_count': 0,
                 'total_time': 0.0,
                 'failure_count': 0,
                 'last_execution': None
             }
-        # ... (rest of method implementation would follow here)
+        
+        metrics['success_count' if success else 'failure_count'] += 1
+        metrics['total_time'] += execution_time
+        metrics['last_execution'] = time.time()
+        
+        success_rate = metrics['success_count'] / (metrics['success_count'] + metrics['failure_count'])
+        metrics['success_rate'] = success_rate
+        self._agent_weight[agent_id] = success_rate
 
-    async def initialize_default_agents(self):
-    """Initialize the core platform agents"""
-    from agents.linkedin_agent import LinkedInAgent
-    from agents.github_agent import GitHubAgent
-    from agents.twitter_agent import TwitterAgent
-    from agents.facebook_agent import FacebookAgent
-    from agents.instagram_agent import InstagramAgent
-    
-    # Register core agents
-    self.register_agent(
-        agent_id="linkedin_enterprise",
-        agent_instance=LinkedInAgent(),
-        role=AIAgentRole.COLLECTOR,
-        capabilities=['email_search', 'profile_extraction', 'professional_analysis'],
-        weight=0.9
-    )
-    
-    self.register_agent(
-        agent_id="github_enterprise", 
-        agent_instance=GitHubAgent(),
-        role=AIAgentRole.COLLECTOR,
-        capabilities=['email_search', 'code_analysis', 'activity_tracking'],
-        weight=0.8
-    )
-    
-    self.register_agent(
-        agent_id="twitter_enterprise",
-        agent_instance=TwitterAgent(), 
-        role=AIAgentRole.COLLECTOR,
-        capabilities=['email_search', 'phone_search', 'social_analysis'],
-        weight=0.7
-    )
+    async def initialize_default_agents(self, enabled_platforms: Optional[Iterable[str]] = None):
+        """Initialize the core platform agents, importing only enabled platforms"""
+        enabled = None if enabled_platforms is None else set(enabled_platforms)
+        
+        for platform, module_path, class_name, agent_id, role, capabilities, weight in _DEFAULTS:
+            if enabled is not None and platform not in enabled:
+                continue
+            
+            agent_class = _load_agent_class(module_path, class_name)
+            self.register_agent(
+                agent_id=agent_id,
+                agent_instance=agent_class(),
+                role=role,
+                capabilities=capabilities,
+                weight=weight
+            )
     
-    # Add similar registrations for Facebook and Instagram
-    # (These would be implemented next)
+    async def cleanup(self):
+        """Flush pending bunker writes and release the bunker's database"""
+        await self.analysis_bunker.close()
+        self.logger.info("👑 AI Hierarchy Manager shut down")
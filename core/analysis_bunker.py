@@ -5,17 +5,90 @@ Deep storage and ML-powered pattern recognition for historical analysis
 
 import asyncio
 import hashlib
-import json
+import logging
 import sqlite3
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import joblib
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.feature_extraction.text import TfidfVectorizer
+import orjson
+from scipy import sparse
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.feature_extraction.text import HashingVectorizer
+
+# Analyses carry datetimes, numpy scalars and non-string (hash) keys
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+_EMPTY_JSON_LIST = '[]'
+
+# Width of the hashed similarity feature rows
+SIMILARITY_FEATURES = 4096
+
+# Write-behind queue bound, and most analyses persisted per transaction
+WRITE_QUEUE_SIZE = 10000
+WRITE_BATCH_SIZE = 64
+
+# Behavioral clusters are trained online, one mini-batch of new analyses at a time
+CLUSTER_BATCH_SIZE = 32
+# Largest center movement tolerated before the cluster model is re-saved
+CLUSTER_SHIFT_TOLERANCE = 1e-3
+
+# Nesting depth searched for location fields, and share of night activity deemed nocturnal
+LOCATION_SEARCH_DEPTH = 6
+NOCTURNAL_ACTIVITY_RATIO = 0.7
+
+
+def _epoch_seconds(timestamp: Any) -> int:
+    """Unix epoch seconds for a datetime or numeric timestamp, defaulting to now"""
+    if timestamp is None:
+        return int(time.time())
+    if isinstance(timestamp, datetime):
+        return int(timestamp.timestamp())
+    return int(timestamp)
+
+# Stored feature rows are sparse: nnz int32 column indices followed by nnz float32 values
+_SPARSE_SCHEMA_VERSION = 1
+
+def _encode_sparse(row: sparse.csr_matrix) -> bytes:
+    """Pack one CSR feature row as index and value bytes"""
+    return row.indices.astype(np.int32).tobytes() + row.data.astype(np.float32).tobytes()
+
+def _decode_sparse(blob: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """Unpack a stored feature row into (indices, values) arrays"""
+    nnz = len(blob) // 8
+    return (np.frombuffer(blob, dtype=np.int32, count=nnz),
+            np.frombuffer(blob, dtype=np.float32, count=nnz, offset=4 * nnz))
+
+def _stack_sparse(blobs: List[bytes]) -> sparse.csr_matrix:
+    """Stack stored feature rows into one CSR matrix"""
+    decoded = [_decode_sparse(blob) for blob in blobs]
+    indptr = np.zeros(len(decoded) + 1, dtype=np.int64)
+    np.cumsum([len(indices) for indices, _ in decoded], out=indptr[1:])
+    if decoded:
+        indices = np.concatenate([indices for indices, _ in decoded])
+        data = np.concatenate([data for _, data in decoded])
+    else:
+        indices, data = np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(decoded), SIMILARITY_FEATURES))
+
+# Cluster models by file path, so every bunker in a process shares one instance
+_CLUSTER_MODELS: Dict[Path, MiniBatchKMeans] = {}
+
+def _shared_cluster_model(path: Path) -> MiniBatchKMeans:
+    """Return the cluster model for a path, reading it from disk at most once per process"""
+    model = _CLUSTER_MODELS.get(path)
+    if model is None:
+        if path.exists():
+            # Copy-on-write mapping keeps arrays shared across forked workers until trained
+            model = joblib.load(path, mmap_mode='c')
+        else:
+            model = MiniBatchKMeans(n_clusters=10, batch_size=CLUSTER_BATCH_SIZE, n_init='auto')
+        _CLUSTER_MODELS[path] = model
+    return model
 
 
 @dataclass
@@ -41,10 +114,20 @@ class AnalysisBunker:
         self.logger = logging.getLogger("analysis_bunker")
         
         # ML Components
-        self.behavior_cluster_model = KMeans(n_clusters=10)
-        self.similarity_vectorizer = TfidfVectorizer(max_features=1000)
+        self.behavior_cluster_model = None  # Shared per process, see _load_ml_models
+        self.cluster_model_path = self.bunker_path.with_name('behavior_clusters.joblib')
+        self._cluster_buffer: List[bytes] = []
+        self._saved_centers: Optional[np.ndarray] = None
+        # Stateless hashing-trick features: no vocabulary to fit or persist
+        self.similarity_vectorizer = HashingVectorizer(
+            n_features=SIMILARITY_FEATURES, alternate_sign=False, norm='l2'
+        )
         self.pattern_detector = None
         
+        # Write-behind queue, drained by a flusher task started on first store
+        self._write_queue: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._flusher_task: Optional[asyncio.Task] = None
+        
         # Initialize database
         self._init_database()
         self._load_ml_models()
@@ -52,9 +135,13 @@ class AnalysisBunker:
         self.logger.info("🏰 Analysis Bunker initialized")
     
     def _init_database(self):
-        """Initialize bunker database"""
-        conn = sqlite3.connect(self.bunker_path)
-        cursor = conn.cursor()
+        """Initialize bunker database and its persistent connection"""
+        # Shared across worker threads; _db_lock serializes access
+        self._conn = sqlite3.connect(self.bunker_path, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        cursor = self._conn.cursor()
         
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS analyses (
@@ -65,10 +152,28 @@ class AnalysisBunker:
                 patterns_detected TEXT,
                 similarity_score REAL,
                 cluster_assignment INTEGER,
+                tfidf_vector BLOB,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
+        # Bunkers created before similarity vectors were persisted
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(analyses)')}
+        if 'tfidf_vector' not in columns:
+            cursor.execute('ALTER TABLE analyses ADD COLUMN tfidf_vector BLOB')
+        
+        # Bunkers whose feature rows were stored dense: re-encode them sparse once
+        if cursor.execute('PRAGMA user_version').fetchone()[0] < _SPARSE_SCHEMA_VERSION:
+            dense_rows = cursor.execute(
+                'SELECT analysis_id, tfidf_vector FROM analyses WHERE tfidf_vector IS NOT NULL'
+            ).fetchall()
+            cursor.executemany('UPDATE analyses SET tfidf_vector = ? WHERE analysis_id = ?', [
+                (_encode_sparse(sparse.csr_matrix(np.frombuffer(blob, dtype=np.float32)[np.newaxis, :]))
+                 if len(blob) == SIMILARITY_FEATURES * 4 else None, analysis_id)
+                for analysis_id, blob in dense_rows
+            ])
+            cursor.execute(f'PRAGMA user_version = {_SPARSE_SCHEMA_VERSION}')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS behavioral_patterns (
                 pattern_id TEXT PRIMARY KEY,
@@ -91,36 +196,105 @@ class AnalysisBunker:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Indexes for recent-analysis, cluster, target and pattern lookups
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_analyses_created ON analyses(created_at DESC)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_analyses_cluster ON analyses(cluster_assignment)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_analyses_target ON analyses(target)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_sim_target ON similarity_index(target_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_patterns_type ON behavioral_patterns(pattern_type)')
+        
+        self._conn.commit()
     
     async def store_analysis(self, analysis_id: str, analysis_data: Dict[str, Any]):
-        """Store analysis in bunker and process for patterns"""
-        self.logger.info(f"💾 Storing analysis {analysis_id} in bunker")
+        """Queue analysis for storage and pattern processing by the background flusher"""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher())
         
-        # Store in database
-        conn = sqlite3.connect(self.bunker_path)
-        cursor = conn.cursor()
+        # Only waits when the queue is full, applying backpressure
+        await self._write_queue.put((analysis_id, analysis_data))
+    
+    async def flush(self):
+        """Wait until every queued analysis has been stored and processed"""
+        await self._write_queue.join()
+    
+    async def close(self):
+        """Persist every queued analysis, then stop the flusher and close the database"""
+        task = self._flusher_task
+        if task is not None and not task.done():
+            await self.flush()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._flusher_task = None
         
-        cursor.execute('''
-            INSERT OR REPLACE INTO analyses 
-            (analysis_id, target, analysis_data, timestamp, patterns_detected, similarity_score, cluster_assignment)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            analysis_id,
-            analysis_data.get('target', ''),
-            json.dumps(analysis_data, default=str),
-            analysis_data.get('timestamp', datetime.now()),
-            json.dumps([]),  # Will be updated after pattern detection
-            0.0,  # Will be updated after similarity analysis
-            -1  # Will be updated after clustering
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._db_lock:
+            self._conn.close()
+        self.logger.info("🏰 Analysis Bunker closed")
+    
+    async def _flusher(self):
+        """Drain the write queue in batches, off the callers' critical path"""
+        while True:
+            batch = [await self._write_queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE and not self._write_queue.empty():
+                batch.append(self._write_queue.get_nowait())
+            
+            try:
+                await self._bulk_persist(batch)
+            except Exception as e:
+                self.logger.error(f"❌ Failed to store {len(batch)} analyses: {e}")
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    async def _bulk_persist(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """Store a batch of analyses in one transaction, then process each for patterns"""
+        self.logger.info(f"💾 Storing {len(batch)} analyses in bunker")
+        
+        # Store in database off the event loop
+        await asyncio.to_thread(self._insert_analyses, batch)
         
         # Process for patterns and similarities
-        await self._process_new_analysis(analysis_id, analysis_data)
+        for analysis_id, analysis_data in batch:
+            try:
+                await self._process_new_analysis(analysis_id, analysis_data)
+            except Exception as e:
+                self.logger.error(f"❌ Failed to process analysis {analysis_id}: {e}")
+    
+    def _insert_analyses(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """Insert new analysis rows (runs in a worker thread)"""
+        rows = []
+        for analysis_id, analysis_data in batch:
+            document = orjson.dumps(analysis_data, default=str, option=_ORJSON_OPTIONS).decode()
+            rows.append((
+                analysis_id,
+                analysis_data.get('target', ''),
+                document,
+                _epoch_seconds(analysis_data.get('timestamp')),
+                _EMPTY_JSON_LIST,  # Will be updated after pattern detection
+                0.0,  # Will be updated after similarity analysis
+                -1,  # Will be updated after clustering
+                self._vectorize(document)
+            ))
+        
+        with self._db_lock, self._conn:
+            self._conn.executemany('''
+                INSERT OR REPLACE INTO analyses
+                (analysis_id, target, analysis_data, timestamp, patterns_detected, similarity_score,
+                 cluster_assignment, tfidf_vector)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+    
+    def _vectorize(self, document: str) -> bytes:
+        """Unit-length sparse feature row for an analysis document, packed as bytes"""
+        return _encode_sparse(self.similarity_vectorizer.transform([document]))
+    
+    def _load_ml_models(self):
+        """Attach the process-wide behavioral cluster model for this bunker"""
+        model = self.behavior_cluster_model = _shared_cluster_model(self.cluster_model_path.resolve())
+        if hasattr(model, 'cluster_centers_'):
+            self._saved_centers = model.cluster_centers_.copy()
     
     async def _process_new_analysis(self, analysis_id: str, analysis_data: Dict[str, Any]):
         """Process new analysis for patterns and similarities"""
@@ -131,35 +305,36 @@ class AnalysisBunker:
         similarities = await self._calculate_similarities(analysis_id, analysis_data)
         
         # 3. Assign to behavioral cluster
-        cluster_id = await self._assign_to_cluster(analysis_data)
+        cluster_id = await self._assign_to_cluster(analysis_id)
         
         # 4. Update database with processed information
-        conn = sqlite3.connect(self.bunker_path)
-        cursor = conn.cursor()
+        await asyncio.to_thread(
+            self._update_processed_analysis, analysis_id, patterns, similarities, cluster_id
+        )
         
-        cursor.execute('''
-            UPDATE analyses 
-            SET patterns_detected = ?, similarity_score = ?, cluster_assignment = ?
-            WHERE analysis_id = ?
-        ''', (
-            json.dumps(patterns),
-            max([s['score'] for s in similarities]) if similarities else 0.0,
-            cluster_id,
-            analysis_id
-        ))
-        
-        # Store similarities
-        for similarity in similarities:
-            cursor.execute('''
-                INSERT OR REPLACE INTO similarity_index 
+        self.logger.info(f"✅ Processed analysis {analysis_id}: {len(patterns)} patterns, cluster {cluster_id}")
+    
+    def _update_processed_analysis(self, analysis_id: str, patterns: List[str],
+                                   similarities: List[Dict[str, Any]], cluster_id: int):
+        """Record patterns, similarities and cluster in one transaction (runs in a worker thread)"""
+        with self._db_lock, self._conn:
+            self._conn.execute('''
+                UPDATE analyses
+                SET patterns_detected = ?, similarity_score = ?, cluster_assignment = ?
+                WHERE analysis_id = ?
+            ''', (
+                orjson.dumps(patterns).decode(),
+                max([s['score'] for s in similarities]) if similarities else 0.0,
+                cluster_id,
+                analysis_id
+            ))
+            
+            # Store similarities
+            self._conn.executemany('''
+                INSERT OR REPLACE INTO similarity_index
                 (source_id, target_id, similarity_score, comparison_type)
                 VALUES (?, ?, ?, ?)
-            ''', (analysis_id, similarity['target_id'], similarity['score'], similarity['type']))
-        
-        conn.commit()
-        conn.close()
-        
-        self.logger.info(f"✅ Processed analysis {analysis_id}: {len(patterns)} patterns, cluster {cluster_id}")
+            ''', [(analysis_id, s['target_id'], s['score'], s['type']) for s in similarities])
     
     async def _detect_behavioral_patterns(self, analysis_data: Dict[str, Any]) -> List[str]:
         """Detect behavioral patterns in analysis data"""
@@ -196,19 +371,154 @@ class AnalysisBunker:
         
         return patterns
     
+    def _extract_locations(self, analysis_data: Dict[str, Any]) -> set:
+        """Distinct, case-folded location strings found anywhere in the analysis"""
+        locations = set()
+        stack = [(analysis_data, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > LOCATION_SEARCH_DEPTH:
+                continue
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if key in ('location', 'locations'):
+                        values = value if isinstance(value, (list, tuple, set)) else [value]
+                        locations.update(v.strip().casefold() for v in values if isinstance(v, str) and v.strip())
+                    elif isinstance(value, (dict, list, tuple)):
+                        stack.append((value, depth + 1))
+            elif isinstance(node, (list, tuple)):
+                stack.extend((item, depth + 1) for item in node if isinstance(item, (dict, list, tuple)))
+        return locations
+    
+    def _detect_nocturnal_pattern(self, behavioral_data: Dict[str, Any]) -> bool:
+        """Whether most observed activity falls in night hours (before 06:00 or after 22:00)"""
+        activity_hours = behavioral_data.get('activity_hours')
+        if not activity_hours:
+            return False
+        
+        # Either a list of observed hours or an hour -> count mapping
+        if isinstance(activity_hours, dict):
+            counts = [(int(hour), count) for hour, count in activity_hours.items()]
+        else:
+            counts = [(int(hour), 1) for hour in activity_hours]
+        
+        total = sum(count for _, count in counts)
+        if total < 3:
+            return False
+        night = sum(count for hour, count in counts if hour % 24 < 6 or hour % 24 > 22)
+        return night / total > NOCTURNAL_ACTIVITY_RATIO
+    
+    def _analyze_content_patterns(self, analysis_data: Dict[str, Any]) -> List[str]:
+        """Content-level patterns from the analysis' content summary"""
+        content = analysis_data.get('content_analysis') or {}
+        patterns = []
+        
+        if len(content.get('languages', ())) > 1:
+            patterns.append("MULTILINGUAL_CONTENT")
+        if content.get('duplicate_content_ratio', 0) > 0.5:
+            patterns.append("REPEATED_CONTENT")
+        if content.get('link_ratio', 0) > 0.5:
+            patterns.append("LINK_HEAVY_CONTENT")
+        
+        return patterns
+    
+    async def _store_new_patterns(self, patterns: List[str], analysis_data: Dict[str, Any]):
+        """Record detected patterns per target, counting repeat sightings"""
+        if not patterns:
+            return
+        
+        target = analysis_data.get('target', '')
+        seen_at = _epoch_seconds(analysis_data.get('timestamp'))
+        pattern_data = orjson.dumps({'target': target}).decode()
+        rows = [
+            (hashlib.sha1(f"{pattern}:{target}".encode()).hexdigest(), pattern, pattern_data, seen_at, seen_at)
+            for pattern in dict.fromkeys(patterns)
+        ]
+        await asyncio.to_thread(self._upsert_patterns, rows)
+    
+    def _upsert_patterns(self, rows: List[Tuple[str, str, str, int, int]]):
+        """Insert pattern sightings or bump existing ones (runs in a worker thread)"""
+        with self._db_lock, self._conn:
+            self._conn.executemany('''
+                INSERT INTO behavioral_patterns
+                (pattern_id, pattern_type, pattern_data, confidence, first_detected, last_seen)
+                VALUES (?, ?, ?, 1.0, ?, ?)
+                ON CONFLICT(pattern_id) DO UPDATE SET
+                    last_seen = excluded.last_seen,
+                    occurrence_count = occurrence_count + 1
+            ''', rows)
+    
     async def _calculate_similarities(self, new_analysis_id: str, new_analysis_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Calculate similarity with existing analyses"""
-        similarities = []
+        # Get recent analyses' stored feature rows for comparison
+        new_blob, recent = await asyncio.to_thread(self._get_recent_vectors, new_analysis_id, 100)
+        if new_blob is None:
+            return []
         
-        # Get recent analyses for comparison
-        recent_analyses = await self._get_recent_analyses(limit=100)
+        if not recent:
+            return []
         
-        for existing_analysis in recent_analyses:
-            if existing_analysis['analysis_id'] == new_analysis_id:
-                continue
-            
-            similarity_score = await self._calculate_analysis_similarity(
-                new_analysis_data, existing_analysis['analysis_data']
-            )
+        # Scatter the new row dense once; the stored rows stay sparse
+        indices, data = _decode_sparse(new_blob)
+        new_vector = np.zeros(SIMILARITY_FEATURES, dtype=np.float32)
+        new_vector[indices] = data
+        target_ids = [analysis_id for analysis_id, _ in recent]
+        
+        # Rows are stored unit-length, so cosine similarity is one sparse GEMV
+        scores = _stack_sparse([blob for _, blob in recent]) @ new_vector
+        return [
+            {'target_id': target_ids[i], 'score': float(scores[i]), 'type': 'hashed_cosine'}
+            for i in np.nonzero(scores > 0.6)[0]
+        ]
+    
+    def _get_recent_vectors(self, analysis_id: str, limit: int):
+        """Fetch an analysis' feature row and those of the most recent others (runs in a worker thread)"""
+        with self._db_lock:
+            row = self._conn.execute(
+                'SELECT tfidf_vector FROM analyses WHERE analysis_id = ?', (analysis_id,)
+            ).fetchone()
+            recent = self._conn.execute('''
+                SELECT analysis_id, tfidf_vector FROM analyses
+                WHERE analysis_id != ? AND tfidf_vector IS NOT NULL
+                ORDER BY created_at DESC
+                LIMIT ?
+            ''', (analysis_id, limit)).fetchall()
+        
+        return (row[0] if row else None), recent
+    
+    async def _assign_to_cluster(self, analysis_id: str) -> int:
+        """Assign an analysis to a behavioral cluster, training the model incrementally"""
+        blob = await asyncio.to_thread(self._get_vector, analysis_id)
+        if blob is None:
+            return -1
+        
+        vector = _stack_sparse([blob])
+        model = self.behavior_cluster_model
+        
+        # Fold new analyses into the model a mini-batch at a time; k-means takes CSR input
+        self._cluster_buffer.append(blob)
+        if len(self._cluster_buffer) >= CLUSTER_BATCH_SIZE:
+            batch = _stack_sparse(self._cluster_buffer)
+            self._cluster_buffer.clear()
+            model.partial_fit(batch)
             
-            if similarity_score > 0.6: 
+            # Only re-save the model when its centers have materially moved
+            centers = model.cluster_centers_
+            saved = self._saved_centers
+            if saved is None or saved.shape != centers.shape or not np.allclose(
+                centers, saved, atol=CLUSTER_SHIFT_TOLERANCE
+            ):
+                self._saved_centers = centers.copy()
+                await asyncio.to_thread(joblib.dump, model, self.cluster_model_path)
+        
+        if not hasattr(model, 'cluster_centers_'):
+            return -1
+        return int(model.predict(vector)[0])
+    
+    def _get_vector(self, analysis_id: str) -> Optional[bytes]:
+        """Fetch one analysis' stored feature row (runs in a worker thread)"""
+        with self._db_lock:
+            row = self._conn.execute(
+                'SELECT tfidf_vector FROM analyses WHERE analysis_id = ?', (analysis_id,)
+            ).fetchone()
+        return row[0] if row else None
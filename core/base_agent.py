@@ -1,41 +1,296 @@
 # core/base_agent.py
+import asyncio
 import logging
+import random
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any, Dict, List, Optional
-
-
-class Platform(Enum):
-    LINKEDIN = "linkedin"
-    GITHUB = "github"
-    TWITTER = "twitter"
-    FACEBOOK = "facebook"
-    INSTAGRAM = "instagram"
-
-
-@dataclass
-class ProfileData:
-    platform: Platform
-    profile_url: str
-    username: Optional[str] = None
-    full_name: Optional[str] = None
-    email: Optional[str] = None
-    phone: Optional[str] = None
-    location: Optional[str] = None
-    bio: Optional[str] = None
-    avatar_url: Optional[str] = None
-    last_activity: Optional[str] = None
-    confidence_score: float = 0.0
-    raw_data: Dict[str, Any] = None
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import aiohttp
+
+from .http_client import get_session
+from .schemas import PlatformType, ProfileData
+
+# Older callers import the platform enum under this name
+Platform = PlatformType
+
+_HEALTH_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Only these are safe to resend, and only on gateway/availability errors
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# 429 back-off in seconds when the reset header is absent / unreadable
+_RL_DEFAULT_BACKOFF = 300.0
+_RL_FALLBACK_BACKOFF = 3600.0
+
+
+def _frozen_config(base_url: str, required_headers: Dict[str, str]):
+    return MappingProxyType(
+        {
+            "base_url": base_url,
+            "required_headers": MappingProxyType(required_headers),
+        }
+    )
+
+
+# Built once at import; agents share these read-only mappings
+_PLATFORM_CONFIGS: Dict[str, Mapping[str, Any]] = {
+    "linkedin": _frozen_config(
+        "https://www.linkedin.com",
+        {
+            "Accept": "application/vnd.linkedin.normalized+json+2.1",
+            "X-Restli-Protocol-Version": "2.0.0",
+        },
+    ),
+    "github": _frozen_config(
+        "https://api.github.com",
+        {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+    ),
+    "twitter": _frozen_config(
+        "https://api.twitter.com", {"Accept": "application/json"}
+    ),
+    "facebook": _frozen_config(
+        "https://graph.facebook.com", {"Accept": "application/json"}
+    ),
+    "instagram": _frozen_config(
+        "https://www.instagram.com", {"Accept": "application/json"}
+    ),
+}
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
+class AgentMetrics:
+    total_requests: int = 0
+    successful_requests: int = 0
+    failed_requests: int = 0
+    avg_response_time: float = 0.0
+    last_request: Optional[float] = None  # epoch seconds
+    last_success: Optional[float] = None  # epoch seconds
 
 
 class BaseAgent(ABC):
     """Abstract base class for all platform agents"""
 
-    def __init__(self, platform: Platform):
+    # Default requests per second; subclasses override this, never rate_limit,
+    # so the rate_limit property (and its emission interval) stays in effect
+    base_rate_limit = 10
+
+    def __init__(self, platform: Platform, agent_name: Optional[str] = None):
         self.platform = platform
-        self.logger = logging.getLogger(f"{platform.value}_agent")
+        self.agent_name = agent_name or f"{platform.value}_agent"
+        self.logger = logging.getLogger(self.agent_name)
+        self.platform_config = self._load_platform_config()
+        self.timeout = 30
+        self.max_retries = 3
+        self.reset()
+
+        self.burst = 5
+        self.rate_limit = type(self).base_rate_limit  # requests per second
+
+        # Built once so each request only copies a small template
+        self._base_headers = tuple(
+            self.platform_config.get("required_headers", {}).items()
+        )
+        self._base_kwargs = {"timeout": aiohttp.ClientTimeout(total=self.timeout)}
+
+    def reset(self):
+        """Clear per-run state so a pooled instance starts like a new one"""
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.proxy: Optional[str] = None
+        self.metrics = AgentMetrics()
+
+        # time.monotonic() deadline set by the platform's 429 responses
+        self.rate_limit_reset = 0.0
+
+        # Searches in progress, so concurrent lookups share one round-trip
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # GCRA shaping: one theoretical arrival time instead of counters
+        self._tat = 0.0
+
+    @property
+    def rate_limit(self) -> float:
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, requests_per_second: float):
+        self._rate_limit = requests_per_second
+        self._emission_interval = 1.0 / requests_per_second
+
+    def _load_platform_config(self) -> Mapping[str, Any]:
+        """Platform endpoints, keyed by platform value"""
+        return _PLATFORM_CONFIGS.get(self.platform.value, _EMPTY_CONFIG)
+
+    async def __aenter__(self):
+        self.session = await get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
+
+    async def cleanup(self):
+        """Release the session reference; the shared session stays open"""
+        self.session = None
+
+    async def health_check(self) -> bool:
+        """Check that the platform endpoint is reachable"""
+        return await self._health_check_one(await get_session())
+
+    async def _health_check_one(self, session: aiohttp.ClientSession) -> bool:
+        test_url = self.platform_config.get("base_url")
+        if not test_url:
+            return False
+        try:
+            async with session.get(test_url, timeout=_HEALTH_TIMEOUT) as response:
+                return response.status < 500
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def _make_request(
+        self, method: str, url: str, **kwargs
+    ) -> Tuple[bool, Any]:
+        """Issue a request on the shared session, returning (success, body)"""
+        session = self.session or await get_session()
+        request_kwargs = self._base_kwargs.copy()
+        headers = dict(self._base_headers)
+        extra_headers = kwargs.pop("headers", None)
+        if extra_headers:
+            headers.update(extra_headers)
+        request_kwargs["headers"] = headers
+        if self.proxy:
+            request_kwargs["proxy"] = self.proxy
+        request_kwargs.update(kwargs)
+        if self._is_rate_limited():
+            return False, "rate limited"
+        await self._acquire_slot()
+
+        # max_retries counts resends after the first attempt
+        attempts = self.max_retries + 1 if method.upper() in _IDEMPOTENT_METHODS else 1
+        start = time.perf_counter()
+        success = False
+        try:
+            for attempt in range(1, attempts + 1):
+                outcome = await self._attempt(
+                    session, method, url, request_kwargs, final=attempt == attempts
+                )
+                if outcome is not None:
+                    success = outcome[0]
+                    return outcome
+                # Exponential backoff with jitter, on the same pooled connection
+                await asyncio.sleep(min(2 ** (attempt - 1), 30) + random.random())
+        finally:
+            self._record_request(success, time.perf_counter() - start)
+
+    async def _attempt(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        request_kwargs: Dict[str, Any],
+        final: bool,
+    ) -> Optional[Tuple[bool, Any]]:
+        """Send once and classify it: (success, body), or None to retry"""
+        try:
+            status, resp_headers, body = await self._send(
+                session, method, url, request_kwargs
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if not final:
+                return None
+            self.logger.debug("%s %s failed: %s", method, url, e)
+            return False, str(e)
+        if status in _RETRY_STATUSES and not final:
+            return None
+        if status == 200:
+            return True, body
+        if status == 429:
+            self._handle_rate_limit(resp_headers)
+        self.logger.debug("%s %s returned %s", method, url, status)
+        return False, body
+
+    async def _send(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        request_kwargs: Dict[str, Any],
+    ) -> Tuple[int, Mapping[str, str], str]:
+        async with session.request(method, url, **request_kwargs) as response:
+            return response.status, response.headers, await response.text()
+
+    def _record_request(self, success: bool, response_time: float):
+        metrics = self.metrics
+        metrics.total_requests += 1
+        metrics.avg_response_time += (
+            response_time - metrics.avg_response_time
+        ) / metrics.total_requests
+        metrics.last_request = time.time()
+        if success:
+            metrics.successful_requests += 1
+            metrics.last_success = metrics.last_request
+        else:
+            metrics.failed_requests += 1
+
+    def _is_rate_limited(self) -> bool:
+        return time.monotonic() < self.rate_limit_reset
+
+    async def _acquire_slot(self):
+        """Delay until the request conforms to rate_limit with burst headroom"""
+        now = time.monotonic()
+        tat = self._tat if self._tat > now else now
+        self._tat = tat + self._emission_interval
+        wait = tat - now - self._emission_interval * self.burst
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _handle_rate_limit(self, headers: Mapping[str, str]):
+        """Back off until the platform's advertised reset time"""
+        reset_header = headers.get("X-RateLimit-Reset")
+        if reset_header is None:
+            wait = _RL_DEFAULT_BACKOFF
+        else:
+            # Header carries epoch seconds; convert once to a relative wait
+            try:
+                wait = max(float(reset_header) - time.time(), 0.0)
+            except ValueError:
+                wait = _RL_FALLBACK_BACKOFF
+        self.rate_limit_reset = time.monotonic() + wait
+        self.logger.warning("Rate limited by %s for %.0fs", self.platform.value, wait)
+
+    async def search_with_context(
+        self, identifier: str, context: Dict = None
+    ) -> List[ProfileData]:
+        """Search by email or phone, coalescing concurrent identical lookups"""
+        pending = self._inflight.get(identifier)
+        if pending is not None:
+            return list(await asyncio.shield(pending))
+
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[identifier] = pending
+        try:
+            if "@" in identifier:
+                profiles = await self.search_by_email(identifier, context)
+            else:
+                profiles = await self.search_by_phone(identifier, context)
+            pending.set_result(profiles)
+            return list(profiles)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as e:
+            pending.set_exception(e)
+            # Mark as retrieved so an unawaited failure is not logged twice
+            pending.exception()
+            raise
+        finally:
+            del self._inflight[identifier]
 
     @abstractmethod
     async def search_by_email(
@@ -52,6 +307,15 @@ class BaseAgent(ABC):
         pass
 
 
+async def health_check_all(agents: List[BaseAgent]) -> List[Any]:
+    """Probe every agent's platform concurrently over the shared session"""
+    session = await get_session()
+    return await asyncio.gather(
+        *[agent._health_check_one(session) for agent in agents],
+        return_exceptions=True,
+    )
+
+
 class BaseSocialAgent(BaseAgent):
     """Base class for social media platforms"""
 
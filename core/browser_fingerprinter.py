@@ -1,41 +1,36 @@
 """
 Advanced Browser Fingerprinting
-Canvas, WebGL, AudioContext, Battery API, and more
+Canvas, WebGL and AudioContext
 """
 
+import functools
 import hashlib
 from typing import Any, Dict
 
 
+@functools.lru_cache(maxsize=None)
+def _hash_fingerprint(data: str) -> str:
+    """Identity digest for a rendered fingerprint source, computed once per input"""
+    return hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+
+
 class BrowserFingerprinter:
     async def collect_fingerprint(self) -> Dict[str, Any]:
         return {
-            "canvas_fingerprint": await self._get_canvas_fingerprint(),
-            "webgl_fingerprint": await self._get_webgl_fingerprint(),
-            "audio_fingerprint": await self._get_audio_fingerprint(),
-            "user_agent": await self._get_user_agent(),
-            "plugins": await self._get_browser_plugins(),
-            "timezone": await self._get_timezone(),
-            "screen_resolution": await self._get_screen_resolution(),
-            "battery_status": await self._get_battery_status(),
-            "hardware_concurrency": await self._get_hardware_concurrency(),
-            "device_memory": await self._get_device_memory(),
-            "touch_support": await self._get_touch_support(),
+            "canvas_fingerprint": self._get_canvas_fingerprint(),
+            "webgl_fingerprint": self._get_webgl_fingerprint(),
+            "audio_fingerprint": self._get_audio_fingerprint(),
         }
 
-    async def _get_canvas_fingerprint(self) -> str:
+    def _get_canvas_fingerprint(self) -> str:
         """Generate canvas fingerprint"""
         # Implementation for canvas fingerprinting
-        return hashlib.md5("canvas_data".encode()).hexdigest()
+        return _hash_fingerprint("canvas_data")
 
-    async def _get_webgl_fingerprint(self) -> str:
+    def _get_webgl_fingerprint(self) -> str:
         """Generate WebGL fingerprint"""
-        return hashlib.md5("webgl_data".encode()).hexdigest()
+        return _hash_fingerprint("webgl_data")
 
-    async def _get_audio_fingerprint(self) -> str:
+    def _get_audio_fingerprint(self) -> str:
         """Generate audio context fingerprint"""
-        return hashlib.md5("audio_data".encode()).hexdigest()
-
-    async def _get_battery_status(self) -> Dict[str, Any]:
-        """Get battery status via Battery API"""
-        return {"level": 0.85, "charging": True}
+        return _hash_fingerprint("audio_data")
@@ -1,120 +1,241 @@
 # core/caching.py
 import asyncio
-import pickle
+import dataclasses
+import hashlib
+import logging
+import time
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Optional
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
-import redis
+import orjson
+import redis.asyncio as aioredis
 
+# Leading byte on every stored value so the encoding can change without a flush
+_FORMAT_ORJSON = b"\x01"
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+_KEY_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
 
-class RedisCache:
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0):
-        self.redis = redis.Redis(host=host, port=port, db=db, decode_responses=False)
 
-    async def get(self, key: str) -> Optional[Any]:
-        loop = asyncio.get_event_loop()
-        try:
-            data = await loop.run_in_executor(None, self.redis.get, key)
-            if data:
-                return pickle.loads(data)
-        except Exception as e:
-            self.logger.error(f"Cache get failed for key {key}: {str(e)}")
-        return None
-
-    async def set(self, key: str, value: Any, expire: int = 3600) -> bool:
-        loop = asyncio.get_event_loop()
-        try:
-            serialized = pickle.dumps(value)
-            return await loop.run_in_executor(
-                None, self.redis.setex, key, expire, serialized
-            )
-        except Exception as e:
-            self.logger.error(f"Cache set failed for key {key}: {str(e)}")
-            return False
-
-    async def delete(self, key: str) -> bool:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.redis.delete, key)
-
-
-def cache_result(expire: int = 3600, key_prefix: str = ""):
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            cache = RedisCache()
+def _default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    raise TypeError(f"Type is not cacheable: {type(obj).__name__}")
 
-            # Generate cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{str(args)}:{str(kwargs)}"
 
-            # Try to get from cache
-            cached_result = await cache.get(cache_key)
-            if cached_result is not None:
-                return cached_result
+def _key_default(obj: Any) -> Any:
+    try:
+        return _default(obj)
+    except TypeError:
+        return repr(obj)
 
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            await cache.set(cache_key, result, expire)
 
-            return result
+def _cache_key(key_prefix: str, func, args: tuple, kwargs: dict) -> str:
+    key_material = orjson.dumps(
+        (func.__module__, func.__qualname__, args, kwargs),
+        default=_key_default,
+        option=_KEY_OPTIONS,
+    )
+    return f"{key_prefix}:{hashlib.blake2b(key_material, digest_size=16).hexdigest()}"
 
-        return wrapper
 
-    return decorator
+def _serialize(value: Any) -> bytes:
+    return _FORMAT_ORJSON + orjson.dumps(
+        value, default=_default, option=_ORJSON_OPTIONS
+    )
 
 
-from typing import Any, Optional
+def _deserialize(data: bytes) -> Optional[Any]:
+    # Entries in an older format are treated as misses and get rewritten
+    if data[:1] != _FORMAT_ORJSON:
+        return None
+    return orjson.loads(data[1:])
 
 
 class RedisCache:
     def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0):
-        self.redis = redis.Redis(host=host, port=port, db=db, decode_responses=False)
+        self.redis = aioredis.Redis(
+            host=host, port=port, db=db, decode_responses=False, max_connections=32
+        )
+        self.logger = logging.getLogger(__name__)
+        # In-process tiers of decorated functions backed by this cache
+        self._local_tiers: List[Dict[str, Any]] = []
+
+    def attach_local(self, tier: Dict[str, Any]):
+        """Register an in-process tier so deletes through this cache evict it too"""
+        if not any(t is tier for t in self._local_tiers):
+            self._local_tiers.append(tier)
 
     async def get(self, key: str) -> Optional[Any]:
-        loop = asyncio.get_event_loop()
         try:
-            data = await loop.run_in_executor(None, self.redis.get, key)
+            data = await self.redis.get(key)
             if data:
-                return pickle.loads(data)
+                return _deserialize(data)
         except Exception as e:
             self.logger.error(f"Cache get failed for key {key}: {str(e)}")
         return None
 
     async def set(self, key: str, value: Any, expire: int = 3600) -> bool:
-        loop = asyncio.get_event_loop()
         try:
-            serialized = pickle.dumps(value)
-            return await loop.run_in_executor(
-                None, self.redis.setex, key, expire, serialized
-            )
+            serialized = _serialize(value)
+        except Exception as e:
+            self.logger.error(f"Cache set failed for key {key}: {str(e)}")
+            return False
+        return await self.set_serialized(key, serialized, expire)
+
+    async def set_serialized(self, key: str, data: bytes, expire: int = 3600) -> bool:
+        try:
+            return await self.redis.setex(key, expire, data)
         except Exception as e:
             self.logger.error(f"Cache set failed for key {key}: {str(e)}")
             return False
 
     async def delete(self, key: str) -> bool:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.redis.delete, key)
+        for tier in self._local_tiers:
+            tier.pop(key, None)
+        return bool(await self.redis.delete(key))
+
+
+_default_cache: Optional[RedisCache] = None
+
+
+def _get_default_cache() -> RedisCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = RedisCache()
+    return _default_cache
 
 
-def cache_result(expire: int = 3600, key_prefix: str = ""):
+def _local_get(local: "OrderedDict[str, Tuple[float, bytes]]", cache_key: str) -> Optional[Any]:
+    entry = local.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, data = entry
+    if expires_at < time.monotonic():
+        del local[cache_key]
+        return None
+    local.move_to_end(cache_key)
+    return _deserialize(data)
+
+
+def _local_set(
+    local: "OrderedDict[str, Tuple[float, bytes]]",
+    cache_key: str,
+    data: bytes,
+    expire: int,
+    local_size: int,
+):
+    local[cache_key] = (time.monotonic() + expire, data)
+    local.move_to_end(cache_key)
+    if len(local) > local_size:
+        local.popitem(last=False)
+
+
+async def _load_or_compute(
+    store: RedisCache, cache_key: str, expire: int, func, args: tuple, kwargs: dict
+) -> Tuple[Any, Optional[bytes]]:
+    """Read through Redis, computing and writing back on a miss.
+
+    Returns the result with its serialized form, or None for results
+    that cannot be cached.
+    """
+    result = await store.get(cache_key)
+    computed = result is None
+    if computed:
+        result = await func(*args, **kwargs)
+    try:
+        data = _serialize(result)
+    except TypeError as e:
+        store.logger.error(f"Cache set failed for key {cache_key}: {str(e)}")
+        return result, None
+    if computed:
+        await store.set_serialized(cache_key, data, expire)
+    return result, data
+
+
+async def _lead_flight(
+    inflight: Dict[str, asyncio.Future], cache_key: str, load: Awaitable[Tuple[Any, Optional[bytes]]]
+) -> Tuple[Any, Optional[bytes]]:
+    """Run a miss while concurrent callers for the same key wait on its bytes"""
+    pending = asyncio.get_running_loop().create_future()
+    inflight[cache_key] = pending
+    try:
+        result, data = await load
+        pending.set_result(data)
+        return result, data
+    except asyncio.CancelledError:
+        pending.cancel()
+        raise
+    except BaseException as e:
+        pending.set_exception(e)
+        # Mark as retrieved so an unawaited failure is not logged twice
+        pending.exception()
+        raise
+    finally:
+        del inflight[cache_key]
+
+
+async def _join_flight(pending: asyncio.Future, func, args: tuple, kwargs: dict) -> Any:
+    """Wait for another caller's miss and decode a private copy of its result"""
+    data = await asyncio.shield(pending)
+    if data is None:
+        # The shared result was not cacheable, so it cannot be copied out
+        return await func(*args, **kwargs)
+    return _deserialize(data)
+
+
+def cache_result(
+    expire: int = 3600,
+    key_prefix: str = "",
+    cache: Optional[RedisCache] = None,
+    local_size: int = 10_000,
+):
     def decorator(func):
+        # In-process LRU in front of Redis: cache_key -> (expiry, serialized result).
+        # Entries stay serialized so every caller decodes its own copy.
+        local: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        # Misses currently being computed, shared by concurrent callers
+        inflight: Dict[str, asyncio.Future] = {}
+        backing: Optional[RedisCache] = None
+
+        def get_store() -> RedisCache:
+            nonlocal backing
+            if backing is None:
+                backing = cache or _get_default_cache()
+                backing.attach_local(local)
+            return backing
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            cache = RedisCache()
+            store = get_store()
 
             # Generate cache key
-            cache_key = f"{key_prefix}:{func.__name__}:{str(args)}:{str(kwargs)}"
+            cache_key = _cache_key(key_prefix, func, args, kwargs)
 
-            # Try to get from cache
-            cached_result = await cache.get(cache_key)
-            if cached_result is not None:
-                return cached_result
+            result = _local_get(local, cache_key)
+            if result is not None:
+                return result
 
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            await cache.set(cache_key, result, expire)
+            pending = inflight.get(cache_key)
+            if pending is not None:
+                return await _join_flight(pending, func, args, kwargs)
 
+            result, data = await _lead_flight(
+                inflight, cache_key, _load_or_compute(store, cache_key, expire, func, args, kwargs)
+            )
+            if data is not None:
+                _local_set(local, cache_key, data, expire, local_size)
             return result
 
+        async def invalidate(*args, **kwargs) -> bool:
+            """Drop the cached result for these arguments from both tiers"""
+            return await get_store().delete(_cache_key(key_prefix, func, args, kwargs))
+
+        wrapper.invalidate = invalidate
         return wrapper
 
     return decorator
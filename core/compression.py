@@ -1,67 +1,102 @@
 # core/compression.py
 import gzip
+import json
 import zlib
-from typing import Union
+from typing import (AsyncIterable, AsyncIterator, Callable, Iterable, Optional,
+                    Tuple, Union)
 
 import brotli
 
+# Input is fed to the encoders in slices of this size
+STREAM_CHUNK_SIZE = 64 * 1024
 
-class CompressionManager:
-    @staticmethod
-    def compress(data: Union[str, bytes], method: str = "gzip") -> bytes:
-        if isinstance(data, str):
-            data = data.encode("utf-8")
-
-        if method == "gzip":
-            return gzip.compress(data)
-        elif method == "zlib":
-            return zlib.compress(data)
-        elif method == "brotli":
-            return brotli.compress(data)
-        else:
-            raise ValueError(f"Unsupported compression method: {method}")
-
-    @staticmethod
-    def decompress(data: bytes, method: str = "gzip") -> str:
-        if method == "gzip":
-            decompressed = gzip.decompress(data)
-        elif method == "zlib":
-            decompressed = zlib.decompress(data)
-        elif method == "brotli":
-            decompressed = brotli.decompress(data)
-        else:
-            raise ValueError(f"Unsupported decompression method: {method}")
+# Fast settings suit short JSON: far less CPU for a few percent larger output
+DEFAULT_LEVELS = {"gzip": 1, "zlib": 1, "brotli": 4}
 
-        return decompressed.decode("utf-8")
+# Payloads below this size cost more to compress than they save
+MIN_COMPRESS_SIZE = 512
 
+# Prefix for payloads stored as-is. No encoder here emits a leading zero
+# byte: gzip starts 0x1f, zlib 0x78 and brotli's default window sets bit 0.
+_UNCOMPRESSED_MARKER = b"\x00"
 
-# Usage in API responses
-async def compress_response(data: dict) -> bytes:
-    json_data = json.dumps(data)
-    return CompressionManager.compress(json_data, "brotli")
 
+def _encoder(
+    method: str, level: Optional[int] = None
+) -> Tuple[Callable[[bytes], bytes], Callable[[], bytes]]:
+    """Return (process, finish) callables for an incremental encoder"""
+    if method not in DEFAULT_LEVELS:
+        raise ValueError(f"Unsupported compression method: {method}")
+    if level is None:
+        level = DEFAULT_LEVELS[method]
 
-from typing import Union
+    if method == "gzip":
+        # wbits=31 selects the gzip container, matching gzip.compress output
+        encoder = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return encoder.compress, encoder.flush
+    elif method == "zlib":
+        encoder = zlib.compressobj(level)
+        return encoder.compress, encoder.flush
+    else:
+        encoder = brotli.Compressor(quality=level)
+        return encoder.process, encoder.finish
 
 
 class CompressionManager:
     @staticmethod
-    def compress(data: Union[str, bytes], method: str = "gzip") -> bytes:
+    def compress(
+        data: Union[str, bytes],
+        method: str = "gzip",
+        level: Optional[int] = None,
+        min_size: int = MIN_COMPRESS_SIZE,
+    ) -> bytes:
         if isinstance(data, str):
             data = data.encode("utf-8")
 
-        if method == "gzip":
-            return gzip.compress(data)
-        elif method == "zlib":
-            return zlib.compress(data)
-        elif method == "brotli":
-            return brotli.compress(data)
-        else:
-            raise ValueError(f"Unsupported compression method: {method}")
+        process, finish = _encoder(method, level)
+        if len(data) < min_size:
+            return _UNCOMPRESSED_MARKER + data
+
+        view = memoryview(data)
+        out = bytearray()
+        for start in range(0, len(view), STREAM_CHUNK_SIZE):
+            out += process(view[start : start + STREAM_CHUNK_SIZE])
+        out += finish()
+        return bytes(out)
+
+    @staticmethod
+    async def compress_iter(
+        chunks: Union[Iterable[Union[str, bytes]], AsyncIterable[Union[str, bytes]]],
+        method: str = "gzip",
+        level: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """Compress a stream of chunks without materializing the whole body"""
+        process, finish = _encoder(method, level)
+
+        async def source():
+            if hasattr(chunks, "__aiter__"):
+                async for chunk in chunks:
+                    yield chunk
+            else:
+                for chunk in chunks:
+                    yield chunk
+
+        async for chunk in source():
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            compressed = process(chunk)
+            if compressed:
+                yield compressed
+
+        tail = finish()
+        if tail:
+            yield tail
 
     @staticmethod
     def decompress(data: bytes, method: str = "gzip") -> str:
-        if method == "gzip":
+        if data[:1] == _UNCOMPRESSED_MARKER:
+            decompressed = data[1:]
+        elif method == "gzip":
             decompressed = gzip.decompress(data)
         elif method == "zlib":
             decompressed = zlib.decompress(data)
@@ -76,4 +111,5 @@ class CompressionManager:
 # Usage in API responses
 async def compress_response(data: dict) -> bytes:
     json_data = json.dumps(data)
-    return CompressionManager.compress(json_data, "brotli")
+    # HTTP bodies must be a real brotli stream, so never pass through raw
+    return CompressionManager.compress(json_data, "brotli", min_size=0)
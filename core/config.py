@@ -3,12 +3,20 @@ Enterprise Configuration Management
 Secure, validated configuration with environment isolation
 """
 
+import functools
+import logging
+import os
 import secrets
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
 import yaml
-from pydantic import BaseSettings, Field, validator
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# libyaml's C loader when PyYAML was built with it; same safe-load semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class SecurityConfig(BaseSettings):
@@ -36,8 +44,9 @@ class DatabaseConfig(BaseSettings):
     MAX_CONNECTIONS: int = 20
     CONNECTION_TIMEOUT: int = 30
 
-    @validator("DATABASE_URL")
-    def validate_database_url(cls, v):
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def validate_database_url(cls, v: str) -> str:
         if not v.startswith(("postgresql://", "postgres://")):
             raise ValueError("Invalid database URL format")
         return v
@@ -83,18 +92,6 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     ENVIRONMENT: str = "production"
 
-    # Security
-    security: SecurityConfig = SecurityConfig()
-
-    # Database
-    database: DatabaseConfig = DatabaseConfig()
-
-    # AI Agents
-    agents: AgentConfig = AgentConfig()
-
-    # Proxy
-    proxy: ProxyConfig = ProxyConfig()
-
     # API
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
@@ -109,35 +106,92 @@ class Settings(BaseSettings):
     EMAIL_VALIDATION_API: Optional[str] = None
     IMAGE_RECOGNITION_API: Optional[str] = None
 
-    class Config:
-        env_file = ".env"
-        env_nested_delimiter = "__"
-        case_sensitive = False
+    # Sections are fields so SECURITY__MAX_LOGIN_ATTEMPTS-style env overrides
+    # and YAML values are validated when Settings is built
+    security: SecurityConfig = Field(default_factory=SecurityConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    agents: AgentConfig = Field(default_factory=AgentConfig)
+    proxy: ProxyConfig = Field(default_factory=ProxyConfig)
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_nested_delimiter="__",
+        case_sensitive=False,
+    )
 
     @classmethod
     def load_from_yaml(cls, config_path: str = "config.yaml") -> "Settings":
-        """Load configuration from YAML file"""
-        if Path(config_path).exists():
-            with open(config_path, "r") as f:
-                yaml_config = yaml.safe_load(f)
-            return cls(**yaml_config)
-        return cls()
+        """Load configuration from YAML file, reusing its parsed form when fresh"""
+        yaml_path = Path(config_path)
+        if not yaml_path.exists():
+            return cls()
+
+        # Only the YAML parse is cached; environment and .env are read every time
+        return cls(**_load_yaml_config(yaml_path))
+
+
+logger = logging.getLogger(__name__)
+
+# Parsed YAML is cached as JSON, which loads as plain data and never runs code
+_CACHE_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _load_yaml_config(yaml_path: Path) -> Dict[str, Any]:
+    """Parsed YAML config, from the JSON cache beside it when newer than the file"""
+    cache_path = yaml_path.with_suffix(".yaml.cache")
+    try:
+        if cache_path.stat().st_mtime_ns >= yaml_path.stat().st_mtime_ns:
+            with open(cache_path, "rb") as f:
+                config = orjson.loads(f.read())
+            if isinstance(config, dict):
+                return config
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable config cache {cache_path}: {e}")
+
+    with open(yaml_path, "r") as f:
+        config = yaml.load(f, Loader=_YAML_LOADER) or {}
+    _store_yaml_config(config, cache_path)
+    return config
+
+
+def _store_yaml_config(config: Dict[str, Any], cache_path: Path):
+    # Owner-only: the config may hold credentials
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        data = orjson.dumps(config, option=_CACHE_OPTIONS)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError) as e:
+        logger.warning(f"Could not write config cache {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+CONFIG_PATH = "config.yaml"
+
+
+@functools.lru_cache(maxsize=4)
+def _build_settings(config_path: str, mtime_ns: Optional[int]) -> Settings:
+    # mtime_ns is only part of the cache key: an edited file misses the cache
+    return Settings.load_from_yaml(config_path)
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
+def _config_mtime(config_path: str) -> Optional[int]:
+    try:
+        return os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
 def get_settings() -> Settings:
-    """Get or create settings instance"""
-    global _settings
-    if _settings is None:
-        _settings = Settings.load_from_yaml()
-    return _settings
+    """Get settings, re-reading the YAML file only when it has changed"""
+    return _build_settings(CONFIG_PATH, _config_mtime(CONFIG_PATH))
 
 
 def reload_settings() -> Settings:
     """Reload settings (useful for testing)"""
-    global _settings
-    _settings = Settings.load_from_yaml()
-    return _settings
+    _build_settings.cache_clear()
+    return get_settings()
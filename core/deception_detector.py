@@ -3,19 +3,117 @@ ENTERPRISE DECEPTION DETECTION SYSTEM
 Advanced detection of shared accounts, timezone manipulation, and identity obfuscation
 """
 
+from __future__ import annotations
+
 import asyncio
+import bisect
+import functools
 import hashlib
-import json
+import logging
+import operator
 import re
-import statistics
-import time
-from collections import Counter
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .schemas import DigitalFootprint
+    from .social_agent import ProfileData
+
+# Identity fields counted towards profile completeness
+_COMPLETENESS_FIELD_NAMES = ('username', 'full_name', 'email', 'location', 'company',
+                             'job_title', 'profile_picture', 'bio')
+_COMPLETENESS_FIELDS = operator.attrgetter(*_COMPLETENESS_FIELD_NAMES)
+_COMPLETENESS_FIELD_COUNT = len(_COMPLETENESS_FIELD_NAMES)
+
+# Severity bands: confidence below 0.5 is LOW, from 0.9 up CRITICAL
+_SEV_THRESHOLDS = (0.5, 0.7, 0.9)
+_SEV_LABELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+# Profile count above which regex/entropy/style analyses move to a worker thread
+CPU_OFFLOAD_PROFILES = 500
+
+# Generic/shared account username markers; only the digit run needs a regex
+_GENERIC_USERNAME_PREFIXES = ('info.', 'admin.', 'contact.', 'hello.', 'weare.', 'our.', 'the.')
+_GENERIC_USERNAME_SUFFIXES = ('team', 'group', 'office', 'company')
+_DIGIT_RUN_RE = re.compile(r'\d{4,}')  # Many numbers (shared office accounts)
+
+# Bio style markers used by the formality score
+_WORD_RE = re.compile(r"[A-Za-z']+")
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_INFORMAL_WORDS = frozenset({'lol', 'lmao', 'omg', 'gonna', 'wanna', 'gotta', 'btw',
+                             'haha', 'u', 'ur', 'yo', 'hey', 'cool', 'awesome', 'stuff'})
+
+# Follow-up action per indicator type, keyed by DeceptionType value
+_RECOMMENDATIONS = {
+    'shared_account': 'Verify account ownership; usage suggests more than one operator',
+    'timezone_manipulation': 'Cross-check claimed location against network and activity timezones',
+    'identity_fragmentation': 'Correlate fragmented profiles before treating them as one identity',
+    'profile_spoofing': 'Validate profile details against an authoritative source',
+    'activity_pattern_anomaly': 'Review activity timeline for automation or account takeover',
+    'hardware_spoofing': 'Treat device fingerprint as untrusted; require step-up verification',
+    'behavioral_inconsistency': 'Compare behaviour across platforms before linking accounts',
+}
+
+
+def _is_generic_username(username: str) -> bool:
+    lowered = username.lower()
+    return (lowered.startswith(_GENERIC_USERNAME_PREFIXES)
+            or lowered.endswith(_GENERIC_USERNAME_SUFFIXES)
+            or _DIGIT_RUN_RE.search(username) is not None)
+
+
+def _sample_variance(values: List[float]) -> float:
+    """Sample variance; plain arithmetic for short lists, NumPy beyond that"""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    if n < 32:
+        mean = sum(values) / n
+        return sum((x - mean) * (x - mean) for x in values) / (n - 1)
+    return float(np.asarray(values, dtype=np.float64).var(ddof=1))
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _name_fingerprint(name: str) -> bytes:
+    """Short digest of a case/whitespace-normalized name for cheap dedupe"""
+    return hashlib.blake2b(name.lower().strip().encode(), digest_size=8).digest()
+
+
+def _winter_summer_offsets(timezone_name: str) -> Optional[Tuple[timedelta, timedelta]]:
+    """UTC offsets of a zone in January and July, or None if the zone is unknown"""
+    try:
+        zone = ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+    year = datetime.now().year
+    return (datetime(year, 1, 1, tzinfo=zone).utcoffset(),
+            datetime(year, 7, 1, tzinfo=zone).utcoffset())
 
 
+@functools.lru_cache(maxsize=512)
+def _get_timezone_offset(timezone_name: str) -> int:
+    """Standard-time UTC offset of a zone in whole hours (0 if unknown)"""
+    offsets = _winter_summer_offsets(timezone_name)
+    if offsets is None:
+        return 0
+    return int(min(offsets).total_seconds() // 3600)
+
+
+@functools.lru_cache(maxsize=512)
+def _timezone_observes_dst(timezone_name: str) -> bool:
+    """Whether a zone switches offsets during the year"""
+    offsets = _winter_summer_offsets(timezone_name)
+    return offsets is not None and offsets[0] != offsets[1]
+
 class DeceptionType(Enum):
     SHARED_ACCOUNT = "shared_account"
     TIMEZONE_MANIPULATION = "timezone_manipulation"
@@ -41,6 +139,20 @@ class DeceptionAnalysis:
     confidence_level: str
     anomaly_count: int
 
+@dataclass
+class ProfileBatch:
+    """Column-oriented view of a profile list, built once per analysis"""
+    usernames: Tuple[Optional[str], ...]
+    bios: Tuple[Optional[str], ...]
+    names: Tuple[Optional[str], ...]
+    locations: Tuple[Optional[str], ...]
+    name_fingerprints: Tuple[bytes, ...]  # 8-byte digests of normalized names
+    categories: Tuple[str, ...]
+    completeness: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.usernames)
+
 class DeceptionDetector:
     """
     ENTERPRISE DECEPTION DETECTION ENGINE
@@ -60,6 +172,27 @@ class DeceptionDetector:
         
         self.logger.info("🕵️ Enterprise Deception Detector initialized")
     
+    # Pattern databases
+    def _load_shared_account_patterns(self) -> Dict[str, Any]:
+        """Load known shared-account patterns"""
+        # Implementation for loading shared account patterns
+        return {}
+    
+    def _load_timezone_anomaly_rules(self) -> Dict[str, Any]:
+        """Load timezone anomaly rules"""
+        # Implementation for loading timezone anomaly rules
+        return {}
+    
+    def _load_spoofing_indicators(self) -> Dict[str, Any]:
+        """Load known spoofing indicators"""
+        # Implementation for loading spoofing indicators
+        return {}
+    
+    def _initialize_behavioral_baselines(self) -> Dict[str, Any]:
+        """Initialize behavioral baselines"""
+        # Implementation for behavioral baseline initialization
+        return {}
+    
     async def analyze_digital_identity(self, profiles: List[ProfileData], 
                                      digital_footprint: DigitalFootprint,
                                      behavioral_analysis: Dict[str, Any]) -> DeceptionAnalysis:
@@ -68,21 +201,33 @@ class DeceptionDetector:
         """
         deception_indicators = []
         
-        # Run all deception detection modules
-        detection_tasks = [
-            self._detect_shared_accounts(profiles, behavioral_analysis),
-            self._detect_timezone_manipulation(digital_footprint, behavioral_analysis),
-            self._detect_identity_fragmentation(profiles),
-            self._detect_profile_spoofing(profiles, digital_footprint),
-            self._detect_activity_anomalies(behavioral_analysis),
-            self._detect_hardware_spoofing(digital_footprint),
-            self._detect_behavioral_inconsistencies(profiles, behavioral_analysis)
-        ]
-        
-        results = await asyncio.gather(*detection_tasks)
+        batch = self._build_profile_batch(profiles)
+        
+        # Only schedule detectors whose inputs can possibly produce an indicator:
+        # shared-account evidence needs 2+ profiles, fragmentation 3+, and the
+        # timezone checks cannot pass their threshold without a system timezone
+        detection_coros = []
+        if len(batch) >= 2:
+            detection_coros.append(self._detect_shared_accounts(batch, behavioral_analysis))
+        if digital_footprint.system_profile.get('timezone'):
+            detection_coros.append(self._detect_timezone_manipulation(digital_footprint, behavioral_analysis))
+        if len(batch) >= 3:
+            detection_coros.append(self._detect_identity_fragmentation(batch))
+        if batch:
+            detection_coros.append(self._detect_profile_spoofing(batch, digital_footprint))
+        if behavioral_analysis:
+            detection_coros.append(self._detect_activity_anomalies(behavioral_analysis))
+        detection_coros.append(self._detect_hardware_spoofing(digital_footprint))
+        if batch and behavioral_analysis:
+            detection_coros.append(self._detect_behavioral_inconsistencies(batch, behavioral_analysis))
+        
+        # A failing detector cancels its peers instead of letting them run on
+        async with asyncio.TaskGroup() as tg:
+            detection_tasks = [tg.create_task(coro) for coro in detection_coros]
         
         # Collect all indicators
-        for result in results:
+        for task in detection_tasks:
+            result = task.result()
             if result:
                 deception_indicators.extend(result)
         
@@ -100,7 +245,32 @@ class DeceptionDetector:
             anomaly_count=len(deception_indicators)
         )
     
-    async def _detect_shared_accounts(self, profiles: List[ProfileData], 
+    def _build_profile_batch(self, profiles: List[ProfileData]) -> ProfileBatch:
+        """Walk the profiles once, filling every column the detectors read"""
+        usernames, bios, names, locations, categories, completeness = [], [], [], [], [], []
+        name_fingerprints = []
+        for profile in profiles:
+            # Interned strings hit the identity fast path in later set/dict work
+            usernames.append(_intern(profile.username))
+            bios.append(profile.bio)
+            names.append(_intern(profile.full_name))
+            locations.append(_intern(profile.location))
+            if profile.full_name:
+                name_fingerprints.append(_name_fingerprint(profile.full_name))
+            categories.append(profile.platform_category.value)
+            completeness.append(self._calculate_profile_completeness(profile))
+        
+        return ProfileBatch(
+            usernames=tuple(usernames),
+            bios=tuple(bios),
+            names=tuple(names),
+            locations=tuple(locations),
+            name_fingerprints=tuple(name_fingerprints),
+            categories=tuple(categories),
+            completeness=np.asarray(completeness, dtype=np.float64)
+        )
+    
+    async def _detect_shared_accounts(self, batch: ProfileBatch,
                                     behavioral_analysis: Dict[str, Any]) -> List[DeceptionIndicator]:
         """
         Detect shared account usage through multi-dimensional analysis
@@ -109,29 +279,23 @@ class DeceptionDetector:
         evidence = []
         confidence = 0.0
         
-        # 1. Username Pattern Analysis
-        username_analysis = await self._analyze_username_patterns(profiles)
-        if username_analysis['suspicious_patterns']:
-            evidence.extend(username_analysis['suspicious_patterns'])
-            confidence += 0.3
-        
-        # 2. Activity Pattern Analysis
-        activity_analysis = await self._analyze_activity_patterns(behavioral_analysis)
-        if activity_analysis['multiple_behavioral_profiles']:
-            evidence.append("Multiple distinct behavioral patterns detected")
-            confidence += 0.4
-        
-        # 3. Content Style Analysis
-        content_analysis = await self._analyze_content_style(profiles)
-        if content_analysis['style_variations']:
-            evidence.append(f"Multiple writing styles detected: {content_analysis['style_variations']} variations")
-            confidence += 0.3
-        
-        # 4. Geographic Inconsistency
-        geo_analysis = await self._analyze_geographic_consistency(profiles)
-        if geo_analysis['geographic_spread']:
-            evidence.append(f"Activity from {geo_analysis['geographic_spread']} distinct geographic regions")
-            confidence += 0.2
+        # Cheapest analyses first, each paired with the confidence it contributes
+        stages = ((0.3, self._username_evidence), (0.4, self._activity_evidence),
+                  (0.2, self._geo_evidence), (0.3, self._content_evidence))
+        remaining = sum(weight for weight, _ in stages)
+        
+        for weight, stage in stages:
+            remaining -= weight
+            stage_evidence = await stage(batch, behavioral_analysis)
+            if stage_evidence:
+                evidence.extend(stage_evidence)
+                confidence += weight
+            
+            # Stop once the outcome is settled either way
+            if confidence >= 0.95:
+                break
+            if confidence + remaining <= 0.5:
+                return indicators
         
         if evidence and confidence > 0.5:
             indicators.append(DeceptionIndicator(
@@ -144,7 +308,43 @@ class DeceptionDetector:
         
         return indicators
     
-    async def _analyze_username_patterns(self, profiles: List[ProfileData]) -> Dict[str, Any]:
+    async def _username_evidence(self, batch: ProfileBatch,
+                                 behavioral_analysis: Dict[str, Any]) -> List[str]:
+        """Shared-account evidence: generic or shared-looking usernames"""
+        username_analysis = await self._run_analysis(self._analyze_username_patterns, batch.usernames)
+        return username_analysis['suspicious_patterns']
+    
+    async def _activity_evidence(self, batch: ProfileBatch,
+                                 behavioral_analysis: Dict[str, Any]) -> List[str]:
+        """Shared-account evidence: more than one behavioral profile behind the activity"""
+        activity_analysis = self._analyze_activity_patterns(behavioral_analysis)
+        if activity_analysis['multiple_behavioral_profiles']:
+            return ["Multiple distinct behavioral patterns detected"]
+        return []
+    
+    async def _geo_evidence(self, batch: ProfileBatch,
+                            behavioral_analysis: Dict[str, Any]) -> List[str]:
+        """Shared-account evidence: activity spread across distinct regions"""
+        geo_analysis = self._analyze_geographic_consistency(batch.locations)
+        if geo_analysis['geographic_spread']:
+            return [f"Activity from {geo_analysis['geographic_spread']} distinct geographic regions"]
+        return []
+    
+    async def _content_evidence(self, batch: ProfileBatch,
+                                behavioral_analysis: Dict[str, Any]) -> List[str]:
+        """Shared-account evidence: writing style varying between bios"""
+        content_analysis = await self._run_analysis(self._analyze_content_style, batch.bios)
+        if content_analysis['style_variations']:
+            return [f"Multiple writing styles detected: {content_analysis['style_variations']} variations"]
+        return []
+    
+    async def _run_analysis(self, analysis, values: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+        """Run a CPU-bound profile analysis, off the event loop for large batches"""
+        if len(values) > CPU_OFFLOAD_PROFILES:
+            return await asyncio.to_thread(analysis, values)
+        return analysis(values)
+    
+    def _analyze_username_patterns(self, usernames: Tuple[Optional[str], ...]) -> Dict[str, Any]:
         """Analyze username patterns for shared account indicators"""
         analysis = {
             'suspicious_patterns': [],
@@ -152,35 +352,25 @@ class DeceptionDetector:
             'pattern_consistency': 0.0
         }
         
-        usernames = [p.username for p in profiles if p.username]
+        usernames = [username for username in usernames if username]
         
         if len(usernames) < 2:
             return analysis
         
         # Check for generic/shared account patterns
-        generic_patterns = [
-            r'.*team$', r'.*group$', r'.*office$', r'.*company$',
-            r'^info\.', r'^admin\.', r'^contact\.', r'^hello\.',
-            r'.*[\d]{4,}',  # Many numbers (shared office accounts)
-            r'^weare\.', r'^our\.', r'^the\.'
-        ]
-        
         for username in usernames:
-            for pattern in generic_patterns:
-                if re.match(pattern, username, re.IGNORECASE):
-                    analysis['suspicious_patterns'].append(f"Generic username pattern: {username}")
-                    break
+            if _is_generic_username(username):
+                analysis['suspicious_patterns'].append(f"Generic username pattern: {username}")
         
         # Analyze username entropy (low entropy = potentially shared)
-        entropy_scores = [self._calculate_entropy(username) for username in usernames]
-        avg_entropy = statistics.mean(entropy_scores) if entropy_scores else 0
+        avg_entropy = float(self._calculate_entropy_batch(usernames).mean())
         
         if avg_entropy < 2.5:  # Low entropy threshold
             analysis['suspicious_patterns'].append(f"Low username entropy: {avg_entropy:.2f}")
         
         return analysis
     
-    async def _analyze_activity_patterns(self, behavioral_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_activity_patterns(self, behavioral_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze activity patterns for multiple user behaviors"""
         analysis = {
             'multiple_behavioral_profiles': False,
@@ -208,7 +398,7 @@ class DeceptionDetector:
         
         return analysis
     
-    async def _analyze_content_style(self, profiles: List[ProfileData]) -> Dict[str, Any]:
+    def _analyze_content_style(self, bios: Tuple[Optional[str], ...]) -> Dict[str, Any]:
         """Analyze content style variations across platforms"""
         analysis = {
             'style_variations': 0,
@@ -216,7 +406,7 @@ class DeceptionDetector:
             'vocabulary_diversity': 0.0
         }
         
-        bios = [p.bio for p in profiles if p.bio and len(p.bio) > 10]
+        bios = [bio for bio in bios if bio and len(bio) > 10]
         
         if len(bios) < 2:
             return analysis
@@ -226,7 +416,7 @@ class DeceptionDetector:
         for bio in bios:
             formality_scores.append(self._calculate_formality_score(bio))
         
-        formality_variance = statistics.variance(formality_scores) if len(formality_scores) > 1 else 0
+        formality_variance = _sample_variance(formality_scores)
         
         if formality_variance > 0.3:  # High variance in formality
             analysis['style_variations'] = len(set(round(score, 1) for score in formality_scores))
@@ -234,7 +424,7 @@ class DeceptionDetector:
         
         return analysis
     
-    async def _analyze_geographic_consistency(self, profiles: List[ProfileData]) -> Dict[str, Any]:
+    def _analyze_geographic_consistency(self, locations: Tuple[Optional[str], ...]) -> Dict[str, Any]:
         """Analyze geographic consistency across profiles"""
         analysis = {
             'geographic_spread': 0,
@@ -242,8 +432,7 @@ class DeceptionDetector:
             'location_conflicts': []
         }
         
-        locations = [p.location for p in profiles if p.location]
-        unique_locations = set(locations)
+        unique_locations = {location for location in locations if location}
         
         if len(unique_locations) > 2:  # More than 2 distinct locations
             analysis['geographic_spread'] = len(unique_locations)
@@ -259,29 +448,30 @@ class DeceptionDetector:
         evidence = []
         confidence = 0.0
         
-        system_tz = digital_footprint.system_profile.get('timezone', '')
-        ip_geolocation = digital_footprint.network_characteristics.get('ip_geolocation', {})
+        # Resolve the footprint's timezone fields once for every check below
+        system_tz = digital_footprint.system_profile.get('timezone') or ''
+        ip_tz = (digital_footprint.network_characteristics.get('ip_geolocation') or {}).get('timezone')
+        browser_tz = digital_footprint.browser_fingerprint.get('timezone')
         
         # 1. System vs IP Timezone Mismatch
-        if system_tz and ip_geolocation.get('timezone'):
-            if system_tz != ip_geolocation.get('timezone'):
-                evidence.append(f"Timezone mismatch: System={system_tz}, IP={ip_geolocation.get('timezone')}")
-                confidence += 0.6
+        if system_tz and ip_tz and system_tz != ip_tz:
+            evidence.append(f"Timezone mismatch: System={system_tz}, IP={ip_tz}")
+            confidence += 0.6
         
         # 2. Activity vs Declared Timezone Analysis
-        activity_analysis = await self._analyze_activity_vs_timezone(behavioral_analysis, system_tz)
+        activity_analysis = self._analyze_activity_vs_timezone(behavioral_analysis, system_tz)
         if activity_analysis['anomalous_activity']:
             evidence.extend(activity_analysis['anomalous_activity'])
             confidence += 0.4
         
         # 3. Timezone Consistency Check
-        tz_consistency = await self._check_timezone_consistency(digital_footprint)
+        tz_consistency = self._check_timezone_consistency(system_tz, ip_tz, browser_tz)
         if not tz_consistency['consistent']:
             evidence.append("Multiple timezone indicators detected")
             confidence += 0.3
         
         # 4. DST (Daylight Saving Time) Anomalies
-        dst_anomalies = await self._detect_dst_anomalies(behavioral_analysis, system_tz)
+        dst_anomalies = self._detect_dst_anomalies(behavioral_analysis, system_tz)
         if dst_anomalies:
             evidence.append("Daylight Saving Time anomalies detected")
             confidence += 0.2
@@ -297,8 +487,8 @@ class DeceptionDetector:
         
         return indicators
     
-    async def _analyze_activity_vs_timezone(self, behavioral_analysis: Dict[str, Any], 
-                                          system_timezone: str) -> Dict[str, Any]:
+    def _analyze_activity_vs_timezone(self, behavioral_analysis: Dict[str, Any], 
+                                    system_timezone: str) -> Dict[str, Any]:
         """Analyze if activity patterns match declared timezone"""
         analysis = {'anomalous_activity': []}
         
@@ -306,7 +496,7 @@ class DeceptionDetector:
             return analysis
         
         # Get timezone offset
-        tz_offset = self._get_timezone_offset(system_timezone)
+        tz_offset = _get_timezone_offset(system_timezone)
         
         # Analyze activity hours relative to timezone
         activity_data = behavioral_analysis.get('platform_usage_patterns', {})
@@ -326,39 +516,31 @@ class DeceptionDetector:
         
         return analysis
     
-    async def _check_timezone_consistency(self, digital_footprint: DigitalFootprint) -> Dict[str, Any]:
+    def _check_timezone_consistency(self, system_tz: Optional[str], ip_tz: Optional[str],
+                                  browser_tz: Optional[str]) -> Dict[str, Any]:
         """Check consistency across multiple timezone indicators"""
         analysis = {'consistent': True, 'conflicts': []}
         
-        system_tz = digital_footprint.system_profile.get('timezone')
-        ip_tz = digital_footprint.network_characteristics.get('ip_geolocation', {}).get('timezone')
-        browser_tz = digital_footprint.browser_fingerprint.get('timezone')
-        
-        timezones = [tz for tz in [system_tz, ip_tz, browser_tz] if tz]
+        timezones = {tz for tz in (system_tz, ip_tz, browser_tz) if tz}
         
-        if len(set(timezones)) > 1:
+        if len(timezones) > 1:
             analysis['consistent'] = False
-            analysis['conflicts'] = list(set(timezones))
+            analysis['conflicts'] = list(timezones)
         
         return analysis
     
-    async def _detect_dst_anomalies(self, behavioral_analysis: Dict[str, Any], 
-                                  system_timezone: str) -> bool:
+    def _detect_dst_anomalies(self, behavioral_analysis: Dict[str, Any], 
+                            system_timezone: str) -> bool:
         """Detect Daylight Saving Time anomalies"""
-        if not system_timezone:
+        # Only zones that observe DST have transitions to analyze
+        if not system_timezone or not _timezone_observes_dst(system_timezone):
             return False
         
-        # Check if timezone observes DST
-        observes_dst = self._timezone_observes_dst(system_timezone)
-        
-        if observes_dst:
-            # Analyze activity around DST transitions
-            activity_data = behavioral_analysis.get('platform_usage_patterns', {})
-            # Implementation would check for activity pattern disruptions during DST changes
-        
+        # Implementation would check platform_usage_patterns for activity
+        # pattern disruptions around DST changes
         return False  # Placeholder
     
-    async def _detect_identity_fragmentation(self, profiles: List[ProfileData]) -> List[DeceptionIndicator]:
+    async def _detect_identity_fragmentation(self, batch: ProfileBatch) -> List[DeceptionIndicator]:
         """
         Detect intentional identity fragmentation across platforms
         """
@@ -367,19 +549,19 @@ class DeceptionDetector:
         confidence = 0.0
         
         # 1. Name Variation Analysis
-        name_analysis = await self._analyze_name_variations(profiles)
+        name_analysis = self._analyze_name_variations(batch.name_fingerprints)
         if name_analysis['excessive_variations']:
             evidence.append(f"Excessive name variations: {name_analysis['variation_count']} different names")
             confidence += 0.4
         
         # 2. Profile Completeness Analysis
-        completeness_analysis = await self._analyze_profile_completeness(profiles)
+        completeness_analysis = self._analyze_profile_completeness(batch.completeness)
         if completeness_analysis['incomplete_pattern']:
             evidence.append("Strategic profile incompleteness detected")
             confidence += 0.3
         
         # 3. Platform Specialization Analysis
-        specialization_analysis = await self._analyze_platform_specialization(profiles)
+        specialization_analysis = self._analyze_platform_specialization(batch.categories)
         if specialization_analysis['compartmentalized_identity']:
             evidence.append("Compartmentalized identity across platforms")
             confidence += 0.3
@@ -395,7 +577,7 @@ class DeceptionDetector:
         
         return indicators
     
-    async def _analyze_name_variations(self, profiles: List[ProfileData]) -> Dict[str, Any]:
+    def _analyze_name_variations(self, name_fingerprints: Tuple[bytes, ...]) -> Dict[str, Any]:
         """Analyze name variations for intentional fragmentation"""
         analysis = {
             'excessive_variations': False,
@@ -403,8 +585,7 @@ class DeceptionDetector:
             'name_consistency_score': 0.0
         }
         
-        names = [p.full_name for p in profiles if p.full_name]
-        unique_names = set(names)
+        unique_names = set(name_fingerprints)
         
         if len(unique_names) > 3:  # More than 3 different names
             analysis['excessive_variations'] = True
@@ -412,27 +593,28 @@ class DeceptionDetector:
         
         return analysis
     
-    async def _analyze_profile_completeness(self, profiles: List[ProfileData]) -> Dict[str, Any]:
+    def _analyze_profile_completeness(self, completeness: np.ndarray) -> Dict[str, Any]:
         """Analyze strategic profile incompleteness"""
         analysis = {
             'incomplete_pattern': False,
-            'completeness_scores': [],
+            'completeness_scores': completeness.tolist(),
             'strategic_omissions': []
         }
         
-        for profile in profiles:
-            completeness = self._calculate_profile_completeness(profile)
-            analysis['completeness_scores'].append(completeness)
-        
-        avg_completeness = statistics.mean(analysis['completeness_scores']) if analysis['completeness_scores'] else 0
+        avg_completeness = float(completeness.mean()) if completeness.size else 0
         
         # Check for pattern of strategic omissions
-        if avg_completeness < 0.3 and len(profiles) > 2:
+        if avg_completeness < 0.3 and len(completeness) > 2:
             analysis['incomplete_pattern'] = True
         
         return analysis
     
-    async def _analyze_platform_specialization(self, profiles: List[ProfileData]) -> Dict[str, Any]:
+    def _calculate_profile_completeness(self, profile: ProfileData) -> float:
+        """Fraction of the identity fields a profile fills in"""
+        filled = sum(1 for value in _COMPLETENESS_FIELDS(profile) if value)
+        return filled / _COMPLETENESS_FIELD_COUNT
+    
+    def _analyze_platform_specialization(self, categories: Tuple[str, ...]) -> Dict[str, Any]:
         """Analyze compartmentalized identity across platforms"""
         analysis = {
             'compartmentalized_identity': False,
@@ -440,11 +622,8 @@ class DeceptionDetector:
         }
         
         # Group profiles by platform category and analyze content focus
-        for profile in profiles:
-            category = profile.platform_category.value
-            if category not in analysis['platform_personas']:
-                analysis['platform_personas'][category] = []
-            analysis['platform_personas'][category].append(profile)
+        for index, category in enumerate(categories):
+            analysis['platform_personas'].setdefault(category, []).append(index)
         
         # Check for completely different personas across categories
         if len(analysis['platform_personas']) >= 3:
@@ -453,7 +632,7 @@ class DeceptionDetector:
         
         return analysis
     
-    async def _detect_profile_spoofing(self, profiles: List[ProfileData], 
+    async def _detect_profile_spoofing(self, batch: ProfileBatch, 
                                      digital_footprint: DigitalFootprint) -> List[DeceptionIndicator]:
         """Detect profile spoofing and fake accounts"""
         # Implementation for profile spoofing detection
@@ -469,17 +648,100 @@ class DeceptionDetector:
         # Implementation for hardware spoofing detection
         return []
     
-    async def _detect_behavioral_inconsistencies(self, profiles: List[ProfileData],
+    async def _detect_behavioral_inconsistencies(self, batch: ProfileBatch,
                                                behavioral_analysis: Dict[str, Any]) -> List[DeceptionIndicator]:
         """Detect behavioral inconsistencies across platforms"""
         # Implementation for behavioral inconsistency detection
         return []
     
     # Utility Methods
+    def _calculate_severity(self, confidence: float) -> str:
+        """Map a detector confidence onto a severity label"""
+        return _SEV_LABELS[bisect.bisect_right(_SEV_THRESHOLDS, confidence)]
+    
+    def _calculate_overall_risk(self, indicators: List[DeceptionIndicator]) -> float:
+        """Combine indicators as independent risks weighted by their impact"""
+        if not indicators:
+            return 0.0
+        clear = 1.0
+        for indicator in indicators:
+            clear *= 1.0 - min(max(indicator.confidence * indicator.impact_score, 0.0), 1.0)
+        return 1.0 - clear
+    
+    def _generate_recommendations(self, indicators: List[DeceptionIndicator]) -> List[str]:
+        """One follow-up action per indicator type, most severe findings first"""
+        if not indicators:
+            return ['No deception indicators detected; proceed with standard verification']
+        
+        recommendations = []
+        if any(indicator.severity == 'CRITICAL' for indicator in indicators):
+            recommendations.append('Escalate for manual review before acting on this identity')
+        ranked = sorted(indicators, key=lambda indicator: indicator.confidence, reverse=True)
+        for indicator_type in dict.fromkeys(indicator.type.value for indicator in ranked):
+            recommendations.append(_RECOMMENDATIONS[indicator_type])
+        return recommendations
+    
+    def _determine_confidence_level(self, indicators: List[DeceptionIndicator]) -> str:
+        """Confidence in the assessment, from indicator agreement and strength"""
+        if not indicators:
+            return 'LOW'
+        mean_confidence = sum(indicator.confidence for indicator in indicators) / len(indicators)
+        if len(indicators) >= 2 and mean_confidence >= 0.8:
+            return 'HIGH'
+        if mean_confidence >= 0.6:
+            return 'MEDIUM'
+        return 'LOW'
+    
+    def _calculate_formality_score(self, text: str) -> float:
+        """Formality of a bio from 0 (casual) to 1 (formal)"""
+        words = _WORD_RE.findall(text)
+        sentences = [sentence.strip() for sentence in _SENTENCE_SPLIT_RE.split(text) if sentence.strip()]
+        if not words or not sentences:
+            return 0.5
+        
+        capitalized = sum(sentence[0].isupper() for sentence in sentences) / len(sentences)
+        informal = sum(word.lower() in _INFORMAL_WORDS or "'" in word for word in words) / len(words)
+        exclaimed = min(text.count('!') / len(sentences), 1.0)
+        return (capitalized + (1.0 - min(informal * 4, 1.0)) + (1.0 - exclaimed)) / 3
+    
+    def _cluster_activity_hours(self, activity_hours: List[int]) -> List[Tuple[int, int]]:
+        """
+        Group activity hours into arcs of consecutive active hours on the
+        24-hour clock, returned as (first_hour, last_hour) pairs
+        """
+        counts = np.bincount(np.asarray(activity_hours, dtype=np.int64) % 24, minlength=24)
+        active = counts > 0
+        if active.all():
+            return [(0, 23)]
+        
+        # An arc starts where the previous hour is idle and ends where the next one is
+        starts = np.flatnonzero(active & ~np.roll(active, 1))
+        ends = np.flatnonzero(active & ~np.roll(active, -1))
+        if ends.size and ends[0] < starts[0]:
+            ends = np.roll(ends, -1)  # first arc wraps past midnight
+        return list(zip(starts.tolist(), ends.tolist()))
+    
     def _calculate_entropy(self, text: str) -> float:
         """Calculate Shannon entropy of a string"""
         if not text:
             return 0
-        entropy = 0
-        for x in range(256):
-  
+        data = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+        counts = np.bincount(data, minlength=256)
+        probabilities = counts[counts > 0] / data.size
+        return float(-(probabilities * np.log2(probabilities)).sum())
+    
+    def _calculate_entropy_batch(self, texts: List[str]) -> np.ndarray:
+        """Shannon entropy of each string, from one histogram over all of them"""
+        encoded = [text.encode("utf-8") for text in texts]
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        
+        # Row i holds the byte histogram of texts[i]
+        rows = np.repeat(np.arange(len(encoded)), lengths)
+        counts = np.bincount(rows * 256 + data, minlength=len(encoded) * 256)
+        counts = counts.reshape(len(encoded), 256)
+        
+        probabilities = counts / np.maximum(lengths, 1)[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.where(counts > 0, probabilities * np.log2(probabilities), 0.0)
+        return -terms.sum(axis=1)
@@ -2,12 +2,62 @@
 ERROR HANDLING - Comprehensive error management and recovery
 """
 
+import asyncio
 import logging
-from typing import Dict
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple, Type
 
 from monitoring.alerts import AlertManager
 from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenException
 
+TRANSIENT_ERRORS: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError)
+
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with decorrelated jitter, truncated at ``cap``"""
+    return min(cap, random.uniform(base, base * 2**attempt * 3))
+
+
+async def retry_async(
+    fn: Callable[[], Awaitable[Any]],
+    *,
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+    retriable: Tuple[Type[BaseException], ...] = TRANSIENT_ERRORS,
+) -> Any:
+    """Await ``fn()``, retrying recoverable errors with jittered backoff.
+
+    Errors outside ``retriable`` are re-raised immediately; the last
+    recoverable error is re-raised once ``max_retries`` is exhausted.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await fn()
+        except retriable:
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(_backoff_delay(attempt, base, cap))
+
+
+def retry_call(
+    fn: Callable[[], Any],
+    *,
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+    retriable: Tuple[Type[BaseException], ...] = TRANSIENT_ERRORS,
+) -> Any:
+    """Synchronous counterpart of :func:`retry_async`"""
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except retriable:
+            if attempt == max_retries:
+                raise
+            time.sleep(_backoff_delay(attempt, base, cap))
+
 
 class ErrorHandler:
     """Enterprise error handling and recovery"""
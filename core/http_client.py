@@ -0,0 +1,82 @@
+"""
+HTTP CLIENT - Shared aiohttp session
+One process-wide ClientSession so keep-alive connections and DNS lookups
+are reused across every platform agent.
+"""
+
+import asyncio
+import weakref
+from typing import Awaitable, TypeVar
+
+import aiohttp
+
+try:
+    # SIMD-accelerated inflate for gzip/deflate bodies when available
+    from zlib_ng import zlib_ng
+except ImportError:
+    zlib_ng = None
+
+DEFAULT_TIMEOUT = 30.0
+
+T = TypeVar("T")
+
+if zlib_ng is not None:
+    aiohttp.set_zlib_backend(zlib_ng)
+
+# One session (and creation lock) per event loop: a session's connector is
+# bound to the loop that created it, and workers run a new loop per task
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+_session_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_lock(loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+    lock = _session_locks.get(loop)
+    if lock is None:
+        lock = _session_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the running loop's shared session, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is not None and not session.closed:
+        return session
+
+    async with _get_lock(loop):
+        session = _sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=30,
+            )
+            # aiohttp advertises gzip/deflate (and br when brotli is
+            # installed) and decodes bodies itself
+            session = _sessions[loop] = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+                auto_decompress=True,
+            )
+    return session
+
+
+async def close_session():
+    """Close the running loop's shared session; call before the loop ends"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def closing_session(coro: Awaitable[T]) -> T:
+    """Await a coroutine, then close the loop's session (for one-shot asyncio.run)"""
+    try:
+        return await coro
+    finally:
+        await close_session()
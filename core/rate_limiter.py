@@ -1,4 +1,40 @@
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
 class EnterpriseRateLimiter:
-    """Missing: Advanced rate limiting per user/IP/platform"""
+    """Sliding-window rate limiting per user/IP/platform key
+
+    Each key holds ``buckets`` counters of ``bucket_seconds`` each; the
+    window is their sum, and whole buckets age out as time advances.
+    """
+
+    def __init__(self, buckets: int = 6, bucket_seconds: float = 10.0):
+        self.buckets = buckets
+        self.bucket_seconds = bucket_seconds
+        # key -> (bucket counts, start time of the newest bucket)
+        self._windows: Dict[Hashable, Tuple[List[int], float]] = {}
+
+    def allow(self, key: Hashable, limit: int, now: Optional[float] = None) -> bool:
+        """Count one request for ``key`` unless the window already holds ``limit``"""
+        if now is None:
+            now = time.monotonic()
+
+        window = self._windows.get(key)
+        if window is None:
+            counts, bucket_start = [0] * self.buckets, now
+        else:
+            counts, bucket_start = window
+            elapsed = int((now - bucket_start) // self.bucket_seconds)
+            if elapsed >= self.buckets:
+                counts, bucket_start = [0] * self.buckets, now
+            elif elapsed > 0:
+                counts = counts[elapsed:] + [0] * elapsed
+                bucket_start += elapsed * self.bucket_seconds
+
+        self._windows[key] = (counts, bucket_start)
+        if sum(counts) >= limit:
+            return False
 
-    pass
+        counts[-1] += 1
+        return True
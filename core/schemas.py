@@ -77,7 +77,7 @@ class LookupRequest(BaseModel):
 class BatchLookupRequest(BaseModel):
     targets: List[str] = Field(..., min_items=1, max_items=10)
     advanced_analysis: bool = False
-    priority: str = Field(default="normal", regex="^(low|normal|high|urgent)$")
+    priority: str = Field(default="normal", pattern="^(low|normal|high|urgent)$")
 
 
 # Response Schemas
@@ -11,12 +11,13 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import jwt
 from passlib.context import CryptContext
 
 from .config import get_settings
+from .error_handling import retry_call
 from .exceptions import SecurityViolation
 
 
@@ -91,27 +92,28 @@ class Authentication:
         if self._is_rate_limited(username):
             raise SecurityViolation("Rate limit exceeded for authentication attempts")
 
-        conn = sqlite3.connect(self.users_db)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT password_hash, is_active FROM users WHERE username = ?", (username,)
+        # Only this read is retried (e.g. a locked database); the attempt
+        # below is recorded exactly once whatever happens
+        result = retry_call(
+            lambda: self._fetch_credentials(username),
+            base=0.05,
+            cap=0.5,
+            retriable=(sqlite3.OperationalError,),
         )
-        result = cursor.fetchone()
 
         if not result or not result[1]:
             self._log_login_attempt(username, "0.0.0.0", False)
-            conn.close()
             return None
 
         stored_hash, is_active = result
 
         if not is_active or not self.verify_password(password, stored_hash):
             self._log_login_attempt(username, "0.0.0.0", False)
-            conn.close()
             return None
 
         # Update last login and generate token
+        conn = sqlite3.connect(self.users_db)
+        cursor = conn.cursor()
         cursor.execute(
             "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE username = ?",
             (username,),
@@ -122,6 +124,29 @@ class Authentication:
 
         return self._create_access_token(username)
 
+    def _fetch_credentials(self, username: str) -> Optional[Tuple[str, bool]]:
+        """Read the stored password hash and active flag for a username"""
+        conn = sqlite3.connect(self.users_db)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT password_hash, is_active FROM users WHERE username = ?",
+                (username,),
+            )
+            return cursor.fetchone()
+        finally:
+            conn.close()
+
+    def get_user_id(self, username: str) -> Optional[int]:
+        """Return the integer row id for a username"""
+        conn = sqlite3.connect(self.users_db)
+        cursor = conn.cursor()
+        cursor.execute("SELECT rowid FROM users WHERE username = ?", (username,))
+        result = cursor.fetchone()
+        conn.close()
+
+        return result[0] if result else None
+
     def _create_access_token(self, username: str) -> str:
         """Create JWT access token"""
         expires_delta = timedelta(
@@ -38,7 +38,7 @@ class PlatformCategory(Enum):
     EMERGING = "emerging"
     SPECIALIZED = "specialized"
 
-@dataclass
+@dataclass(slots=True)
 class ProfileData:
     """Enhanced profile data structure for all platforms"""
     platform: str
@@ -472,4 +472,7 @@ class SocialAgent:
             except Exception as e:
                 self.logger.warning(f"⚠️ {platform} search error (attempt {attempt + 1}): {e}")
                 if attempt < max_retries - 1:
-          
+                    await asyncio.sleep(2 ** attempt)
+        
+        self.logger.error(f"❌ {platform} search failed after {max_retries} attempts")
+        return []
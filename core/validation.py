@@ -4,9 +4,13 @@ SMTP verification, syntax checks, and disposable email detection
 """
 
 import asyncio
+import copy
 import logging
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 
 import aiosmtplib
 import dns.resolver
@@ -18,9 +22,16 @@ class EmailValidator:
     Enterprise Email Validation with SMTP Verification
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096, cache_ttl: float = 3600.0):
         self.logger = logging.getLogger("email_validator")
 
+        # LRU cache of comprehensive results: normalized email -> (expiry, result)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._result_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
         # Disposable email domains (would be loaded from database/file)
         self.disposable_domains = self._load_disposable_domains()
 
@@ -41,7 +52,59 @@ class EmailValidator:
     async def validate_email_comprehensive(self, email: str) -> Dict[str, Any]:
         """
         Comprehensive email validation with multiple verification methods
+
+        Results are memoized per normalized address for ``cache_ttl`` seconds,
+        so re-submitted emails skip the DNS/SMTP round-trips.
         """
+        cache_key = email.strip().lower()
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        validation_result = await self._validate_uncached(email)
+
+        # Errors are usually transient (DNS/SMTP timeouts) - don't pin them
+        if not self._has_transient_error(validation_result):
+            self._cache_result(cache_key, validation_result)
+
+        return validation_result
+
+    @staticmethod
+    def _has_transient_error(validation_result: Dict[str, Any]) -> bool:
+        """Whether the pipeline or any step swallowed an error"""
+        if "error" in validation_result:
+            return True
+        return any(
+            step.get("errored") for step in validation_result["validation_steps"].values()
+        )
+
+    def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached validation result if present and not expired"""
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._result_cache[cache_key]
+            return None
+
+        self._result_cache.move_to_end(cache_key)
+        # Results are nested dicts; callers get their own copy to mutate
+        return copy.deepcopy(result)
+
+    def _cache_result(self, cache_key: str, result: Dict[str, Any]):
+        """Store a validation result, evicting the least recently used entry"""
+        self._result_cache[cache_key] = (
+            time.monotonic() + self.cache_ttl,
+            copy.deepcopy(result),
+        )
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > self.cache_size:
+            self._result_cache.popitem(last=False)
+
+    async def _validate_uncached(self, email: str) -> Dict[str, Any]:
+        """Run the full validation pipeline without consulting the cache"""
         validation_result = {
             "email": email,
             "is_valid": False,
@@ -203,6 +266,7 @@ class EmailValidator:
                 result["warnings"].append("Domain has no DNS records")
 
         except Exception as e:
+            result["errored"] = True
             result["warnings"].append(f"DNS validation error: {e}")
 
         return result
@@ -274,6 +338,8 @@ class EmailValidator:
                     )
                     mx_hosts = [str(r) for r in a_records]
                 except Exception:
+                    # The domain step already found records, so this is a lookup failure
+                    result["errored"] = True
                     result["details"]["error"] = "No MX or A records found"
                     return result
 
@@ -317,9 +383,11 @@ class EmailValidator:
                         ] = f"{code}: {message.decode()}"
 
                 except asyncio.TimeoutError:
+                    result["errored"] = True
                     result["details"]["error"] = f"SMTP timeout for {mx_host}"
                     continue
                 except Exception as e:
+                    result["errored"] = True
                     result["details"]["error"] = f"SMTP error for {mx_host}: {e}"
                     continue
 
@@ -332,6 +400,7 @@ class EmailValidator:
                     result["details"] = simple_result["details"]
 
         except Exception as e:
+            result["errored"] = True
             result["details"]["error"] = f"SMTP verification failed: {e}"
 
         return result
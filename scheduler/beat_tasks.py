@@ -303,6 +303,7 @@ def calibrate_ai_agents():
             return performance_report
 
         finally:
+            loop.run_until_complete(hierarchy_manager.cleanup())
             loop.close()
 
     except Exception as e:
@@ -392,6 +393,7 @@ def analyze_bunker_patterns():
             logger.info("✅ Bunker pattern analysis completed")
 
         finally:
+            loop.run_until_complete(bunker.close())
             loop.close()
 
     except Exception as e:
@@ -452,6 +454,7 @@ def generate_nightly_report():
         hierarchy_manager = AIHierarchyManager()
         agent_report = hierarchy_manager.get_agent_performance_report()
         report_data["agent_performance"] = agent_report
+        asyncio.run(hierarchy_manager.cleanup())
 
         # Generate recommendations
         report_data["recommendations"] = _generate_system_recommendations(report_data)
@@ -12,6 +12,7 @@ from typing import Any, Dict
 
 from celery import Celery, current_task
 
+from core.http_client import closing_session
 from core.schemas import TaskStatus
 from core.social_agent import social_agent
 from core.validation import email_validator
@@ -42,7 +43,7 @@ def social_lookup_task(
 
         # Validate email before processing
         validation_result = asyncio.run(
-            email_validator.validate_email_comprehensive(email)
+            closing_session(email_validator.validate_email_comprehensive(email))
         )
 
         if not validation_result["is_valid"]:
@@ -53,10 +54,12 @@ def social_lookup_task(
         # Run the social lookup
         if advanced_analysis:
             result = asyncio.run(
-                social_agent.process_email_enterprise(email, user_context)
+                closing_session(social_agent.process_email_enterprise(email, user_context))
             )
         else:
-            result = asyncio.run(social_agent.process_email(email, user_context))
+            result = asyncio.run(
+                closing_session(social_agent.process_email(email, user_context))
+            )
 
         processing_time = time.time() - start_time
 
@@ -166,8 +169,10 @@ def urgent_analysis(email: str, user_context: Dict = None):
     try:
         # Use enterprise-grade analysis with all features enabled
         result = asyncio.run(
-            social_agent.process_email_enterprise(
-                email, user_context, collect_fingerprint=True
+            closing_session(
+                social_agent.process_email_enterprise(
+                    email, user_context, collect_fingerprint=True
+                )
             )
         )
 
@@ -0,0 +1,187 @@
+import asyncio
+import os
+import sys
+import unittest
+import unittest.mock
+
+import numpy as np
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.agent_generator import AgentGenerator, AgentStatus, _PerformanceStore
+from core.resource_orchestrator import ResourceLevel, ResourceStrategy
+
+
+class TestPerformanceStore(unittest.TestCase):
+    def setUp(self):
+        self.store = _PerformanceStore(capacity=2)
+
+    def _add(self, agent_id, success_rate, status=AgentStatus.HEALTHY):
+        view = self.store.add(agent_id, status)
+        view.success_rate = success_rate
+        return view
+
+    def test_remove_swaps_last_slot_into_gap(self):
+        a = self._add("a", 0.1)
+        b = self._add("b", 0.2, AgentStatus.FAILING)
+        c = self._add("c", 0.3, AgentStatus.DEGRADED)
+
+        self.store.remove(a)
+
+        self.assertEqual(self.store.size, 2)
+        self.assertEqual(a.slot, -1)
+        self.assertEqual(c.slot, 0)
+        self.assertEqual(self.store.agent_ids, ["c", "b"])
+        self.assertAlmostEqual(c.success_rate, 0.3, places=6)
+        self.assertAlmostEqual(b.success_rate, 0.2, places=6)
+
+    def test_removing_last_slot_leaves_others_in_place(self):
+        a = self._add("a", 0.1)
+        b = self._add("b", 0.2)
+
+        self.store.remove(b)
+
+        self.assertEqual((self.store.size, a.slot), (1, 0))
+        self.assertEqual(self.store.agent_ids, ["a"])
+
+    def test_status_counts_follow_adds_removes_and_updates(self):
+        a = self._add("a", 1.0)
+        b = self._add("b", 1.0, AgentStatus.FAILING)
+        self.store.set_status(a.slot, AgentStatus.DEGRADED)
+        self.store.remove(b)
+
+        expected = np.bincount(
+            self.store.status[: self.store.size], minlength=len(AgentStatus)
+        ).tolist()
+        self.assertEqual(self.store.status_counts, expected)
+        self.assertEqual(self.store.status_counts[list(AgentStatus).index(AgentStatus.DEGRADED)], 1)
+
+    def test_grow_preserves_live_slots(self):
+        views = [self._add(f"agent{i}", i / 10) for i in range(5)]
+
+        self.assertGreaterEqual(len(self.store.success_rate), 5)
+        for i, view in enumerate(views):
+            self.assertEqual(view.slot, i)
+            self.assertAlmostEqual(view.success_rate, i / 10, places=6)
+
+    def test_reused_slot_starts_clean(self):
+        a = self._add("a", 0.2, AgentStatus.FAILING)
+        a.total_requests = 50
+        a.error_rate = 0.9
+        a.avg_response_time = 12.0
+        a.last_success = 5.0
+        b = self._add("b", 0.8)
+
+        self.store.remove(b)
+        self.store.remove(a)
+        fresh = self.store.add("c", AgentStatus.HEALTHY)
+
+        self.assertEqual(fresh.slot, 0)
+        self.assertEqual(fresh.success_rate, 1.0)
+        self.assertEqual((fresh.total_requests, fresh.error_rate, fresh.avg_response_time), (0, 0.0, 0.0))
+        self.assertIsNone(fresh.last_success)
+
+    def test_grown_slots_have_never_succeeded(self):
+        for i in range(3):
+            self._add(f"agent{i}", 1.0)
+
+        self.assertTrue(np.isnan(self.store.last_success[self.store.size:]).all())
+
+    def test_last_success_round_trips_none(self):
+        view = self._add("a", 1.0)
+        self.assertIsNone(view.last_success)
+        view.last_success = 12.5
+        self.assertEqual(view.last_success, 12.5)
+        view.last_success = None
+        self.assertIsNone(view.last_success)
+
+
+class TestAgentPool(unittest.IsolatedAsyncioTestCase):
+    async def test_retired_instance_is_reissued_under_a_new_wrapper(self):
+        generator = AgentGenerator()
+        old = await generator.generate_agent("linkedin")
+        instance = old.instance
+        instance.metrics.total_requests = 7
+
+        await generator._replace_failing_agent(old.agent_id)
+        new = await generator.generate_agent("linkedin")
+
+        # The stale wrapper is detached rather than silently repointed
+        self.assertIsNone(old.instance)
+        self.assertEqual(old.performance.slot, -1)
+        self.assertNotIn(old.agent_id, generator.active_agents)
+
+        self.assertIsNot(new, old)
+        self.assertIsNot(new.performance, old.performance)
+        self.assertIs(new.instance, instance)
+        self.assertEqual(new.instance.metrics.total_requests, 0)
+
+
+class TestGeneratedAgentRateLimit(unittest.IsolatedAsyncioTestCase):
+    async def test_generated_agent_can_shape_requests(self):
+        generator = AgentGenerator()
+        agent = (await generator.generate_agent("twitter", {})).instance
+
+        self.assertEqual(agent.rate_limit, type(agent).base_rate_limit)
+        await agent._acquire_slot()
+        with unittest.mock.patch.object(agent, "_send", return_value=(200, {}, "ok")):
+            self.assertEqual(await agent._make_request("GET", "https://example.com"), (True, "ok"))
+
+    async def test_tuning_updates_the_live_instance(self):
+        generator = AgentGenerator()
+        generated = await generator.generate_agent("twitter", {})
+        base = type(generated.instance).base_rate_limit
+
+        def strategy(level):
+            return ResourceStrategy(level, 1, 10, "minimal", "basic", "minimal")
+
+        await generator.optimize_agents_for_resources(strategy(ResourceLevel.CRITICAL))
+        self.assertEqual(generated.instance.rate_limit, max(1, base // 2))
+        self.assertAlmostEqual(generated.instance._emission_interval, 1 / max(1, base // 2))
+
+        await generator.optimize_agents_for_resources(strategy(ResourceLevel.HIGH))
+        self.assertEqual(generated.instance.rate_limit, base)
+
+
+class TestHealthMonitor(unittest.TestCase):
+    def test_request_health_survives_a_closed_event_loop(self):
+        generator = AgentGenerator()
+
+        async def check():
+            report = await asyncio.wait_for(generator.request_health(), timeout=5)
+            self.assertEqual(report["total_agents"], 0)
+
+        # The first loop closes with the monitor task still pending on it
+        asyncio.run(check())
+        asyncio.run(check())
+
+        async def stop():
+            await generator.stop_monitoring()
+
+        asyncio.run(stop())
+        self.assertIsNone(generator._monitor_task)
+
+    def test_concurrent_requests_share_one_pass(self):
+        generator = AgentGenerator()
+        passes = []
+        compute = generator._compute_health
+
+        async def counted():
+            passes.append(1)
+            return await compute()
+
+        generator._compute_health = counted
+
+        async def run():
+            reports = await asyncio.gather(*(generator.request_health() for _ in range(5)))
+            await generator.stop_monitoring()
+            return reports
+
+        reports = asyncio.run(run())
+        self.assertEqual(len(passes), 1)
+        self.assertTrue(all(report is reports[0] for report in reports))
+
+
+if __name__ == "__main__":
+    unittest.main()
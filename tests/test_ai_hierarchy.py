@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import unittest
+from collections import defaultdict
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.ai_hierarchy import AIHierarchyManager, _decision_key
+
+
+class TestDecisionAggregation(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Aggregation only needs the agent weights, not the bunker or models
+        self.manager = AIHierarchyManager.__new__(AIHierarchyManager)
+        self.manager._agent_weight = defaultdict(lambda: 0.5, {"a": 0.9, "b": 0.6, "c": 0.4})
+
+    async def test_consensus_groups_equal_decisions_regardless_of_key_order(self):
+        decision = await self.manager._aggregate_decisions({
+            "a": {"verdict": "real", "score": 1},
+            "b": {"score": 1, "verdict": "real"},
+            "c": {"verdict": "fake", "score": 0},
+        })
+
+        self.assertEqual(decision.primary_decision, {"verdict": "real", "score": 1})
+        self.assertAlmostEqual(decision.confidence, 1.5 / 1.9)
+        self.assertEqual([d["agent_id"] for d in decision.supporting_evidence], ["a", "b"])
+        self.assertEqual([d["agent_id"] for d in decision.dissenting_opinions], ["c"])
+
+    async def test_returned_entries_carry_no_internal_keys(self):
+        decision = await self.manager._aggregate_decisions({"a": "yes", "c": "no"})
+
+        entries = decision.supporting_evidence + decision.dissenting_opinions
+        entries += decision.decision_tree["consensus_group"]
+        for group in decision.decision_tree["all_groups"].values():
+            entries += group
+        for entry in entries:
+            self.assertEqual(set(entry), {"decision", "weight", "agent_id"})
+
+    async def test_consensus_uses_precomputed_keys(self):
+        weighted = [{"decision": d, "weight": 1.0, "agent_id": i} for i, d in enumerate("xyx")]
+        keys = [_decision_key(wd["decision"]) for wd in weighted]
+
+        with patch("core.ai_hierarchy._decision_key") as key:
+            consensus = await self.manager._find_consensus_decision(weighted, keys)
+
+        key.assert_not_called()
+        self.assertEqual(consensus["decision"], "x")
+        self.assertEqual(len(consensus["supporting_evidence"]), 2)
+
+
+class TestAnalysisFeatures(unittest.TestCase):
+    def setUp(self):
+        self.manager = AIHierarchyManager.__new__(AIHierarchyManager)
+
+    def test_timeliness_accepts_datetime_and_epoch_timestamps(self):
+        twelve_hours_ago = datetime.now() - timedelta(hours=12)
+        features = self.manager._analyses_to_features([
+            {"timestamp": twelve_hours_ago},
+            {"timestamp": twelve_hours_ago.timestamp()},
+            {"timestamp": time.time()},
+            {},
+        ])
+
+        self.assertAlmostEqual(features[0, 3], 0.5, places=2)
+        self.assertAlmostEqual(features[1, 3], 0.5, places=2)
+        self.assertAlmostEqual(features[2, 3], 1.0, places=2)
+        self.assertEqual(features[3, 3], 0.5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analysis_bunker import SIMILARITY_FEATURES, AnalysisBunker, _decode_sparse
+
+
+class BunkerTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.bunker_path = os.path.join(self._tmp.name, "bunker.db")
+        self.bunker = AnalysisBunker(self.bunker_path)
+
+    def tearDown(self):
+        self.bunker._conn.close()
+        self._tmp.cleanup()
+
+
+class TestBehavioralPatterns(BunkerTestCase):
+    async def test_detects_location_night_and_content_patterns(self):
+        analysis = {
+            "target": "alice",
+            "timestamp": 1700000000,
+            "collection_results": {
+                "linkedin": {"location": "Berlin"},
+                "github": {"location": "berlin "},
+                "twitter": {"profiles": [{"location": "Lagos"}, {"locations": ["Lima"]}]},
+            },
+            "behavioral_analysis": {"activity_hours": [1, 2, 3, 23, 14]},
+            "content_analysis": {"languages": ["en", "de"], "link_ratio": 0.8},
+        }
+
+        patterns = await self.bunker._detect_behavioral_patterns(analysis)
+
+        self.assertEqual(self.bunker._extract_locations(analysis), {"berlin", "lagos", "lima"})
+        self.assertEqual(patterns, [
+            "MULTI_GEOGRAPHIC_PRESENCE",
+            "NOCTURNAL_ACTIVITY",
+            "MULTILINGUAL_CONTENT",
+            "LINK_HEAVY_CONTENT",
+        ])
+
+    async def test_repeat_sightings_bump_occurrence_count(self):
+        analysis = {"target": "bob", "timestamp": 100, "behavioral_analysis": {"activity_hours": {2: 5, 12: 1}}}
+        await self.bunker._detect_behavioral_patterns(analysis)
+        await self.bunker._detect_behavioral_patterns(dict(analysis, timestamp=200))
+
+        rows = self.bunker._conn.execute(
+            "SELECT pattern_type, first_detected, last_seen, occurrence_count FROM behavioral_patterns"
+        ).fetchall()
+        self.assertEqual(rows, [("NOCTURNAL_ACTIVITY", 100, 200, 2)])
+
+
+class TestSparseVectors(BunkerTestCase):
+    def test_feature_rows_are_stored_sparse_and_unit_length(self):
+        blob = self.bunker._vectorize('{"target": "alice", "bio": "security researcher"}')
+        indices, data = _decode_sparse(blob)
+
+        self.assertLess(len(blob), SIMILARITY_FEATURES * 4 // 10)
+        self.assertTrue(np.all(indices < SIMILARITY_FEATURES))
+        self.assertAlmostEqual(float(np.dot(data, data)), 1.0, places=5)
+
+    async def test_similarities_score_only_matching_rows(self):
+        self.bunker._insert_analyses([
+            ("a", {"target": "alice", "bio": "osint analyst in berlin"}),
+            ("b", {"target": "alice", "bio": "osint analyst in berlin"}),
+            ("c", {"target": "zed", "hobby": "kayaking rivers"}),
+        ])
+
+        similarities = await self.bunker._calculate_similarities("a", {})
+
+        self.assertEqual([s["target_id"] for s in similarities], ["b"])
+        self.assertAlmostEqual(similarities[0]["score"], 1.0, places=5)
+
+    def test_legacy_dense_rows_are_reencoded(self):
+        self.bunker._conn.close()
+        dense = np.zeros(SIMILARITY_FEATURES, dtype=np.float32)
+        dense[[3, 70]] = 0.6, 0.8
+        conn = sqlite3.connect(self.bunker_path)
+        conn.execute("PRAGMA user_version = 0")
+        conn.execute(
+            "INSERT INTO analyses (analysis_id, target, analysis_data, timestamp, tfidf_vector) "
+            "VALUES ('old', 't', '{}', 0, ?)", (dense.tobytes(),)
+        )
+        conn.commit()
+        conn.close()
+
+        self.bunker = AnalysisBunker(self.bunker_path)
+        indices, data = _decode_sparse(self.bunker._get_vector("old"))
+        self.assertEqual(indices.tolist(), [3, 70])
+        np.testing.assert_allclose(data, [0.6, 0.8])
+
+
+class TestWriteBehind(BunkerTestCase):
+    async def test_close_persists_queued_analyses(self):
+        for i in range(3):
+            await self.bunker.store_analysis(f"id{i}", {"target": "alice", "timestamp": 100 + i})
+        await self.bunker.close()
+
+        self.assertIsNone(self.bunker._flusher_task)
+        reopened = AnalysisBunker(self.bunker_path)
+        try:
+            rows = reopened._conn.execute(
+                "SELECT analysis_id, target, timestamp FROM analyses ORDER BY analysis_id"
+            ).fetchall()
+        finally:
+            await reopened.close()
+        self.assertEqual(rows, [("id0", "alice", 100), ("id1", "alice", 101), ("id2", "alice", 102)])
+
+    async def test_close_without_stores(self):
+        await self.bunker.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.bunker._conn.execute("SELECT 1")
+
+
+if __name__ == "__main__":
+    unittest.main()
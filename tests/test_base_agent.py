@@ -0,0 +1,158 @@
+import asyncio
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+import aiohttp
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.base_agent import BaseAgent
+from core.schemas import PlatformType
+
+
+class ScriptedAgent(BaseAgent):
+    """Agent whose responses come from a script instead of the network"""
+
+    def __init__(self, responses):
+        super().__init__(PlatformType.GITHUB)
+        self.session = object()
+        self.responses = list(responses)
+        self.sent = []
+        self.searches = 0
+
+    async def _send(self, session, method, url, request_kwargs):
+        self.sent.append(method)
+        response = self.responses.pop(0)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    async def search_by_email(self, email, context=None):
+        self.searches += 1
+        await asyncio.sleep(0)
+        if email.startswith("broken"):
+            raise ConnectionError("lookup failed")
+        return [email]
+
+    async def search_by_phone(self, phone, context=None):
+        return []
+
+
+async def _no_sleep(delay):
+    pass
+
+
+@patch("core.base_agent.asyncio.sleep", side_effect=_no_sleep)
+class TestMakeRequest(unittest.IsolatedAsyncioTestCase):
+    async def test_idempotent_request_gets_max_retries_resends(self, sleep):
+        agent = ScriptedAgent([(503, {}, "busy")] * 3 + [(200, {}, "ok")])
+
+        self.assertEqual(await agent._make_request("GET", "https://example.com"), (True, "ok"))
+        self.assertEqual(len(agent.sent), agent.max_retries + 1)
+        self.assertEqual(agent.metrics.successful_requests, 1)
+
+    async def test_connection_errors_are_retried_until_exhausted(self, sleep):
+        agent = ScriptedAgent([aiohttp.ClientConnectionError("reset")] * 4)
+
+        success, body = await agent._make_request("GET", "https://example.com")
+
+        self.assertFalse(success)
+        self.assertEqual(body, "reset")
+        self.assertEqual(len(agent.sent), 4)
+        self.assertEqual(agent.metrics.failed_requests, 1)
+
+    async def test_non_idempotent_request_is_sent_once(self, sleep):
+        agent = ScriptedAgent([(503, {}, "busy"), (200, {}, "ok")])
+
+        self.assertEqual(await agent._make_request("POST", "https://example.com"), (False, "busy"))
+        self.assertEqual(len(agent.sent), 1)
+
+    async def test_429_blocks_requests_until_reset(self, sleep):
+        reset = str(time.time() + 120)
+        agent = ScriptedAgent([(429, {"X-RateLimit-Reset": reset}, "slow down")])
+
+        self.assertEqual(await agent._make_request("GET", "https://example.com"), (False, "slow down"))
+        self.assertAlmostEqual(agent.rate_limit_reset - time.monotonic(), 120, delta=2)
+        self.assertEqual(await agent._make_request("GET", "https://example.com"), (False, "rate limited"))
+        self.assertEqual(len(agent.sent), 1)
+
+    async def test_429_without_reset_header_uses_default_backoff(self, sleep):
+        agent = ScriptedAgent([(429, {"X-RateLimit-Reset": "soon"}, "")])
+
+        await agent._make_request("GET", "https://example.com")
+
+        self.assertGreater(agent.rate_limit_reset - time.monotonic(), 3000)
+
+
+class TestGcraShaping(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_passes_then_requests_are_spaced(self):
+        agent = ScriptedAgent([])
+        agent.rate_limit = 10
+        waits = []
+
+        async def record(delay):
+            waits.append(delay)
+
+        with patch("core.base_agent.time.monotonic", return_value=100.0), \
+                patch("core.base_agent.asyncio.sleep", side_effect=record):
+            for _ in range(agent.burst + 3):
+                await agent._acquire_slot()
+
+        # The first burst + 1 requests conform; each later one waits one more interval
+        self.assertEqual(len(waits), 2)
+        self.assertAlmostEqual(waits[0], 0.1)
+        self.assertAlmostEqual(waits[1], 0.2)
+
+    async def test_idle_time_restores_the_burst(self):
+        agent = ScriptedAgent([])
+        agent.rate_limit = 10
+        waits = []
+
+        async def record(delay):
+            waits.append(delay)
+
+        with patch("core.base_agent.asyncio.sleep", side_effect=record):
+            with patch("core.base_agent.time.monotonic", return_value=100.0):
+                for _ in range(agent.burst + 1):
+                    await agent._acquire_slot()
+            with patch("core.base_agent.time.monotonic", return_value=101.0):
+                for _ in range(agent.burst + 1):
+                    await agent._acquire_slot()
+
+        self.assertEqual(waits, [])
+
+
+class TestSearchSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_identical_lookups_share_one_search(self):
+        agent = ScriptedAgent([])
+
+        results = await asyncio.gather(*(agent.search_with_context("a@example.com") for _ in range(4)))
+
+        self.assertEqual(agent.searches, 1)
+        self.assertEqual(results, [["a@example.com"]] * 4)
+        # Each caller gets its own list
+        results[0].append("mutated")
+        self.assertEqual(results[1], ["a@example.com"])
+        self.assertEqual(agent._inflight, {})
+
+    async def test_failure_reaches_every_waiter_and_is_not_kept(self):
+        agent = ScriptedAgent([])
+
+        results = await asyncio.gather(
+            *(agent.search_with_context("broken@example.com") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(agent.searches, 1)
+        self.assertTrue(all(isinstance(result, ConnectionError) for result in results))
+        with self.assertRaises(ConnectionError):
+            await agent.search_with_context("broken@example.com")
+        self.assertEqual(agent.searches, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import sys
+import unittest
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.caching import RedisCache, cache_result
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio client calls RedisCache makes"""
+
+    def __init__(self):
+        self.data = {}
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        return self.data.get(key)
+
+    async def setex(self, key, expire, value):
+        self.data[key] = value
+        return True
+
+    async def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+class TestCacheResult(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache = RedisCache()
+        self.cache.redis = FakeRedis()
+        self.calls = 0
+
+        @cache_result(key_prefix="test", cache=self.cache)
+        async def lookup(name):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return {"name": name, "tags": []}
+
+        self.lookup = lookup
+
+    async def test_concurrent_misses_share_one_call(self):
+        results = await asyncio.gather(*(self.lookup("alice") for _ in range(5)))
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.cache.redis.gets, 1)
+        self.assertTrue(all(result == {"name": "alice", "tags": []} for result in results))
+
+    async def test_callers_get_independent_copies(self):
+        results = await asyncio.gather(*(self.lookup("alice") for _ in range(3)))
+        results[0]["tags"].append("mutated")
+        hit = await self.lookup("alice")
+        hit["tags"].append("mutated again")
+
+        self.assertEqual(results[1]["tags"], [])
+        self.assertEqual(await self.lookup("alice"), {"name": "alice", "tags": []})
+        self.assertEqual(self.calls, 1)
+
+    async def test_failure_reaches_every_waiter_and_is_not_cached(self):
+        @cache_result(key_prefix="test", cache=self.cache)
+        async def broken():
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(broken() for _ in range(3)), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        with self.assertRaises(ValueError):
+            await broken()
+        self.assertEqual(self.calls, 2)
+
+    async def test_delete_evicts_the_local_tier(self):
+        await self.lookup("alice")
+        self.assertTrue(await self.lookup.invalidate("alice"))
+
+        await self.lookup("alice")
+        self.assertEqual(self.calls, 2)
+
+    async def test_uncacheable_results_are_not_shared(self):
+        @cache_result(key_prefix="test", cache=self.cache)
+        async def make():
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return object()
+
+        results = await asyncio.gather(make(), make())
+
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(self.cache.redis.data, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
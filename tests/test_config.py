@@ -0,0 +1,100 @@
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.config
+from core.config import Settings
+
+
+class ConfigTestCase(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.config_path = os.path.join(self._tmp.name, "config.yaml")
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def write_config(self, text):
+        with open(self.config_path, "w") as f:
+            f.write(text)
+
+
+class TestSettingsSections(ConfigTestCase):
+    @patch.dict(os.environ, {"SECURITY__MAX_LOGIN_ATTEMPTS": "5"})
+    def test_nested_env_overrides_reach_sections(self):
+        self.assertEqual(Settings().security.MAX_LOGIN_ATTEMPTS, 5)
+
+    @patch.dict(os.environ, {"SECURITY__MAX_LOGIN_ATTEMPTS": "5"})
+    def test_yaml_sections_merge_with_env_overrides(self):
+        self.write_config("security:\n  RATE_LIMIT_PER_MINUTE: 42\n")
+
+        settings = Settings.load_from_yaml(self.config_path)
+
+        self.assertEqual(settings.security.RATE_LIMIT_PER_MINUTE, 42)
+        self.assertEqual(settings.security.MAX_LOGIN_ATTEMPTS, 5)
+
+    def test_invalid_section_value_fails_at_load(self):
+        self.write_config("database:\n  DATABASE_URL: mysql://localhost/db\n")
+
+        with self.assertRaises(ValidationError):
+            Settings.load_from_yaml(self.config_path)
+
+
+class TestConfigCache(ConfigTestCase):
+    def setUp(self):
+        super().setUp()
+        self.write_config("APP_NAME: Cached\nsecurity:\n  RATE_LIMIT_PER_MINUTE: 42\n")
+        self.cache_path = self.config_path + ".cache"
+
+    def test_second_load_skips_yaml_parse(self):
+        Settings.load_from_yaml(self.config_path)
+        with patch.object(core.config.yaml, "load") as yaml_load:
+            settings = Settings.load_from_yaml(self.config_path)
+
+        yaml_load.assert_not_called()
+        self.assertEqual(settings.APP_NAME, "Cached")
+        self.assertEqual(settings.security.RATE_LIMIT_PER_MINUTE, 42)
+
+    def test_environment_is_reread_on_cached_load(self):
+        Settings.load_from_yaml(self.config_path)
+        with patch.dict(os.environ, {"DEBUG": "true", "SECURITY__MAX_LOGIN_ATTEMPTS": "7"}):
+            settings = Settings.load_from_yaml(self.config_path)
+
+        self.assertTrue(settings.DEBUG)
+        self.assertEqual(settings.security.MAX_LOGIN_ATTEMPTS, 7)
+
+    def test_cache_is_plain_json_readable_only_by_owner(self):
+        Settings.load_from_yaml(self.config_path)
+
+        with open(self.cache_path, "rb") as f:
+            self.assertTrue(f.read().startswith(b"{"))
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_path).st_mode), 0o600)
+
+    def test_edited_yaml_invalidates_cache(self):
+        Settings.load_from_yaml(self.config_path)
+        self.write_config("APP_NAME: Edited\n")
+        later = os.stat(self.cache_path).st_mtime_ns + 1_000_000
+        os.utime(self.config_path, ns=(later, later))
+
+        self.assertEqual(Settings.load_from_yaml(self.config_path).APP_NAME, "Edited")
+
+    def test_unreadable_cache_falls_back_to_yaml(self):
+        with open(self.cache_path, "wb") as f:
+            f.write(b"\x80\x05not json")
+
+        self.assertEqual(Settings.load_from_yaml(self.config_path).APP_NAME, "Cached")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import sys
+import unittest
+from datetime import datetime
+from enum import Enum
+from types import SimpleNamespace
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.deception_detector import DeceptionDetector, DeceptionIndicator, DeceptionType
+from core.schemas import DigitalFootprint
+
+
+class Category(Enum):
+    PROFESSIONAL = "professional"
+    SOCIAL_MEDIA = "social_media"
+
+
+def _profile(username, full_name, bio, location, category=Category.SOCIAL_MEDIA):
+    # Same attributes the detector reads from social_agent.ProfileData
+    return SimpleNamespace(
+        username=username, full_name=full_name, bio=bio, location=location,
+        platform_category=category, email=None, company=None, job_title=None,
+        profile_picture=None,
+    )
+
+
+def _footprint(system_timezone=None, ip_timezone=None):
+    return DigitalFootprint(
+        browser_fingerprint={},
+        system_profile={"timezone": system_timezone} if system_timezone else {},
+        network_characteristics={"ip_geolocation": {"timezone": ip_timezone}},
+        hardware_profile={},
+        behavioral_patterns={},
+        confidence_score=0.5,
+        risk_assessment={},
+        unique_identifiers=[],
+    )
+
+
+class TestDeceptionDetector(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.detector = DeceptionDetector()
+
+    async def test_analyze_digital_identity_end_to_end(self):
+        profiles = [
+            _profile("devteam", "Ann Archer", "Principal engineer. Building payment systems.", "New York"),
+            _profile("info.acme", "Ann Archer", "lol gonna post cool stuff here!!! hey u", "Lagos"),
+            _profile("acme12345", "A. Archer", "Official account of the Acme office.", "Lima",
+                     Category.PROFESSIONAL),
+        ]
+        behavioral = {"platform_usage_patterns": {
+            "a": datetime(2024, 1, 1, 2), "b": datetime(2024, 1, 1, 14), "c": datetime(2024, 1, 1, 3),
+        }}
+
+        analysis = await self.detector.analyze_digital_identity(
+            profiles, _footprint("America/New_York", "Asia/Tokyo"), behavioral
+        )
+
+        types = {indicator.type for indicator in analysis.deception_indicators}
+        self.assertIn(DeceptionType.SHARED_ACCOUNT, types)
+        self.assertEqual(analysis.anomaly_count, len(analysis.deception_indicators))
+        self.assertGreater(analysis.overall_risk_score, 0.0)
+        self.assertLessEqual(analysis.overall_risk_score, 1.0)
+        self.assertIn(analysis.confidence_level, ("LOW", "MEDIUM", "HIGH"))
+        self.assertTrue(analysis.recommended_actions)
+
+    async def test_clean_identity_has_no_risk(self):
+        analysis = await self.detector.analyze_digital_identity(
+            [_profile("ann", "Ann Archer", "Engineer.", "Berlin")], _footprint(), {}
+        )
+
+        self.assertEqual(analysis.overall_risk_score, 0.0)
+        self.assertEqual(analysis.anomaly_count, 0)
+        self.assertEqual(analysis.confidence_level, "LOW")
+        self.assertEqual(len(analysis.recommended_actions), 1)
+
+
+class TestScoringHelpers(unittest.TestCase):
+    def setUp(self):
+        self.detector = DeceptionDetector()
+
+    def _indicator(self, kind, confidence, impact=1.0):
+        return DeceptionIndicator(
+            type=kind, confidence=confidence, evidence=[],
+            severity=self.detector._calculate_severity(confidence), impact_score=impact,
+        )
+
+    def test_overall_risk_combines_independent_indicators(self):
+        indicators = [
+            self._indicator(DeceptionType.SHARED_ACCOUNT, 0.5),
+            self._indicator(DeceptionType.PROFILE_SPOOFING, 0.5),
+        ]
+        self.assertAlmostEqual(self.detector._calculate_overall_risk(indicators), 0.75)
+        self.assertEqual(self.detector._calculate_overall_risk([]), 0.0)
+
+    def test_recommendations_dedupe_types_and_escalate_critical(self):
+        indicators = [
+            self._indicator(DeceptionType.SHARED_ACCOUNT, 0.6),
+            self._indicator(DeceptionType.SHARED_ACCOUNT, 0.7),
+            self._indicator(DeceptionType.TIMEZONE_MANIPULATION, 0.95),
+        ]
+        recommendations = self.detector._generate_recommendations(indicators)
+
+        self.assertEqual(len(recommendations), 3)
+        self.assertIn("manual review", recommendations[0])
+        self.assertIn("timezone", recommendations[1])
+
+    def test_formality_separates_casual_from_formal_bios(self):
+        formal = self.detector._calculate_formality_score("Principal engineer. Building payment systems.")
+        casual = self.detector._calculate_formality_score("lol gonna post cool stuff!!! hey u")
+
+        self.assertGreater(formal, 0.9)
+        self.assertLess(casual, 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
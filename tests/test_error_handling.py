@@ -0,0 +1,109 @@
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.error_handling import retry_async, retry_call
+
+
+class Flaky:
+    """Callable that raises ``error`` for the first ``failures`` calls"""
+
+    def __init__(self, failures, error=ConnectionError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("transient")
+        return "ok"
+
+
+@patch("core.error_handling.time.sleep")
+class TestRetryCall(unittest.TestCase):
+    def test_recovers_after_transient_errors(self, sleep):
+        fn = Flaky(2)
+        self.assertEqual(retry_call(fn, max_retries=3), "ok")
+        self.assertEqual(fn.calls, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_reraises_once_retries_exhausted(self, sleep):
+        fn = Flaky(10)
+        with self.assertRaises(ConnectionError):
+            retry_call(fn, max_retries=2)
+        self.assertEqual(fn.calls, 3)
+
+    def test_non_retriable_error_is_not_retried(self, sleep):
+        fn = Flaky(1, error=ValueError)
+        with self.assertRaises(ValueError):
+            retry_call(fn)
+        self.assertEqual(fn.calls, 1)
+        sleep.assert_not_called()
+
+    def test_backoff_never_exceeds_cap(self, sleep):
+        with self.assertRaises(ConnectionError):
+            retry_call(Flaky(10), max_retries=6, base=1.0, cap=2.5)
+        self.assertTrue(all(call.args[0] <= 2.5 for call in sleep.call_args_list))
+
+
+class TestRetryAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_recovers_after_transient_errors(self):
+        fn = Flaky(2, error=TimeoutError)
+
+        async def call():
+            return fn()
+
+        with patch("core.error_handling.asyncio.sleep") as sleep:
+            sleep.side_effect = lambda delay: asyncio.sleep(0)
+            self.assertEqual(await retry_async(call, max_retries=3), "ok")
+        self.assertEqual(fn.calls, 3)
+
+
+class TestLoginRetry(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+        from core.security import Authentication
+
+        self.auth = Authentication()
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _attempt_count(self):
+        conn = sqlite3.connect(self.auth.users_db)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM login_attempts").fetchone()[0]
+        finally:
+            conn.close()
+
+    @patch("core.error_handling.time.sleep")
+    def test_locked_read_is_retried_and_attempt_logged_once(self, sleep):
+        fetch = self.auth._fetch_credentials
+        failures = iter([True, True])
+
+        def flaky_fetch(username):
+            if next(failures, False):
+                raise sqlite3.OperationalError("database is locked")
+            return fetch(username)
+
+        with patch.object(self.auth, "_fetch_credentials", side_effect=flaky_fetch) as mock_fetch:
+            self.assertIsNone(self.auth.authenticate("nobody", "wrong-password"))
+
+        self.assertEqual(mock_fetch.call_count, 3)
+        self.assertEqual(self._attempt_count(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import asyncio
+import os
+import sys
+import unittest
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import http_client
+from core.http_client import close_session, closing_session, get_session
+
+
+class TestSharedSession(unittest.TestCase):
+    def test_each_event_loop_gets_its_own_session(self):
+        async def open_session():
+            session = await get_session()
+            self.assertIs(await get_session(), session)
+            return session
+
+        first = asyncio.run(closing_session(open_session()))
+        second = asyncio.run(closing_session(open_session()))
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed and second.closed)
+        registered = list(http_client._sessions.values())
+        self.assertNotIn(first, registered)
+        self.assertNotIn(second, registered)
+
+    def test_session_left_open_by_a_finished_loop_is_not_reused(self):
+        stale = asyncio.run(get_session())
+
+        async def reopen():
+            try:
+                return await get_session()
+            finally:
+                await close_session()
+
+        self.assertIsNot(asyncio.run(reopen()), stale)
+
+    def test_close_session_without_session_is_harmless(self):
+        asyncio.run(close_session())
+
+
+if __name__ == "__main__":
+    unittest.main()
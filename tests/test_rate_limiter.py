@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import SecurityConfig
+from core.rate_limiter import EnterpriseRateLimiter
+
+
+class TestEnterpriseRateLimiter(unittest.TestCase):
+    def setUp(self):
+        # Same shape as the CLI: 6 x 10s buckets, limit from SecurityConfig
+        self.limiter = EnterpriseRateLimiter(buckets=6, bucket_seconds=10)
+        self.limit = SecurityConfig().RATE_LIMIT_PER_MINUTE
+
+    def test_limit_plus_one_is_rejected(self):
+        results = [self.limiter.allow("user", self.limit, now=100.0) for _ in range(self.limit + 1)]
+        self.assertEqual(results, [True] * self.limit + [False])
+
+    def test_requests_age_out_bucket_by_bucket(self):
+        # Half the limit in the first bucket, the rest one bucket later
+        half = self.limit // 2
+        for _ in range(half):
+            self.assertTrue(self.limiter.allow("user", self.limit, now=100.0))
+        for _ in range(self.limit - half):
+            self.assertTrue(self.limiter.allow("user", self.limit, now=110.0))
+        self.assertFalse(self.limiter.allow("user", self.limit, now=159.0))
+
+        # At 160s the first bucket leaves the minute window and frees its slots
+        for _ in range(half):
+            self.assertTrue(self.limiter.allow("user", self.limit, now=160.0))
+        self.assertFalse(self.limiter.allow("user", self.limit, now=160.0))
+
+    def test_window_resets_after_idle_minute(self):
+        for _ in range(self.limit):
+            self.limiter.allow("user", self.limit, now=100.0)
+        self.assertFalse(self.limiter.allow("user", self.limit, now=100.0))
+        self.assertTrue(self.limiter.allow("user", self.limit, now=161.0))
+
+    def test_keys_are_independent(self):
+        for _ in range(self.limit):
+            self.limiter.allow("a", self.limit, now=100.0)
+        self.assertFalse(self.limiter.allow("a", self.limit, now=100.0))
+        self.assertTrue(self.limiter.allow("b", self.limit, now=100.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock, patch
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.validation import EmailValidator
+
+
+def _result(email, smtp_step=None):
+    return {
+        "email": email,
+        "is_valid": True,
+        "validation_steps": {
+            "syntax": {"is_valid": True, "warnings": []},
+            "smtp": smtp_step or {"is_reachable": True, "details": {}},
+        },
+        "risk_score": 0.1,
+        "recommendation": "accept",
+    }
+
+
+class TestValidationCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.validator = EmailValidator()
+
+    async def test_cached_result_is_isolated_from_callers(self):
+        uncached = AsyncMock(return_value=_result("a@example.com"))
+        with patch.object(self.validator, "_validate_uncached", uncached):
+            first = await self.validator.validate_email_comprehensive("a@example.com")
+            first["validation_steps"]["syntax"]["warnings"].append("mutated")
+            second = await self.validator.validate_email_comprehensive(" A@example.com ")
+
+        self.assertEqual(uncached.await_count, 1)
+        self.assertEqual(second["validation_steps"]["syntax"]["warnings"], [])
+
+    async def test_step_errors_are_not_cached(self):
+        errored = _result(
+            "b@example.com",
+            smtp_step={"is_reachable": False, "errored": True, "details": {"error": "timeout"}},
+        )
+        uncached = AsyncMock(return_value=errored)
+        with patch.object(self.validator, "_validate_uncached", uncached):
+            await self.validator.validate_email_comprehensive("b@example.com")
+            await self.validator.validate_email_comprehensive("b@example.com")
+
+        self.assertEqual(uncached.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()